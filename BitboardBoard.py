@@ -0,0 +1,375 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A bitboard board core for the Falcon-Hunter variant of chess.  BitboardBoard stores the pieces as one
+#               64-bit integer for each piece code (bit (row - 1) * 8 + (column - 1) set for each square holding such a
+#               piece) plus one for each color's occupied squares, and answers the rules questions ChessVar asks of its
+#               board: where a piece may move, every legal move or capture for a player, and which pieces attack a
+#               square.  Knight, King and Pawn moves come from precomputed masks, and sliding pieces from directional
+#               half-ray masks, so the asymmetric Falcon (forward diagonals, backward file) and Hunter (forward file,
+#               backward diagonals) need no special cases.  A ChessVar created with backend='bitboard' keeps a
+#               BitboardBoard in step with its board and uses it for all of these questions (see ChessVar.__init__).
+#               Running this file plays random games on both backends side by side and reports any disagreement.
+
+import argparse
+import random
+import sys
+import time
+
+from ChessVar import (BLACK, COLOR_NAMES, EAST, EMPTY_CODE, KING, KING_TARGETS, KNIGHT, KNIGHT_TARGETS, MOVE_PAIRS,
+                      NORTH, NORTH_EAST, NORTH_WEST, OPPOSITE_DIRECTIONS, PAWN, PAWN_ATTACKERS, PAWN_MOVES, RAYS,
+                      SLIDING_DIRECTIONS, SQUARE_NAMES, WHITE, ChessVar)
+
+
+def _mask(indexes):
+    """Returns a bitboard with the bit for each of the given square indexes set"""
+
+    mask = 0
+    for index in indexes:
+        mask |= 1 << index
+    return mask
+
+
+def _mask_union(masks):
+    """Returns the bitwise OR of the given bitboards"""
+
+    union = 0
+    for mask in masks:
+        union |= mask
+    return union
+
+
+# Bitboard of the squares along each ray, indexed by square index and then direction, nearest square first
+RAY_MASKS = tuple(tuple(_mask(ray) for ray in square_rays) for square_rays in RAYS)
+
+# Directions that move toward higher square indexes.  The first piece along one of these rays is its lowest set bit,
+# and along the other directions it is the highest set bit
+POSITIVE_DIRECTIONS = frozenset((NORTH, EAST, NORTH_EAST, NORTH_WEST))
+
+# Squares a Knight or King reaches from each square index
+KNIGHT_MASKS = tuple(_mask(targets) for targets in KNIGHT_TARGETS)
+KING_MASKS = tuple(_mask(targets) for targets in KING_TARGETS)
+
+# Pawn masks, indexed by color and then square index: the square one row forward, the square two rows forward for a
+# Pawn on its starting row, the squares it may capture on, and the squares a Pawn of that color attacks the square from
+PAWN_FORWARD_MASKS = tuple(tuple(0 if forward is None else 1 << forward for forward, _, _ in moves)
+                           for moves in PAWN_MOVES)
+PAWN_DOUBLE_MASKS = tuple(tuple(0 if double is None else 1 << double for _, double, _ in moves) for moves in PAWN_MOVES)
+PAWN_CAPTURE_MASKS = tuple(tuple(_mask(captures) for _, _, captures in moves) for moves in PAWN_MOVES)
+PAWN_ATTACKER_MASKS = tuple(tuple(_mask(sources) for sources in table) for table in PAWN_ATTACKERS)
+
+# Directional half-ray masks for each sliding piece, indexed by piece code and then square index (None for pieces that
+# do not slide).  Each entry is a tuple of (direction, ray mask) pairs for the directions that piece may travel, so the
+# Falcon and Hunter of each color have their own forward and backward rays.  HALF_RAY_REACH holds all of a piece's
+# rays together: the squares it could reach on an empty board
+HALF_RAYS = tuple(
+    None if directions is None else
+    tuple(tuple((direction, RAY_MASKS[index][direction]) for direction in directions if RAY_MASKS[index][direction])
+          for index in range(64))
+    for directions in SLIDING_DIRECTIONS)
+HALF_RAY_REACH = tuple(
+    None if rays is None else tuple(_mask_union(ray for _, ray in square_rays) for square_rays in rays)
+    for rays in HALF_RAYS)
+
+# Half-ray masks pointing the other way, used to find attackers: a sliding piece attacks a square if the square is on
+# one of its rays, which is when the piece is on the opposite ray from the square
+ATTACKER_HALF_RAYS = tuple(
+    None if directions is None else
+    tuple(tuple((OPPOSITE_DIRECTIONS[direction], RAY_MASKS[index][OPPOSITE_DIRECTIONS[direction]])
+                for direction in directions if RAY_MASKS[index][OPPOSITE_DIRECTIONS[direction]])
+          for index in range(64))
+    for directions in SLIDING_DIRECTIONS)
+
+# Piece codes of each color's sliding pieces
+SLIDING_CODES = tuple(tuple(code for code in range(8 * color, 8 * color + 8) if SLIDING_DIRECTIONS[code] is not None)
+                      for color in (WHITE, BLACK))
+
+
+def sliding_targets(half_rays, occupied):
+    """
+    Takes the (direction, ray mask) pairs for a sliding piece on one square and the bitboard of occupied squares.
+    Returns a bitboard of the squares the piece reaches: every square along each ray up to and including the first
+    occupied square
+    """
+
+    targets = 0
+    for direction, ray in half_rays:
+        blockers = ray & occupied
+        if blockers:
+            if direction in POSITIVE_DIRECTIONS:
+                first_blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                first_blocker = blockers.bit_length() - 1
+            ray ^= RAY_MASKS[first_blocker][direction]
+        targets |= ray
+    return targets
+
+
+class BitboardBoard:
+    """Represents the pieces on a Falcon-Hunter board as bitboards, one for each piece code and one for each color"""
+
+    __slots__ = ('_pieces', '_occupied')
+
+    def __init__(self, codes):
+        """Takes in the piece code on each square in index order (EMPTY_CODE if empty) and builds the bitboards"""
+
+        self._pieces = [0] * 16
+        self._occupied = [0, 0]
+        self.load(codes)
+
+    def load(self, codes):
+        """Replaces every bitboard with those for the given piece codes, one for each square in index order"""
+
+        pieces = [0] * 16
+        for index, code in enumerate(codes):
+            if code != EMPTY_CODE:
+                pieces[code] |= 1 << index
+        self._pieces = pieces
+        self._occupied = [_mask_union(pieces[0:8]), _mask_union(pieces[8:16])]
+
+    def get_pieces(self, code):
+        """Returns the bitboard of the squares holding a piece with the given code"""
+
+        return self._pieces[code]
+
+    def get_occupied(self, color):
+        """Returns the bitboard of the squares holding a piece of the given color code"""
+
+        return self._occupied[color]
+
+    def set_square(self, index, old_code, new_code):
+        """
+        Changes the square with the given index from holding old_code to holding new_code, either of which may be
+        EMPTY_CODE.  old_code must be the code the square holds now
+        """
+
+        bit = 1 << index
+        if old_code != EMPTY_CODE:
+            self._pieces[old_code] ^= bit
+            self._occupied[old_code >> 3] ^= bit
+        if new_code != EMPTY_CODE:
+            self._pieces[new_code] |= bit
+            self._occupied[new_code >> 3] |= bit
+
+    def move_piece(self, start_index, end_index, code, captured_code):
+        """
+        Moves the piece with the given code from the start square to the end square, removing the piece with
+        captured_code (EMPTY_CODE if none) from the end square
+        """
+
+        move_bits = 1 << start_index | 1 << end_index
+        if captured_code != EMPTY_CODE:
+            end_bit = 1 << end_index
+            self._pieces[captured_code] ^= end_bit
+            self._occupied[captured_code >> 3] ^= end_bit
+        self._pieces[code] ^= move_bits
+        self._occupied[code >> 3] ^= move_bits
+
+    def targets(self, color, code, index):
+        """
+        Takes in a color code and the code of that color's piece on the square with the given index.  Returns a
+        bitboard of the squares the piece may legally move to, leaving out squares that hold the player's own pieces
+        """
+
+        own = self._occupied[color]
+        opponent = self._occupied[1 - color]
+        kind = code & 7
+
+        if kind == PAWN:
+            empty = ~(own | opponent)
+            targets = PAWN_FORWARD_MASKS[color][index] & empty
+            if targets:
+                targets |= PAWN_DOUBLE_MASKS[color][index] & empty
+            return targets | (PAWN_CAPTURE_MASKS[color][index] & opponent)
+        if kind == KNIGHT:
+            return KNIGHT_MASKS[index] & ~own
+        if kind == KING:
+            return KING_MASKS[index] & ~own
+        return sliding_targets(HALF_RAYS[code][index], own | opponent) & ~own
+
+    def move_rejection(self, color, code, start_index, end_index):
+        """
+        Takes in a color code, the code of that color's piece on the start square, and an end square that does not
+        hold one of the player's pieces.  Returns None if the piece may move there, 'BLOCKED_PATH' if it could were no
+        piece in its way, or 'ILLEGAL_SHAPE' if the piece never moves that way, the same reasons ChessVar.make_move
+        gives
+        """
+
+        end_bit = 1 << end_index
+        if self.targets(color, code, start_index) & end_bit:
+            return None
+
+        # A Pawn's two-row move and a sliding move are the only ones another piece can block
+        kind = code & 7
+        if kind == PAWN:
+            reach = PAWN_DOUBLE_MASKS[color][start_index] & ~(self._occupied[WHITE] | self._occupied[BLACK])
+        elif kind == KNIGHT or kind == KING:
+            reach = 0
+        else:
+            reach = HALF_RAY_REACH[code][start_index]
+        if reach & end_bit:
+            return 'BLOCKED_PATH'
+        return 'ILLEGAL_SHAPE'
+
+    def generate_moves(self, color):
+        """
+        Returns a list of every legal move for the pieces of the given color code, as (start_location, end_location)
+        tuples ordered by piece code, then start square index, then end square index
+        """
+
+        moves = []
+        append = moves.append
+        pieces = self._pieces
+        for code in range(8 * color, 8 * color + 8):
+            bits = pieces[code]
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                index = bit.bit_length() - 1
+                moves_from = MOVE_PAIRS[index]
+                targets = self.targets(color, code, index)
+                while targets:
+                    target_bit = targets & -targets
+                    targets ^= target_bit
+                    append(moves_from[target_bit.bit_length() - 1])
+
+        return moves
+
+    def generate_captures(self, color):
+        """
+        Returns a list of every legal move for the pieces of the given color code that captures one of the opponent's
+        pieces, in the order generate_moves lists them
+        """
+
+        captures = []
+        append = captures.append
+        pieces = self._pieces
+        opponent = self._occupied[1 - color]
+        for code in range(8 * color, 8 * color + 8):
+            bits = pieces[code]
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                index = bit.bit_length() - 1
+                moves_from = MOVE_PAIRS[index]
+                targets = self.targets(color, code, index) & opponent
+                while targets:
+                    target_bit = targets & -targets
+                    targets ^= target_bit
+                    append(moves_from[target_bit.bit_length() - 1])
+
+        return captures
+
+    def attackers(self, index, color):
+        """
+        Returns a bitboard of the pieces of the given color code that attack the square with the given index, meaning
+        they could capture an opponent's piece standing on it.  The square's own contents do not matter
+        """
+
+        pieces = self._pieces
+        offset = 8 * color
+        attackers = ((PAWN_ATTACKER_MASKS[color][index] & pieces[PAWN + offset]) |
+                     (KNIGHT_MASKS[index] & pieces[KNIGHT + offset]) | (KING_MASKS[index] & pieces[KING + offset]))
+
+        # A sliding piece attacks the square if it is the first piece along one of its rays traced back from the square
+        occupied = self._occupied[WHITE] | self._occupied[BLACK]
+        for code in SLIDING_CODES[color]:
+            if pieces[code]:
+                attackers |= sliding_targets(ATTACKER_HALF_RAYS[code][index], occupied) & pieces[code]
+        return attackers
+
+    def attacker_indexes(self, index, color, stop_at_first):
+        """
+        Returns a list of the indexes of the pieces of the given color code attacking the square with the given index,
+        in index order.  If stop_at_first is True the list holds at most one attacker
+        """
+
+        attackers = self.attackers(index, color)
+        indexes = []
+        while attackers:
+            bit = attackers & -attackers
+            attackers ^= bit
+            indexes.append(bit.bit_length() - 1)
+            if stop_at_first is True:
+                break
+        return indexes
+
+
+def compare_backends(game_count, seed, max_plies=300, probes_per_position=4):
+    """
+    Plays the given number of seeded random games on a ChessVar with each backend side by side, taking turns back now
+    and then.  At every position the two games must list the same legal moves and captures, hold the same position,
+    accept or reject randomly chosen (mostly illegal) turns alike and for the same reason, and agree on which pieces
+    attack a randomly chosen square.  Returns the number of positions compared, and raises AssertionError describing
+    the first disagreement
+    """
+
+    rng = random.Random(seed)
+    positions = 0
+    for game_number in range(game_count):
+        reference = ChessVar()
+        bitboard = ChessVar(backend='bitboard')
+        for _ in range(max_plies):
+            positions += 1
+            where = 'game %d at %s' % (game_number, reference.to_fen())
+            legal_moves = reference.generate_legal_moves()
+            if sorted(legal_moves) != sorted(bitboard.generate_legal_moves()):
+                raise AssertionError('%s: legal moves differ' % where)
+            if sorted(reference.generate_captures()) != sorted(bitboard.generate_captures()):
+                raise AssertionError('%s: captures differ' % where)
+            if (reference.to_codes() != bitboard.to_codes() or reference.position_hash() != bitboard.position_hash() or
+                    reference.get_game_state() != bitboard.get_game_state()):
+                raise AssertionError('%s: positions differ' % where)
+
+            location = rng.choice(SQUARE_NAMES)
+            color = rng.choice(COLOR_NAMES)
+            if (sorted(reference.attackers_of(location, color)) != sorted(bitboard.attackers_of(location, color)) or
+                    reference.is_attacked(location, color) != bitboard.is_attacked(location, color)):
+                raise AssertionError('%s: attackers of %s by %s differ' % (where, location, color))
+
+            # Random proposals are tried on both games, which must accept or reject each one alike
+            for _ in range(probes_per_position):
+                if rng.random() < 0.25:
+                    turn = (rng.choice('FHfh'), rng.choice(SQUARE_NAMES))
+                else:
+                    turn = (rng.choice(SQUARE_NAMES), rng.choice(SQUARE_NAMES))
+                reference_result = reference.push_turn(turn)
+                if (bitboard.push_turn(turn) != reference_result or
+                        bitboard.get_last_rejection() != reference.get_last_rejection()):
+                    raise AssertionError('%s: %s handled differently' % (where, turn))
+                if reference_result is True:
+                    reference.pop_move()
+                    bitboard.pop_move()
+
+            if not legal_moves:
+                break
+
+            # Now and then take back a turn or two instead of playing one
+            if rng.random() < 0.1 and reference.pop_move() is True:
+                bitboard.pop_move()
+                continue
+            turn = rng.choice(legal_moves)
+            if reference.push_turn(turn) is not True or bitboard.push_turn(turn) is not True:
+                raise AssertionError('%s: %s rejected' % (where, turn))
+    return positions
+
+
+def main():
+    """Runs the differential comparison between the two ChessVar backends from the command line"""
+
+    parser = argparse.ArgumentParser(description='Compare the objects and bitboard backends of ChessVar')
+    parser.add_argument('--games', type=int, default=100, help='number of random games to play')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    arguments = parser.parse_args()
+
+    start_time = time.perf_counter()
+    try:
+        positions = compare_backends(arguments.games, arguments.seed)
+    except AssertionError as error:
+        print('MISMATCH:', error)
+        sys.exit(1)
+    print('%d positions agree (%.1f s)' % (positions, time.perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A compact text renderer for watching Falcon-Hunter games in a terminal.  Each frame is the board as
+#               one character per square ('.' for an empty square) with the rows and columns labelled, optionally
+#               followed by a panel showing each player's fairy pieces in reserve, their power pieces lost, and whose
+#               turn it is.  A frame is built as one string and written with a single call.  In diff mode only the
+#               first frame is drawn in full; each later frame is a few ANSI cursor moves that rewrite just the squares
+#               and panel lines that changed, so redrawing after a turn writes tens of bytes instead of the whole board.
+#
+#                   python BoardRenderer.py games.pgn [--delay 0.3] [--no-reserve] [--full]
+
+import argparse
+import sys
+import time
+
+from ChessVar import PIECE_SYMBOLS
+from GameRecord import read_games
+
+# Translation from piece codes to the symbol shown for each square
+RENDER_SYMBOL_TABLE = bytes.maketrans(bytes(range(17)), (PIECE_SYMBOLS + '.').encode())
+
+# Frame text with a '%s' slot for each square from a8 across and down to h1.  Row 8 is on the frame's second line, and
+# each square's symbol is in every other column starting at the third
+_COLUMN_LABELS = '  a b c d e f g h\n'
+FRAME_TEMPLATE = (_COLUMN_LABELS + ''.join('%d %s %d\n' % (row, ' '.join(['%s'] * 8), row) for row in range(8, 0, -1)) +
+                  _COLUMN_LABELS)
+BOARD_LINES = 10
+
+# ANSI escape sequences: clear the screen and home the cursor, move the cursor to a line and column (both counted from
+# 1), and erase the cursor's line
+CLEAR_SCREEN = '\x1b[H\x1b[2J'
+MOVE_CURSOR = '\x1b[%d;%dH'
+ERASE_LINE = '\x1b[2K'
+
+# Text of the game states in the panel
+STATE_TEXT = {'WHITE_WON': 'White won', 'BLACK_WON': 'Black won', 'DRAW': 'Drawn'}
+
+
+class BoardRenderer:
+    """
+    Represents a renderer drawing the frames of one or more games to a terminal.  In diff mode the renderer remembers
+    the last frame it drew, so each frame is drawn as the changes from the one before
+    """
+
+    def __init__(self, show_reserve=True, diff=False):
+        """Sets whether frames include the reserve panel and whether draw writes only the changes between frames"""
+
+        self._show_reserve = show_reserve
+        self._diff = diff
+        self._codes = None
+        self._panel_lines = None
+
+        # Panel lines already built, keyed by the state they show: the side to move and reserve flags from
+        # ChessVar.to_codes, both power pieces taken counts and the game state
+        self._panel_cache = {}
+
+    def get_frame_height(self):
+        """Returns the number of lines in a frame"""
+
+        return BOARD_LINES + (3 if self._show_reserve is True else 0)
+
+    def reset(self):
+        """Forgets the last frame drawn, so the next frame in diff mode clears the screen and is drawn in full"""
+
+        self._codes = None
+        self._panel_lines = None
+
+    def render(self, game):
+        """Returns the full frame for the game's current position as one string"""
+
+        codes = game.to_codes()
+        text = self._board_text(codes[:64])
+        if self._show_reserve is True:
+            text += '\n'.join(self._panel(game, codes)) + '\n'
+        return text
+
+    def render_changes(self, game):
+        """
+        Returns the ANSI text that turns the last frame drawn into the frame for the game's current position, and
+        remembers the new frame.  The first frame (or the first after reset) clears the screen and is drawn in full.
+        Returns an empty string if nothing has changed.  The cursor is left on the line below the frame
+        """
+
+        all_codes = game.to_codes()
+        codes = all_codes[:64]
+        panel_lines = self._panel(game, all_codes) if self._show_reserve is True else []
+
+        if self._codes is None:
+            text = CLEAR_SCREEN + self._board_text(codes) + ''.join(line + '\n' for line in panel_lines)
+        else:
+            parts = []
+
+            # A turn changes only a few squares.  Each nonzero byte of the exclusive-or of the old and new codes marks
+            # one of them, so they are found without looking at every square
+            changed = int.from_bytes(self._codes, 'little') ^ int.from_bytes(codes, 'little')
+            while changed:
+                index = ((changed & -changed).bit_length() - 1) >> 3
+                changed &= ~(0xFF << (index * 8))
+                parts.append(MOVE_CURSOR % (9 - (index >> 3), 3 + 2 * (index & 7)))
+                parts.append(PIECE_SYMBOLS[codes[index]] if codes[index] < 16 else '.')
+            for number, (old_line, line) in enumerate(zip(self._panel_lines, panel_lines)):
+                if old_line != line:
+                    parts.append(MOVE_CURSOR % (BOARD_LINES + 1 + number, 1) + ERASE_LINE + line)
+            if not parts:
+                return ''
+            parts.append(MOVE_CURSOR % (self.get_frame_height() + 1, 1))
+            text = ''.join(parts)
+
+        self._codes = codes
+        self._panel_lines = panel_lines
+        return text
+
+    def draw(self, game, stream=None):
+        """
+        Writes the frame for the game's current position to the stream (standard output by default) with a single
+        write: the changes from the last frame in diff mode, or the full frame otherwise
+        """
+
+        if stream is None:
+            stream = sys.stdout
+        text = self.render_changes(game) if self._diff is True else self.render(game)
+        if text:
+            stream.write(text)
+            stream.flush()
+
+    @staticmethod
+    def _board_text(codes):
+        """Takes in the 64 piece codes in index order and returns the board part of a frame"""
+
+        board = codes.translate(RENDER_SYMBOL_TABLE).decode()
+        return FRAME_TEMPLATE % tuple(''.join([board[row * 8:row * 8 + 8] for row in range(7, -1, -1)]))
+
+    def _panel(self, game, codes):
+        """
+        Takes in the game and its ChessVar.to_codes bytes and returns the panel lines: one for each player's reserve,
+        then whose turn it is
+        """
+
+        key = (codes[64:], game.get_power_pieces_taken('WHITE'), game.get_power_pieces_taken('BLACK'),
+               game.get_game_state())
+        lines = self._panel_cache.get(key)
+        if lines is not None:
+            return lines
+
+        lines = []
+        for color, name, symbols in (('WHITE', 'White', 'FH'), ('BLACK', 'Black', 'fh')):
+            reserve = ' '.join(symbol for symbol in symbols if game.is_fairy_piece_available(symbol)) or '-'
+            lines.append('%s reserve %-3s  power pieces lost %d' % (name, reserve, game.get_power_pieces_taken(color)))
+        game_state = game.get_game_state()
+        if game_state == 'UNFINISHED':
+            lines.append('%s to move' % ('White' if game.get_turn() == 'WHITE' else 'Black'))
+        else:
+            lines.append(STATE_TEXT[game_state])
+        self._panel_cache[key] = lines
+        return lines
+
+
+def main():
+    """Replays recorded games in the terminal, one frame per turn"""
+
+    parser = argparse.ArgumentParser(description='Watch recorded Falcon-Hunter games in the terminal')
+    parser.add_argument('games', nargs='+', help='game files to replay')
+    parser.add_argument('--delay', type=float, default=0.3, help='seconds between turns')
+    parser.add_argument('--no-reserve', action='store_true', help='leave out the reserve panel')
+    parser.add_argument('--full', action='store_true', help='redraw every frame in full instead of the changes')
+    arguments = parser.parse_args()
+
+    renderer = BoardRenderer(not arguments.no_reserve, not arguments.full)
+    for path in arguments.games:
+        with open(path) as file_object:
+            for record in read_games(file_object):
+                game = record.new_game()
+                renderer.reset()
+                renderer.draw(game)
+                for turn in record.get_moves():
+                    time.sleep(arguments.delay)
+                    if game.push_turn(turn) is False:
+                        break
+                    renderer.draw(game)
+
+
+if __name__ == '__main__':
+    main()
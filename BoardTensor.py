@@ -0,0 +1,39 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Converts Falcon-Hunter positions into NumPy tensors for machine learning evaluators.  Each position
+#               becomes PLANE_COUNT planes of 8 x 8 bytes: one plane for each color and kind of piece (including the
+#               Falcon and Hunter), one for the player to move, and one for each fairy piece still in reserve.  The
+#               batch conversion copies each game's piece codes out in one piece (ChessVar.to_codes) and builds every
+#               plane with array operations, so there is no Python loop over squares.  Requires NumPy, which the rest
+#               of the game does not.
+
+import numpy
+
+from ChessVar import PLANE_COUNT, SIDE_TO_MOVE_PLANE
+
+# Piece codes in plane order, shaped to compare against every square of every position at once
+_PLANE_CODES = numpy.arange(SIDE_TO_MOVE_PLANE, dtype=numpy.uint8).reshape(1, SIDE_TO_MOVE_PLANE, 1)
+
+
+def board_planes(game):
+    """Returns a (PLANE_COUNT, 8, 8) uint8 array of the game's planes, indexed by plane, row - 1 and column - 1"""
+
+    return numpy.frombuffer(game.to_planes(), dtype=numpy.uint8).reshape(PLANE_COUNT, 8, 8)
+
+
+def positions_to_tensor(games):
+    """
+    Takes in a list of games and returns a (N, PLANE_COUNT, 8, 8) uint8 array holding the planes of each game's current
+    position, in the same order and with the same layout as ChessVar.to_planes
+    """
+
+    codes = numpy.frombuffer(b''.join([game.to_codes() for game in games]), dtype=numpy.uint8).reshape(len(games), 69)
+
+    tensor = numpy.empty((len(games), PLANE_COUNT, 64), dtype=numpy.uint8)
+    numpy.equal(codes[:, numpy.newaxis, :64], _PLANE_CODES, out=tensor[:, :SIDE_TO_MOVE_PLANE].view(numpy.bool_))
+
+    # The side to move and reserve flags fill whole planes
+    tensor[:, SIDE_TO_MOVE_PLANE:] = codes[:, 64:, numpy.newaxis]
+    return tensor.reshape(len(games), PLANE_COUNT, 8, 8)
+
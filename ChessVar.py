@@ -10,25 +10,327 @@
 #               piece is called a Hunter, and it moves forward like a Rook and backwards like a Bishop.  Neither may
 #               move horizontally.  The game ends when on one of the player's King is captured.
 
+import argparse
+import functools
+import multiprocessing
+import random
+import struct
+import time
+
+# Small-int codes for the two colors and eight kinds of piece.  A piece's code is kind + 8 * color, which is also the
+# position of its symbol in PIECE_SYMBOLS.  The legality checks compare these codes instead of strings
+WHITE, BLACK = 0, 1
+COLOR_NAMES = ('WHITE', 'BLACK')
+COLOR_CODES = {'WHITE': WHITE, 'BLACK': BLACK}
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, FALCON, HUNTER = range(8)
+KIND_NAMES = ('PAWN', 'KNIGHT', 'BISHOP', 'ROOK', 'QUEEN', 'KING', 'FALCON', 'HUNTER')
+PIECE_SYMBOLS = 'PNBRQKFHpnbrqkfh'
+
+# Code stored for an empty square, one past the last piece code
+EMPTY_CODE = 16
+
+# Names of the squares on the board.  A square's index is (row - 1) * 8 + (column - 1), so 'a1' is 0 and 'h8' is 63
+SQUARE_NAMES = [column + str(row) for row in range(1, 9) for column in 'abcdefgh']
+
+# Directions a piece can slide, each given as a (row change, column change) step.  White moves toward row 8, so NORTH is
+# forward for White and backward for Black
+NORTH, SOUTH, EAST, WEST, NORTH_EAST, NORTH_WEST, SOUTH_EAST, SOUTH_WEST = range(8)
+DIRECTION_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _build_ray_table():
+    """
+    Returns a table of rays indexed by square index and then direction.  Each ray is a tuple holding the indexes of the
+    squares reached by sliding from the square in that direction, nearest square first, stopping at the board's edge
+    """
+
+    rays = []
+    for index in range(64):
+        row, column = divmod(index, 8)
+        square_rays = []
+        for row_step, column_step in DIRECTION_STEPS:
+            ray = []
+            test_row = row + row_step
+            test_column = column + column_step
+            while 0 <= test_row < 8 and 0 <= test_column < 8:
+                ray.append(test_row * 8 + test_column)
+                test_row += row_step
+                test_column += column_step
+            square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+def _build_step_table(steps):
+    """
+    Returns a table indexed by square index holding a tuple of the squares reached by taking each of the given
+    (row change, column change) steps once, leaving out any step that would leave the board
+    """
+
+    table = []
+    for index in range(64):
+        row, column = divmod(index, 8)
+        targets = []
+        for row_step, column_step in steps:
+            if 0 <= row + row_step < 8 and 0 <= column + column_step < 8:
+                targets.append((row + row_step) * 8 + column + column_step)
+        table.append(tuple(targets))
+    return tuple(table)
+
+
+def _build_between_table(rays):
+    """
+    Returns a table indexed by start and end square index.  For two squares on the same row, column or diagonal the
+    entry is a tuple of the indexes of the squares strictly between them (empty for neighboring squares).  For any
+    other pair, including a square and itself, the entry is None, since only a Knight can move between them
+    """
+
+    between = [[None] * 64 for _ in range(64)]
+    for start in range(64):
+        for ray in rays[start]:
+            for distance, end in enumerate(ray):
+                between[start][end] = ray[:distance]
+    return tuple(tuple(row) for row in between)
+
+
+RAYS = _build_ray_table()
+BETWEEN = _build_between_table(RAYS)
+
+# Every (start_location, end_location) pair, built once so the move generator can hand out shared tuples
+MOVE_PAIRS = tuple(tuple((start, end) for end in SQUARE_NAMES) for start in SQUARE_NAMES)
+
+# Every (identity_of_piece, location) pair for entering a fairy piece, keyed by the fairy piece's symbol
+FAIRY_ENTRY_PAIRS = {symbol: tuple((symbol, location) for location in SQUARE_NAMES) for symbol in 'FHfh'}
+KNIGHT_TARGETS = _build_step_table(((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2)))
+KING_TARGETS = _build_step_table(DIRECTION_STEPS)
+
+# Directions each sliding piece may travel, indexed by piece code (None for pieces that do not slide).  The Falcon and
+# Hunter are asymmetric, so their forward and backward directions depend on which side the piece belongs to
+_ORTHOGONAL = (NORTH, SOUTH, EAST, WEST)
+_DIAGONAL = (NORTH_EAST, NORTH_WEST, SOUTH_EAST, SOUTH_WEST)
+SLIDING_DIRECTIONS = (
+    None, None, _DIAGONAL, _ORTHOGONAL, _ORTHOGONAL + _DIAGONAL, None,
+    (NORTH_EAST, NORTH_WEST, SOUTH), (NORTH, SOUTH_EAST, SOUTH_WEST),
+    None, None, _DIAGONAL, _ORTHOGONAL, _ORTHOGONAL + _DIAGONAL, None,
+    (SOUTH_EAST, SOUTH_WEST, NORTH), (SOUTH, NORTH_EAST, NORTH_WEST),
+)
+
+# Move tables by piece code, so the move generator looks up a piece's moves without first working out its kind.
+# STEP_TARGETS holds the Knight or King table for those pieces (None for the others).  SLIDING_RAYS holds, for each
+# sliding piece and square index, the rays the piece may travel from that square, leaving out rays with no squares
+STEP_TARGETS = tuple(KNIGHT_TARGETS if code & 7 == KNIGHT else KING_TARGETS if code & 7 == KING else None
+                     for code in range(16))
+SLIDING_RAYS = tuple(
+    None if directions is None else
+    tuple(tuple(RAYS[index][direction] for direction in directions if RAYS[index][direction]) for index in range(64))
+    for directions in SLIDING_DIRECTIONS)
+
+# Translation tables from piece codes to 1 for a piece of the given color and 0 for anything else, indexed by color
+OWN_PIECE_TABLES = tuple(bytes(1 if code < 16 and code // 8 == color else 0 for code in range(256))
+                         for color in (WHITE, BLACK))
+
+# Pawn moves, indexed by color and then square index.  Each entry is (forward square, two-step square, capture
+# squares): the square one row forward (None off the board), the square two rows forward for a Pawn on its starting
+# row (None otherwise), and the forward squares one column to either side, which a Pawn may only move to by capturing
+PAWN_MOVES = tuple(
+    tuple((index + step if 0 <= index + step < 64 else None,
+           index + 2 * step if index // 8 + 1 == start_row else None,
+           tuple(index + step + side for side in (-1, 1)
+                 if 0 <= index + step < 64 and 0 <= index % 8 + side < 8))
+          for index in range(64))
+    for step, start_row in ((8, 2), (-8, 7)))
+
+# Attack tables, which answer "which pieces attack this square?" by looking outward from the square rather than
+# checking every piece.  The direction back toward the square from a piece found along each direction
+OPPOSITE_DIRECTIONS = (SOUTH, NORTH, WEST, EAST, SOUTH_WEST, SOUTH_EAST, NORTH_WEST, NORTH_EAST)
+
+# Squares a Pawn of each color would have to stand on to attack a square, indexed by color and then square index.  A
+# White Pawn attacks the row above it, so it attacks a square from the row below
+PAWN_ATTACKERS = (_build_step_table(((-1, 1), (-1, -1))), _build_step_table(((1, 1), (1, -1))))
+
+# Half-ray tables for sliding attacks, indexed by color and then square index.  Each entry is a tuple of (ray, piece
+# codes) pairs, one for each direction: the first piece along the ray attacks the square if its code is in the set,
+# which holds the sliding pieces of that color that move back along the ray.  The Falcon and Hunter move differently
+# forward and backward, so they appear in different directions for White and Black
+SLIDING_ATTACKERS = tuple(
+    tuple(
+        tuple((RAYS[index][direction], frozenset(
+            code for code in range(8 * color, 8 * color + 8)
+            if SLIDING_DIRECTIONS[code] is not None and OPPOSITE_DIRECTIONS[direction] in SLIDING_DIRECTIONS[code]))
+            for direction in range(8))
+        for index in range(64))
+    for color in (WHITE, BLACK))
+
+# Random 64-bit Zobrist keys used to hash positions.  A position's hash is the exclusive-or of the key for each piece on
+# its square, the key for Black to move (if it is Black's turn), the key for each player's current power pieces taken
+# count, and the key for each fairy piece still in reserve.  A fixed seed keeps hashes the same from run to run
+_zobrist_random = random.Random(0x46616C636F6E)
+ZOBRIST_PIECE_KEYS = {symbol: tuple(_zobrist_random.getrandbits(64) for _ in range(64))
+                      for symbol in 'PNBRQKFHpnbrqkfh'}
+ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+ZOBRIST_POWER_PIECES_TAKEN_KEYS = tuple(tuple(_zobrist_random.getrandbits(64) for _ in range(16)) for _ in COLOR_NAMES)
+ZOBRIST_FAIRY_AVAILABLE_KEYS = {symbol: _zobrist_random.getrandbits(64) for symbol in 'FHfh'}
+
+# Reasons make_move and enter_fairy_piece give for returning False, kept as the game's last rejection.  Each is set
+# only on the path that rejects the turn, so accepted turns pay nothing for them
+REJECTION_REASONS = ('OFF_BOARD', 'GAME_OVER', 'NO_PIECE', 'WRONG_COLOR', 'OWN_PIECE_TARGET', 'ILLEGAL_SHAPE',
+                     'BLOCKED_PATH', 'NO_POWER_PIECE_TAKEN', 'NOT_FAIRY_PIECE', 'NOT_IN_RESERVE', 'WRONG_ROW',
+                     'SQUARE_OCCUPIED')
+
+# Position strings.  A FEN-style string has five fields separated by spaces: the board from row 8 down to row 1 (rows
+# separated by '/', digits counting empty squares), the player to move ('w' or 'b'), the fairy pieces still in reserve
+# ('-' if none), and White's and then Black's power pieces taken counts.  The starting position is:
+STARTING_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FHfh 0 0'
+
+# Translation from piece codes to FEN symbols, with '1' for an empty square, and the runs of empty squares to replace
+# with their length, longest first
+FEN_SYMBOL_TABLE = bytes.maketrans(bytes(range(17)), (PIECE_SYMBOLS + '1').encode())
+FEN_EMPTY_RUNS = tuple('1' * length for length in range(8, 1, -1))
+
+# Most power pieces a player can lose: the Queen, two Rooks, two Bishops and two Knights.  Positions read from a string
+# or bytes are held to this, which also lets the packed format store each count in three bits
+MAX_POWER_PIECES_TAKEN = 7
+
+# Text drawn by display_board, with a '%s' slot for each square's symbol from a8 across and down to h1, and the
+# translation from piece codes to the symbols shown, with a space for an empty square
+_DISPLAY_RULE = '   ---------------------------------\n'
+DISPLAY_TEMPLATE = ('\n     Falcon-Hunter Variant of Chess\n\n     a   b   c   d   e   f   g   h\n' + _DISPLAY_RULE +
+                    ''.join('%d  | %s |\n' % (row, ' | '.join(['%s'] * 8)) + _DISPLAY_RULE for row in range(8, 0, -1)))
+DISPLAY_SYMBOL_TABLE = bytes.maketrans(bytes(range(17)), (PIECE_SYMBOLS + ' ').encode())
+
+# Optional draw rules (see ChessVar.set_draw_rules).  The game is drawn when a position occurs for the REPETITION_LIMIT
+# time, or after NO_CAPTURE_LIMIT turns in a row (counting both players' turns) without a capture, unless another limit
+# is given
+REPETITION_LIMIT = 3
+NO_CAPTURE_LIMIT = 100
+
+# Board backends a game can run on (see ChessVar.__init__).  'objects' answers the rules questions from the Square and
+# Piece objects and the move tables above, and 'bitboard' from a BitboardBoard kept in step with them
+BACKENDS = ('objects', 'bitboard')
+
+# Snapshots (see ChessVar.snapshot) are the piece code on each square in index order, then whether White is to move,
+# whether each of the F, H, f and h fairy pieces is in reserve, each player's power pieces taken count and the position
+# of the game state in GAME_STATES, then the position hash and the piece-square score
+GAME_STATES = ('UNFINISHED', 'WHITE_WON', 'BLACK_WON', 'DRAW')
+SNAPSHOT = struct.Struct('<64s8BQi')
+
+# Feature planes for machine learning, each 64 bytes in square index order (so row 1 comes first).  Planes 0 to 15 mark
+# the squares holding the piece with that code, plane 16 is all ones when White is to move, and planes 17 to 20 are all
+# ones while the F, H, f and h fairy pieces are in reserve.  Each piece plane is made with bytes.translate, which maps
+# the piece's code to 1 and every other code to 0
+PLANE_COUNT = 21
+SIDE_TO_MOVE_PLANE = 16
+RESERVE_PLANES = 17
+PIECE_PLANE_TABLES = tuple(bytes(1 if value == code else 0 for value in range(256)) for code in range(16))
+
+# Material value of each kind of piece, in hundredths of a pawn, indexed by kind.  The King is not counted because
+# losing it ends the game
+KIND_VALUES = (100, 300, 320, 500, 900, 0, 450, 450)
+
+# Value of a fairy piece still in reserve.  A piece that may enter now (its player has an unreplaced lost power piece)
+# is worth nearly as much as one on the board, while a piece still waiting on a lost power piece is only a future
+# resource
+RESERVE_READY_VALUE = 360
+RESERVE_WAITING_VALUE = 90
+
+# Piece-square bonuses, from White's point of view, for a Pawn on each row (advancing toward row 8) and column (holding
+# the centre), and for a King on each row (staying home, since losing the King loses the game)
+PAWN_ROW_BONUS = (0, 0, 4, 8, 14, 22, 30, 10)
+PAWN_COLUMN_BONUS = (0, 0, 2, 6, 6, 2, 0, 0)
+KING_ROW_BONUS = (20, 10, -10, -25, -40, -50, -60, -60)
+
+# Bonus per square a Knight or sliding piece could reach from a square on an empty board, with squares in the opponent's
+# half of the board counted twice, measured from the piece's average over the whole board.  The Falcon and Hunter move
+# differently forward than backward, so where they are strongest differs from the other pieces and between the colors
+MOBILITY_BONUS = (0, 3, 2, 1, 1, 0, 2, 2)
+
+
+def _build_piece_square_scores():
+    """
+    Returns a table indexed by piece code and then square index holding the score of that piece on that square: its
+    material value plus its piece-square bonus, positive for White's pieces and negative for Black's.  The table has an
+    extra row of zeros for EMPTY_CODE, so an empty square can be looked up like a piece
+    """
+
+    table = []
+    for code in range(16):
+        color, kind = divmod(code, 8)
+        scores = []
+        for index in range(64):
+            # Bonuses by row are given from the piece owner's side of the board
+            row, column = divmod(index, 8)
+            if color == BLACK:
+                row = 7 - row
+
+            if kind == PAWN:
+                bonus = PAWN_ROW_BONUS[row] + PAWN_COLUMN_BONUS[column]
+            elif kind == KING:
+                bonus = KING_ROW_BONUS[row]
+            else:
+                if kind == KNIGHT:
+                    targets = KNIGHT_TARGETS[index]
+                else:
+                    targets = [target for direction in SLIDING_DIRECTIONS[code] for target in RAYS[index][direction]]
+                bonus = sum(2 if (target >= 32) == (color == WHITE) else 1 for target in targets)
+            scores.append(bonus)
+
+        # Mobility bonuses are measured from the average, so only where the piece stands changes the score
+        if MOBILITY_BONUS[kind] != 0:
+            average = sum(scores) / 64
+            scores = [round(MOBILITY_BONUS[kind] * (bonus - average)) for bonus in scores]
+
+        sign = 1 if color == WHITE else -1
+        table.append(tuple(sign * (KIND_VALUES[kind] + bonus) for bonus in scores))
+
+    table.append((0,) * 64)
+    return tuple(table)
+
+
+PIECE_SQUARE_SCORES = _build_piece_square_scores()
+
+
 class Piece:
-    """Represents Parent Class for all pieces in the game"""
+    """
+    Represents Parent Class for all pieces in the game.  Pieces use __slots__ rather than an attribute dictionary, and
+    a piece's attributes do not change after it is created
+    """
 
-    def __init__(self, color):
+    __slots__ = ('_color', '_color_code', '_kind', '_code', '_power_piece', '_name', '_symbol')
+
+    def __init__(self, color, kind):
         """
-        Sets the given color as an attribute.  Also sets the power piece attribute to False, the name attribute to None
-        and the symbol attributes to None.  The final three attributes can be overridden by the various child classes.
+        Sets the given color and kind as attributes, along with the matching small-int codes, name and symbol.  Also
+        sets the power piece attribute to False, which can be overridden by the various child classes.
         """
 
         self._color = color
+        self._color_code = COLOR_NAMES.index(color)
+        self._kind = kind
+        self._code = kind + 8 * self._color_code
         self._power_piece = False
-        self._name = None
-        self._symbol = None
+        self._name = KIND_NAMES[kind]
+        self._symbol = PIECE_SYMBOLS[self._code]
 
     def get_color(self):
         """Returns color of piece - either BLACK or WHITE"""
 
         return self._color
 
+    def get_color_code(self):
+        """Returns the color of the piece as a code - either WHITE (0) or BLACK (1)"""
+
+        return self._color_code
+
+    def get_kind(self):
+        """Returns the kind of the piece as a code, such as PAWN or KING"""
+
+        return self._kind
+
+    def get_code(self):
+        """Returns the piece's code, kind + 8 * color, which is the position of its symbol in PIECE_SYMBOLS"""
+
+        return self._code
+
     @staticmethod
     def is_empty():
         """Since the square is occupied by this piece, this Returns False"""
@@ -58,18 +360,15 @@ class Pawn(Piece):
     piece.  However, it can attack the opponent's piece by moving one space forward diagonally.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'P' as its symbol, capital for the
         WHITE pieces and lower case for the BLACK pieces
         """
 
-        super().__init__(color)
-        self._name = 'PAWN'
-        if self._color == 'WHITE':
-            self._symbol = 'P'
-        else:
-            self._symbol = 'p'
+        super().__init__(color, PAWN)
 
     def is_movement_acceptable(self, start_location_object, end_location_object):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -77,7 +376,7 @@ class Pawn(Piece):
         is_move_legal = False
 
         # Check if move is legal if it is white's turn
-        if self._color == 'WHITE':
+        if self._color_code == WHITE:
             # A single space forward is legal
             if (end_location_object.get_row() == start_location_object.get_row() + 1 and
                     end_location_object.get_piece().is_empty() and
@@ -93,11 +392,11 @@ class Pawn(Piece):
             # Single space diagonal move is okay, provided that an opponent's piece can be captured
             if (end_location_object.get_row() == start_location_object.get_row() + 1 and
                     abs(end_location_object.get_column() - start_location_object.get_column()) == 1 and
-                    end_location_object.get_piece().get_color() == 'BLACK'):
+                    end_location_object.get_piece().get_color_code() == BLACK):
                 is_move_legal = True
 
         # Check if move is legal if it is black's turn
-        if self._color == 'BLACK':
+        if self._color_code == BLACK:
             # A single space forward is legal
             if (end_location_object.get_row() == start_location_object.get_row() - 1 and
                     end_location_object.get_piece().is_empty() and
@@ -113,7 +412,7 @@ class Pawn(Piece):
             # Single space diagonal move is okay, provided that an opponent's piece can be captured
             if (end_location_object.get_row() == start_location_object.get_row() - 1 and
                     abs(end_location_object.get_column() - start_location_object.get_column()) == 1 and
-                    end_location_object.get_piece().get_color() == 'WHITE'):
+                    end_location_object.get_piece().get_color_code() == WHITE):
                 is_move_legal = True
 
         return is_move_legal
@@ -125,19 +424,16 @@ class Rook(Piece):
     line, but cannot move diagonally. It can move multiple squares.  It cannot jump other pieces.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'R' as its symbol, capital for the
         WHITE pieces and lower case for the BLACK pieces.  Also sets power piece attribute to True.
         """
 
-        super().__init__(color)
-        self._name = 'ROOK'
+        super().__init__(color, ROOK)
         self._power_piece = True
-        if self._color == 'WHITE':
-            self._symbol = 'R'
-        else:
-            self._symbol = 'r'
 
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -158,19 +454,16 @@ class Knight(Piece):
     square to the side, or to the side two squares and forward/backward one square.  The Knight can jump other pieces.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'N' as its symbol, capital for the
         WHITE pieces and lower case for the BLACK pieces.  Sets the power piece attribute to True
         """
 
-        super().__init__(color)
-        self._name = 'KNIGHT'
+        super().__init__(color, KNIGHT)
         self._power_piece = True
-        if self._color == 'WHITE':
-            self._symbol = 'N'
-        else:
-            self._symbol = 'n'
 
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -205,19 +498,16 @@ class Bishop(Piece):
     It can move multiple spaces.  It cannot jump other pieces.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'B' as its symbol, capital for the
         WHITE pieces and lower case for the BLACK pieces.  Sets the power piece attribute to True
         """
 
-        super().__init__(color)
-        self._name = 'BISHOP'
+        super().__init__(color, BISHOP)
         self._power_piece = True
-        if self._color == 'WHITE':
-            self._symbol = 'B'
-        else:
-            self._symbol = 'b'
 
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -238,19 +528,16 @@ class Queen(Piece):
     horizontally or vertically.  It can move multiple spaces.  It cannot jump other pieces.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'Q' as its symbol, capital for the
         WHITE piece and lower case for the BLACK piece.  Sets the power piece attribute to True.
         """
 
-        super().__init__(color)
-        self._name = 'QUEEN'
+        super().__init__(color, QUEEN)
         self._power_piece = True
-        if self._color == 'WHITE':
-            self._symbol = 'Q'
-        else:
-            self._symbol = 'q'
 
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -272,18 +559,15 @@ class King(Piece):
     Represents a King, which is a subclass of Piece.  The King moves one square in any direction.
     """
 
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'K' as its symbol, capital for the
         WHITE pieces and lower case for the BLACK pieces.
         """
 
-        super().__init__(color)
-        self._name = 'KING'
-        if self._color == 'WHITE':
-            self._symbol = 'K'
-        else:
-            self._symbol = 'k'
+        super().__init__(color, KING)
 
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
@@ -306,19 +590,16 @@ class Falcon(Piece):
     has been captured by the opponent
     """
 
+    __slots__ = ('_available',)
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'F' as its symbol, capital for the
         WHITE piece and lower case for the BLACK piece.  Sets available attribute to True.
         """
 
-        super().__init__(color)
-        self._name = 'FALCON'
+        super().__init__(color, FALCON)
         self._available = True
-        if self._color == 'WHITE':
-            self._symbol = 'F'
-        else:
-            self._symbol = 'f'
 
     def is_available(self):
         """Returns True if the piece is available to be placed on the board"""
@@ -330,13 +611,18 @@ class Falcon(Piece):
 
         self._available = False
 
+    def set_available(self):
+        """Sets available attribute to True, returning the piece to the player's reserve when an entry is taken back"""
+
+        self._available = True
+
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
 
         is_move_legal = False
 
         # Check to see if move is legal - if it is White's turn
-        if self._color == 'WHITE':
+        if self._color_code == WHITE:
             if (end_location.get_row() > start_location.get_row() and
                     abs(end_location.get_row() - start_location.get_row()) ==
                     abs(end_location.get_column() - start_location.get_column())):
@@ -346,7 +632,7 @@ class Falcon(Piece):
                 is_move_legal = True
 
         # Check to see if move is legal - if it is Black's turn
-        if self._color == 'BLACK':
+        if self._color_code == BLACK:
             if (end_location.get_row() < start_location.get_row() and
                     abs(end_location.get_row() - start_location.get_row()) ==
                     abs(end_location.get_column() - start_location.get_column())):
@@ -366,19 +652,16 @@ class Hunter(Piece):
     has been captured by the opponent
     """
 
+    __slots__ = ('_available',)
+
     def __init__(self, color):
         """
         Inherits the color attribute from its parent Piece Class.  Uses the letter 'H' as its symbol, capital for the
         WHITE piece and lower case for the BLACK piece.  Sets available attribute to True.
         """
 
-        super().__init__(color)
-        self._name = 'HUNTER'
+        super().__init__(color, HUNTER)
         self._available = True
-        if self._color == 'WHITE':
-            self._symbol = 'H'
-        else:
-            self._symbol = 'h'
 
     def is_available(self):
         """Returns True if the piece is available to be placed on the board"""
@@ -390,13 +673,18 @@ class Hunter(Piece):
 
         self._available = False
 
+    def set_available(self):
+        """Sets available attribute to True, returning the piece to the player's reserve when an entry is taken back"""
+
+        self._available = True
+
     def is_movement_acceptable(self, start_location, end_location):
         """Determines whether proposed move is consistent with the rules of chess and, if so, returns True"""
 
         is_move_legal = False
 
         # Check to see if move is legal - if it is White's turn
-        if self._color == 'WHITE':
+        if self._color_code == WHITE:
             if (end_location.get_row() > start_location.get_row() and
                     end_location.get_column() == start_location.get_column()):
                 is_move_legal = True
@@ -406,7 +694,7 @@ class Hunter(Piece):
                 is_move_legal = True
 
         # Check to see if move is legal - if it is Black's turn
-        if self._color == 'BLACK':
+        if self._color_code == BLACK:
             if (end_location.get_row() < start_location.get_row() and
                     end_location.get_column() == start_location.get_column()):
                 is_move_legal = True
@@ -421,7 +709,9 @@ class Hunter(Piece):
 class Empty:
     """Represents an empty spot object that can be placed in a square object when it contains no pieces"""
 
-    def __int__(self):
+    __slots__ = ()
+
+    def __init__(self):
         """This class does not have any attributes"""
 
     @staticmethod
@@ -441,20 +731,36 @@ class Empty:
 
         return
 
+    @staticmethod
+    def get_color_code():
+        """Do not return a color code - an empty square does not have a piece with either color"""
+
+        return None
+
+    @staticmethod
+    def get_code():
+        """Returns EMPTY_CODE, which follows the piece codes so that an empty square never matches a piece"""
+
+        return EMPTY_CODE
+
 
 class Square:
     """Represents each square on a chess board"""
 
+    __slots__ = ('_row', '_column', '_index', '_piece_object')
+
     def __init__(self, row, column, piece_object):
         """
         Defines each square by row number and column number attributes, which cannot be changed after a square object
         is created. Also has an attribute to hold a piece_object. If the square is empty, this will be the empty object.
         Otherwise, the piece_object attribute will be the piece located in that square.  There are methods to change the
-        piece_object attribute
+        piece_object attribute.  The square's index, (row - 1) * 8 + (column - 1), is stored for use with the board's
+        lookup tables
         """
 
         self._row = row
         self._column = column
+        self._index = (row - 1) * 8 + column - 1
         self._piece_object = piece_object
 
     def get_row(self):
@@ -467,6 +773,11 @@ class Square:
 
         return self._column
 
+    def get_index(self):
+        """Returns the square's index (an integer 0-63), numbering the squares from a1 across each row to h8"""
+
+        return self._index
+
     def get_piece(self):
         """Returns None if the square is empty.  If a piece is located in the square, it returns the piece object"""
 
@@ -478,155 +789,245 @@ class Square:
         self._piece_object = piece_object
 
 
+# Pieces other than the Falcon and Hunter have no state of their own, so all games share one descriptor for each color
+# and kind, found by symbol.  The Falcon and Hunter record whether they are still in reserve, so each game has its own
+EMPTY = Empty()
+SHARED_PIECES = {piece.get_symbol(): piece for piece in (
+    Pawn('WHITE'), Knight('WHITE'), Bishop('WHITE'), Rook('WHITE'), Queen('WHITE'), King('WHITE'),
+    Pawn('BLACK'), Knight('BLACK'), Bishop('BLACK'), Rook('BLACK'), Queen('BLACK'), King('BLACK'))}
+
+
 class ChessVar:
     """Represents a game of the Falcon-Hunter variant of chess"""
 
-    def __init__(self):
+    __slots__ = ('_game_state', '_white_turn', '_power_pieces_taken_black', '_power_pieces_taken_white', '_falcon_w',
+                 '_hunter_w', '_falcon_b', '_hunter_b', '_fairy_pieces', '_empty', '_squares', '_board',
+                 '_square_colors', '_piece_codes', '_undo_stack', '_position_hash', '_piece_square_score',
+                 '_last_rejection', '_position_counts', '_plies_since_capture', '_no_capture_limit', '_bitboards')
+
+    def __init__(self, draw_rules=False, no_capture_limit=NO_CAPTURE_LIMIT, backend='objects'):
         """
         Define attributes that will need to be tracked during the course of the game, create all the piece objects
         that will be used in the game, define the square objects located on the board, and establish the initial setup
-        of the board, with the appropriate piece objects being located on the appropriate square objects
+        of the board, with the appropriate piece objects being located on the appropriate square objects.  If
+        draw_rules is True, the game can also end in a draw by repetition or after no_capture_limit turns without a
+        capture (see set_draw_rules); by default only a King capture ends the game.  backend is one of BACKENDS: with
+        'bitboard', move legality, move generation and attack queries are answered by a BitboardBoard, and every
+        public method behaves exactly as with the default 'objects'.  Raises ValueError for any other backend
         """
 
+        if backend not in BACKENDS:
+            raise ValueError('backend must be one of %s: %r' % (', '.join(BACKENDS), backend))
+
         self._game_state = 'UNFINISHED'
         self._white_turn = True
         self._power_pieces_taken_black = 0
         self._power_pieces_taken_white = 0
 
-        # Create all the WHITE Pieces
-        self._pawn_w1 = Pawn('WHITE')
-        self._pawn_w2 = Pawn('WHITE')
-        self._pawn_w3 = Pawn('WHITE')
-        self._pawn_w4 = Pawn('WHITE')
-        self._pawn_w5 = Pawn('WHITE')
-        self._pawn_w6 = Pawn('WHITE')
-        self._pawn_w7 = Pawn('WHITE')
-        self._pawn_w8 = Pawn('WHITE')
-        self._rook_w1 = Rook('WHITE')
-        self._rook_w2 = Rook('WHITE')
-        self._knight_w1 = Knight('WHITE')
-        self._knight_w2 = Knight('WHITE')
-        self._bishop_w1 = Bishop('WHITE')
-        self._bishop_w2 = Bishop('WHITE')
-        self._queen_w = Queen('WHITE')
-        self._king_w = King('WHITE')
+        # Create the fairy pieces.  Every other piece is a shared descriptor from SHARED_PIECES
         self._falcon_w = Falcon('WHITE')
         self._hunter_w = Hunter('WHITE')
-
-        # Create all the BLACK Pieces
-        self._pawn_b1 = Pawn('BLACK')
-        self._pawn_b2 = Pawn('BLACK')
-        self._pawn_b3 = Pawn('BLACK')
-        self._pawn_b4 = Pawn('BLACK')
-        self._pawn_b5 = Pawn('BLACK')
-        self._pawn_b6 = Pawn('BLACK')
-        self._pawn_b7 = Pawn('BLACK')
-        self._pawn_b8 = Pawn('BLACK')
-        self._rook_b1 = Rook('BLACK')
-        self._rook_b2 = Rook('BLACK')
-        self._knight_b1 = Knight('BLACK')
-        self._knight_b2 = Knight('BLACK')
-        self._bishop_b1 = Bishop('BLACK')
-        self._bishop_b2 = Bishop('BLACK')
-        self._queen_b = Queen('BLACK')
-        self._king_b = King('BLACK')
         self._falcon_b = Falcon('BLACK')
         self._hunter_b = Hunter('BLACK')
 
-        # Create object for empty square
-        self._empty = Empty()
-
-        # Create a square object for each square on the board, identifying the piece it initially contains
-        self._a1 = Square(1, 1, self._rook_w1)
-        self._b1 = Square(1, 2, self._knight_w1)
-        self._c1 = Square(1, 3, self._bishop_w1)
-        self._d1 = Square(1, 4, self._queen_w)
-        self._e1 = Square(1, 5, self._king_w)
-        self._f1 = Square(1, 6, self._bishop_w2)
-        self._g1 = Square(1, 7, self._knight_w2)
-        self._h1 = Square(1, 8, self._rook_w2)
-        self._a2 = Square(2, 1, self._pawn_w1)
-        self._b2 = Square(2, 2, self._pawn_w2)
-        self._c2 = Square(2, 3, self._pawn_w3)
-        self._d2 = Square(2, 4, self._pawn_w4)
-        self._e2 = Square(2, 5, self._pawn_w5)
-        self._f2 = Square(2, 6, self._pawn_w6)
-        self._g2 = Square(2, 7, self._pawn_w7)
-        self._h2 = Square(2, 8, self._pawn_w8)
-        self._a3 = Square(3, 1, self._empty)
-        self._b3 = Square(3, 2, self._empty)
-        self._c3 = Square(3, 3, self._empty)
-        self._d3 = Square(3, 4, self._empty)
-        self._e3 = Square(3, 5, self._empty)
-        self._f3 = Square(3, 6, self._empty)
-        self._g3 = Square(3, 7, self._empty)
-        self._h3 = Square(3, 8, self._empty)
-        self._a4 = Square(4, 1, self._empty)
-        self._b4 = Square(4, 2, self._empty)
-        self._c4 = Square(4, 3, self._empty)
-        self._d4 = Square(4, 4, self._empty)
-        self._e4 = Square(4, 5, self._empty)
-        self._f4 = Square(4, 6, self._empty)
-        self._g4 = Square(4, 7, self._empty)
-        self._h4 = Square(4, 8, self._empty)
-        self._a5 = Square(5, 1, self._empty)
-        self._b5 = Square(5, 2, self._empty)
-        self._c5 = Square(5, 3, self._empty)
-        self._d5 = Square(5, 4, self._empty)
-        self._e5 = Square(5, 5, self._empty)
-        self._f5 = Square(5, 6, self._empty)
-        self._g5 = Square(5, 7, self._empty)
-        self._h5 = Square(5, 8, self._empty)
-        self._a6 = Square(6, 1, self._empty)
-        self._b6 = Square(6, 2, self._empty)
-        self._c6 = Square(6, 3, self._empty)
-        self._d6 = Square(6, 4, self._empty)
-        self._e6 = Square(6, 5, self._empty)
-        self._f6 = Square(6, 6, self._empty)
-        self._g6 = Square(6, 7, self._empty)
-        self._h6 = Square(6, 8, self._empty)
-        self._a7 = Square(7, 1, self._pawn_b1)
-        self._b7 = Square(7, 2, self._pawn_b2)
-        self._c7 = Square(7, 3, self._pawn_b3)
-        self._d7 = Square(7, 4, self._pawn_b4)
-        self._e7 = Square(7, 5, self._pawn_b5)
-        self._f7 = Square(7, 6, self._pawn_b6)
-        self._g7 = Square(7, 7, self._pawn_b7)
-        self._h7 = Square(7, 8, self._pawn_b8)
-        self._a8 = Square(8, 1, self._rook_b1)
-        self._b8 = Square(8, 2, self._knight_b1)
-        self._c8 = Square(8, 3, self._bishop_b1)
-        self._d8 = Square(8, 4, self._queen_b)
-        self._e8 = Square(8, 5, self._king_b)
-        self._f8 = Square(8, 6, self._bishop_b2)
-        self._g8 = Square(8, 7, self._knight_b2)
-        self._h8 = Square(8, 8, self._rook_b2)
-
-        # Arrange board into a dictionary
-        self._board = {
-            'a1': self._a1, 'b1': self._b1, 'c1': self._c1, 'd1': self._d1,
-            'e1': self._e1, 'f1': self._f1, 'g1': self._g1, 'h1': self._h1,
-            'a2': self._a2, 'b2': self._b2, 'c2': self._c2, 'd2': self._d2,
-            'e2': self._e2, 'f2': self._f2, 'g2': self._g2, 'h2': self._h2,
-            'a3': self._a3, 'b3': self._b3, 'c3': self._c3, 'd3': self._d3,
-            'e3': self._e3, 'f3': self._f3, 'g3': self._g3, 'h3': self._h3,
-            'a4': self._a4, 'b4': self._b4, 'c4': self._c4, 'd4': self._d4,
-            'e4': self._e4, 'f4': self._f4, 'g4': self._g4, 'h4': self._h4,
-            'a5': self._a5, 'b5': self._b5, 'c5': self._c5, 'd5': self._d5,
-            'e5': self._e5, 'f5': self._f5, 'g5': self._g5, 'h5': self._h5,
-            'a6': self._a6, 'b6': self._b6, 'c6': self._c6, 'd6': self._d6,
-            'e6': self._e6, 'f6': self._f6, 'g6': self._g6, 'h6': self._h6,
-            'a7': self._a7, 'b7': self._b7, 'c7': self._c7, 'd7': self._d7,
-            'e7': self._e7, 'f7': self._f7, 'g7': self._g7, 'h7': self._h7,
-            'a8': self._a8, 'b8': self._b8, 'c8': self._c8, 'd8': self._d8,
-            'e8': self._e8, 'f8': self._f8, 'g8': self._g8, 'h8': self._h8,
-        }
+        # Look up each fairy piece by the identity used with enter_fairy_piece
+        self._fairy_pieces = {'F': self._falcon_w, 'H': self._hunter_w, 'f': self._falcon_b, 'h': self._hunter_b}
+
+        # Use the shared object for empty squares
+        self._empty = EMPTY
+
+        # Create a square object for each square on the board, identifying the piece it initially contains.  The
+        # squares are listed by index, so the square for a given row and column is located at position
+        # (row - 1) * 8 + (column - 1), and the board dictionary finds the same square objects by name
+        starting_rows = {1: 'RNBQKBNR', 2: 'PPPPPPPP', 7: 'pppppppp', 8: 'rnbqkbnr'}
+        self._squares = []
+        for row in range(1, 9):
+            for column in range(1, 9):
+                if row in starting_rows:
+                    piece_object = SHARED_PIECES[starting_rows[row][column - 1]]
+                else:
+                    piece_object = self._empty
+                self._squares.append(Square(row, column, piece_object))
+        self._board = dict(zip(SQUARE_NAMES, self._squares))
+
+        # Track the color code of the piece on each square by the same index (WHITE, BLACK, or None if empty).  This is
+        # updated whenever a square's piece changes and lets the move generator scan the board without method calls
+        self._square_colors = [square.get_piece().get_color_code() for square in self._squares]
+
+        # Track the code of the piece on each square by the same index (EMPTY_CODE if empty), so that the whole board
+        # can be copied out at once by to_codes
+        self._piece_codes = bytearray(square.get_piece().get_code() for square in self._squares)
+
+        # The bitboard backend keeps its own copy of the board, updated alongside the piece codes (None without it).
+        # BitboardBoard builds its tables from this module's, so it is imported only when it is used
+        self._bitboards = None
+        if backend == 'bitboard':
+            from BitboardBoard import BitboardBoard
+            self._bitboards = BitboardBoard(self._piece_codes)
+
+        # Turns made with push_move or push_fairy_piece, most recent last, so that they can be taken back with pop_move
+        self._undo_stack = []
+
+        # Zobrist hash of the current position, updated by every change to the position
+        self._position_hash = self._compute_position_hash()
+
+        # Material and piece-square score of the pieces on the board from White's point of view, updated by every change
+        # to the board so that evaluate does not need to look at the squares
+        self._piece_square_score = self._compute_piece_square_score()
+
+        # Reason the most recent rejected make_move or enter_fairy_piece call returned False (see REJECTION_REASONS)
+        self._last_rejection = None
+
+        # The optional draw rules: how many times each position hash has occurred (None while the rules are off), and
+        # the number of turns since the last capture
+        self._position_counts = None
+        self._plies_since_capture = 0
+        self._no_capture_limit = no_capture_limit
+        if draw_rules is True:
+            self.set_draw_rules(True, no_capture_limit)
 
     def get_game_state(self):
         """Return the game state attribute"""
 
         return self._game_state
 
+    def get_backend(self):
+        """Returns the board backend the game runs on, one of BACKENDS"""
+
+        if self._bitboards is None:
+            return 'objects'
+        return 'bitboard'
+
+    def get_turn(self):
+        """Returns the color of the player whose turn it is - either 'WHITE' or 'BLACK'"""
+
+        if self._white_turn is True:
+            return 'WHITE'
+        return 'BLACK'
+
+    def has_draw_rules(self):
+        """Returns True if the game can end in a draw by repetition or for lack of captures"""
+
+        return self._position_counts is not None
+
+    def set_draw_rules(self, draw_rules, no_capture_limit=NO_CAPTURE_LIMIT):
+        """
+        Turns the optional draw rules on (draw_rules True) or off.  While they are on, the game state becomes 'DRAW'
+        when the current position (judged by position_hash, so the player to move, reserves and power pieces taken
+        counts must also match) occurs for the REPETITION_LIMIT time, or when no_capture_limit turns in a row have been
+        made without a capture; a no_capture_limit of None leaves out the second rule.  Turning the rules on starts the
+        position history and the turn count at the current position, and each turn updates them in constant time
+        """
+
+        self._no_capture_limit = no_capture_limit
+        self._plies_since_capture = 0
+        if draw_rules is True:
+            self._position_counts = {self._position_hash: 1}
+        else:
+            self._position_counts = None
+
+    def get_repetition_count(self):
+        """
+        Returns how many times the current position has occurred since the draw rules were turned on, or None if they
+        are off
+        """
+
+        if self._position_counts is None:
+            return None
+        return self._position_counts.get(self._position_hash, 0)
+
+    def get_plies_since_capture(self):
+        """Returns the number of turns made since the last capture while the draw rules were on"""
+
+        return self._plies_since_capture
+
+    def get_last_rejection(self):
+        """
+        Returns the reason the most recent make_move or enter_fairy_piece call that returned False gave for rejecting
+        the turn, one of REJECTION_REASONS, or None if no turn has been rejected.  Accepted turns do not clear it, so it
+        describes the latest call only when that call returned False
+        """
+
+        return self._last_rejection
+
+    def get_power_pieces_taken(self, color):
+        """
+        Takes in a color ('WHITE' or 'BLACK') and returns how many of that player's lost power pieces have not yet been
+        replaced by a fairy piece.  The player may enter a fairy piece while this is greater than zero
+        """
+
+        if color == 'WHITE':
+            return self._power_pieces_taken_white
+        return self._power_pieces_taken_black
+
+    def attackers_of(self, location, color):
+        """
+        Takes in a location on the board and a color ('WHITE' or 'BLACK') and returns a list of the locations of that
+        player's pieces that attack the square, meaning they could capture a piece of the opponent's standing on it.
+        The square's own contents do not matter.  Returns None if the location or color is not valid
+        """
+
+        if location not in self._board or color not in COLOR_NAMES:
+            return None
+
+        return [SQUARE_NAMES[index] for index in self._attacker_indexes(self._board[location].get_index(),
+                                                                        COLOR_CODES[color], False)]
+
+    def is_attacked(self, location, color):
+        """
+        Takes in a location on the board and a color ('WHITE' or 'BLACK') and returns True if any of that player's
+        pieces attack the square, or False if none do.  Returns None if the location or color is not valid
+        """
+
+        if location not in self._board or color not in COLOR_NAMES:
+            return None
+
+        return len(self._attacker_indexes(self._board[location].get_index(), COLOR_CODES[color], True)) > 0
+
+    def _attacker_indexes(self, index, color, stop_at_first):
+        """
+        Takes in a square index and a color code and returns a list of the indexes of that color's pieces attacking
+        the square.  If stop_at_first is True the list holds at most one attacker, which is all is_attacked needs
+        """
+
+        if self._bitboards is not None:
+            return self._bitboards.attacker_indexes(index, color, stop_at_first)
+
+        attackers = []
+        squares = self._squares
+        colors = self._square_colors
+        offset = 8 * color
+
+        # Pawns, Knights and the King attack from fixed squares, so only the squares in their tables are checked
+        for table, code in ((PAWN_ATTACKERS[color], PAWN + offset), (KNIGHT_TARGETS, KNIGHT + offset),
+                            (KING_TARGETS, KING + offset)):
+            for source in table[index]:
+                if colors[source] == color and squares[source].get_piece().get_code() == code:
+                    attackers.append(source)
+                    if stop_at_first is True:
+                        return attackers
+
+        # Along each ray only the first piece can attack, and only if it slides back along that ray
+        for ray, codes in SLIDING_ATTACKERS[color][index]:
+            for source in ray:
+                if colors[source] is None:
+                    continue
+                if colors[source] == color and squares[source].get_piece().get_code() in codes:
+                    attackers.append(source)
+                    if stop_at_first is True:
+                        return attackers
+                break
+
+        return attackers
+
+    def is_fairy_piece_available(self, identity_of_piece):
+        """
+        Takes in the identity of a fairy piece ('F', 'H', 'f' or 'h') and returns True if it is still in its player's
+        reserve, waiting to enter the board
+        """
+
+        return self._fairy_pieces[identity_of_piece].is_available()
+
     def make_move(self, start_location, end_location):
         """
         Takes in two locations on the board and determines whether the proposed move is valid.  If not, returns False.
@@ -636,10 +1037,12 @@ class ChessVar:
 
         # Confirm that start and end locations are valid squares.  If not, return False
         if start_location not in self._board or end_location not in self._board:
+            self._last_rejection = 'OFF_BOARD'
             return False
 
         # Confirm that game is not over yet.  If it is, return False
         if self._game_state != 'UNFINISHED':
+            self._last_rejection = 'GAME_OVER'
             return False
 
         # Set variables to the value of the three relevant objects - start square, end square, and piece
@@ -649,78 +1052,121 @@ class ChessVar:
 
         # Confirm that start location is not emtpy.  If it is, return False
         if piece_object.is_empty() is True:
+            self._last_rejection = 'NO_PIECE'
             return False
 
         # Confirm that start location contains player's piece.  If not, return False
-        if ((self._white_turn is True and piece_object.get_color() != 'WHITE') or
-                (self._white_turn is False and piece_object.get_color() != 'BLACK')):
+        if ((self._white_turn is True and piece_object.get_color_code() != WHITE) or
+                (self._white_turn is False and piece_object.get_color_code() != BLACK)):
+            self._last_rejection = 'WRONG_COLOR'
             return False
 
         # Confirm that player making move does not have a piece in the end location.  If he or she does, return False
         if (end_square_object.get_piece().is_empty() is False and
-                end_square_object.get_piece().get_color() == piece_object.get_color()):
+                end_square_object.get_piece().get_color_code() == piece_object.get_color_code()):
+            self._last_rejection = 'OWN_PIECE_TARGET'
+            return False
+
+        # With the bitboard backend the bitboards decide whether the piece can reach the end location
+        if self._bitboards is not None:
+            rejection = self._bitboards.move_rejection(piece_object.get_color_code(), piece_object.get_code(),
+                                                       start_square_object.get_index(), end_square_object.get_index())
+            if rejection is not None:
+                self._last_rejection = rejection
+                return False
+            self._move_piece(start_square_object, end_square_object)
+            return True
+
+        # Look up the squares between the start and end locations.  Every piece but the Knight moves along a row, column
+        # or diagonal, so for any other pair of squares return False without asking the piece
+        between_squares = BETWEEN[start_square_object.get_index()][end_square_object.get_index()]
+        if between_squares is None and piece_object.get_kind() != KNIGHT:
+            self._last_rejection = 'ILLEGAL_SHAPE'
             return False
 
         # Call is_valid_move method for the relevant piece object to confirm that move is legal.  If not, return False
         if piece_object.is_movement_acceptable(start_square_object, end_square_object) is False:
+            self._last_rejection = 'ILLEGAL_SHAPE'
             return False
 
         # Determine whether requested move illegally jumps over another piece.  If so, return False
-        if (piece_object.get_piece_name() != 'KNIGHT' and
-                (abs(end_square_object.get_row() - start_square_object.get_row()) > 1 or
-                 abs(end_square_object.get_column() - start_square_object.get_column()) > 1)):
-
-            # Set variables that will be used to check the squares located between the start and end locations
-            test_square_row = start_square_object.get_row()
-            test_square_column = start_square_object.get_column()
-            target_square_row = end_square_object.get_row()
-            target_square_column = end_square_object.get_column()
-
-            # Iterate through the squares between the start and end locations, checking each square to confirm its empty
-            while test_square_row != target_square_row or test_square_column != target_square_column:
-
-                # Adjust the test square coordinates so that it is one square closer to target square
-                if target_square_row > test_square_row:
-                    test_square_row += 1
-                if target_square_row < test_square_row:
-                    test_square_row -= 1
-                if target_square_column > test_square_column:
-                    test_square_column += 1
-                if target_square_column < test_square_column:
-                    test_square_column -= 1
-
-                # Determine whether test square made it to the target square without jumping any pieces
-                if test_square_row == target_square_row and test_square_column == target_square_column:
-                    continue
-
-                # Determine whether test square is empty, if not return False
-                if self.is_square_empty(test_square_row, test_square_column) is False:
+        if piece_object.get_kind() != KNIGHT:
+            square_colors = self._square_colors
+            for index in between_squares:
+                if square_colors[index] is not None:
+                    self._last_rejection = 'BLOCKED_PATH'
                     return False
 
         # If all of the above conditions are met, the proposed move is valid.  Continue with the proposed move.
+        self._move_piece(start_square_object, end_square_object)
+
+        return True
+
+    def _move_piece(self, start_square_object, end_square_object):
+        """
+        Moves the piece on the start square to the end square without checking that the move is legal: captures any
+        opponent's piece on the end square, updates the power pieces taken counts, game state and position hash, and
+        passes the turn
+        """
+
+        piece_object = start_square_object.get_piece()
+        is_capture = False
+
         # Determine whether one of the opponent's pieces is in the end location.  If so, capture the opponent's piece
-        if ((self._white_turn is True and end_square_object.get_piece().get_color() == 'BLACK') or
-                (self._white_turn is False and end_square_object.get_piece().get_color() == 'WHITE')):
+        if ((self._white_turn is True and end_square_object.get_piece().get_color_code() == BLACK) or
+                (self._white_turn is False and end_square_object.get_piece().get_color_code() == WHITE)):
+            is_capture = True
+
+            # Remove the captured piece from the position hash
+            self._position_hash ^= ZOBRIST_PIECE_KEYS[end_square_object.get_piece().get_symbol()][
+                end_square_object.get_index()]
 
             # If the captured piece is a power piece, add one to the opponent's power pieces taken variable
             if end_square_object.get_piece().is_power_piece() is True:
-                if end_square_object.get_piece().get_color() == 'BLACK':
+                if end_square_object.get_piece().get_color_code() == BLACK:
+                    keys = ZOBRIST_POWER_PIECES_TAKEN_KEYS[BLACK]
+                    self._position_hash ^= keys[self._power_pieces_taken_black] ^ keys[
+                        self._power_pieces_taken_black + 1]
                     self._power_pieces_taken_black += 1
                 else:
+                    keys = ZOBRIST_POWER_PIECES_TAKEN_KEYS[WHITE]
+                    self._position_hash ^= keys[self._power_pieces_taken_white] ^ keys[
+                        self._power_pieces_taken_white + 1]
                     self._power_pieces_taken_white += 1
 
             # If the captured piece is the King, update date game state to 'WHITE_WON' or 'BLACK_WON' as appropriate
-            if end_square_object.get_piece().get_piece_name() == 'KING':
-                if end_square_object.get_piece().get_color() == 'BLACK':
+            if end_square_object.get_piece().get_kind() == KING:
+                if end_square_object.get_piece().get_color_code() == BLACK:
                     self._game_state = 'WHITE_WON'
                 else:
                     self._game_state = 'BLACK_WON'
 
+        # Update the score for the captured piece (nothing for an empty square) and the moved piece
+        piece_square_scores = PIECE_SQUARE_SCORES[piece_object.get_code()]
+        self._piece_square_score += (piece_square_scores[end_square_object.get_index()] -
+                                     piece_square_scores[start_square_object.get_index()] -
+                                     PIECE_SQUARE_SCORES[end_square_object.get_piece().get_code()][
+                                         end_square_object.get_index()])
+
+        # Move the piece on the bitboard backend's copy of the board, before the captured piece's code is overwritten
+        if self._bitboards is not None:
+            self._bitboards.move_piece(start_square_object.get_index(), end_square_object.get_index(),
+                                       piece_object.get_code(), self._piece_codes[end_square_object.get_index()])
+
         # Update the end location square's piece reference to the player's piece
         end_square_object.set_piece(piece_object)
+        self._square_colors[end_square_object.get_index()] = piece_object.get_color_code()
+        self._piece_codes[end_square_object.get_index()] = piece_object.get_code()
 
         # Update the start location square's piece reference to empty
         start_square_object.set_piece(self._empty)
+        self._square_colors[start_square_object.get_index()] = None
+        self._piece_codes[start_square_object.get_index()] = EMPTY_CODE
+
+        # Move the piece in the position hash and pass the turn to the other player
+        piece_keys = ZOBRIST_PIECE_KEYS[piece_object.get_symbol()]
+        self._position_hash ^= (piece_keys[start_square_object.get_index()] ^ piece_keys[end_square_object.get_index()]
+                                ^ ZOBRIST_BLACK_TO_MOVE)
 
         # Toggle the white_turn attribute
         if self._white_turn is True:
@@ -728,7 +1174,9 @@ class ChessVar:
         else:
             self._white_turn = True
 
-        return True
+        # Count the new position toward the optional draw rules
+        if self._position_counts is not None:
+            self._record_position(is_capture)
 
     def enter_fairy_piece(self, identity_of_piece, location):
         """
@@ -739,17 +1187,21 @@ class ChessVar:
 
         # If location is not on board, return False
         if location not in self._board:
+            self._last_rejection = 'OFF_BOARD'
             return False
 
         # If appropriate power_pieces_taken variable is 0, return False
         if self._white_turn is True and self._power_pieces_taken_white == 0:
+            self._last_rejection = 'NO_POWER_PIECE_TAKEN'
             return False
 
         if self._white_turn is False and self._power_pieces_taken_black == 0:
+            self._last_rejection = 'NO_POWER_PIECE_TAKEN'
             return False
 
         # Confirm that game is not over yet.  If it is, return False
         if self._game_state != 'UNFINISHED':
+            self._last_rejection = 'GAME_OVER'
             return False
 
         # Set variables to the value of the two relevant objects - piece and location
@@ -760,6 +1212,7 @@ class ChessVar:
             elif identity_of_piece == 'F':
                 new_piece_object = self._falcon_w
             else:
+                self._last_rejection = 'WRONG_COLOR' if identity_of_piece in ('f', 'h') else 'NOT_FAIRY_PIECE'
                 return False
 
         # Set Black Fairy Piece
@@ -769,6 +1222,7 @@ class ChessVar:
             elif identity_of_piece == 'f':
                 new_piece_object = self._falcon_b
             else:
+                self._last_rejection = 'WRONG_COLOR' if identity_of_piece in ('F', 'H') else 'NOT_FAIRY_PIECE'
                 return False
 
         # Set variable for new_square_object
@@ -776,118 +1230,781 @@ class ChessVar:
 
         # If given piece's available attribute is False, return False
         if new_piece_object.is_available() is False:
+            self._last_rejection = 'NOT_IN_RESERVE'
             return False
 
         # If given location is not in one of the two rows in may enter, return False
         if self._white_turn is True and new_square_object.get_row() > 2:
+            self._last_rejection = 'WRONG_ROW'
             return False
 
         if self._white_turn is False and new_square_object.get_row() < 7:
+            self._last_rejection = 'WRONG_ROW'
             return False
 
         # If given location is already occupied by a piece, return False
         if self.is_square_empty(new_square_object.get_row(), new_square_object.get_column()) is False:
+            self._last_rejection = 'SQUARE_OCCUPIED'
             return False
 
         # If all of the above conditions are met, the proposed fairy piece addition is valid.  Proceed with move.
+        self._place_fairy_piece(new_piece_object, new_square_object)
+
+        return True
+
+    def _place_fairy_piece(self, new_piece_object, new_square_object):
+        """
+        Enters the given fairy piece on the given square without checking that the entry is legal: removes it from the
+        reserve, uses up one of the player's power pieces taken, updates the position hash, and passes the turn
+        """
+
         # Update location square's piece reference to the given fairy piece
         new_square_object.set_piece(new_piece_object)
+        self._square_colors[new_square_object.get_index()] = new_piece_object.get_color_code()
+        self._piece_codes[new_square_object.get_index()] = new_piece_object.get_code()
+        self._piece_square_score += PIECE_SQUARE_SCORES[new_piece_object.get_code()][new_square_object.get_index()]
+        if self._bitboards is not None:
+            self._bitboards.set_square(new_square_object.get_index(), EMPTY_CODE, new_piece_object.get_code())
 
         # Set Fairy Piece's available attribute to False
         new_piece_object.set_unavailable()
 
         # Subtract one (1) from player's power_pieces_ taken variable
         if self._white_turn is True:
+            keys = ZOBRIST_POWER_PIECES_TAKEN_KEYS[WHITE]
+            self._position_hash ^= keys[self._power_pieces_taken_white] ^ keys[self._power_pieces_taken_white - 1]
             self._power_pieces_taken_white -= 1
         else:
+            keys = ZOBRIST_POWER_PIECES_TAKEN_KEYS[BLACK]
+            self._position_hash ^= keys[self._power_pieces_taken_black] ^ keys[self._power_pieces_taken_black - 1]
             self._power_pieces_taken_black -= 1
 
+        # Update the position hash for the piece leaving the reserve, entering the board, and the change of turn
+        symbol = new_piece_object.get_symbol()
+        self._position_hash ^= (ZOBRIST_FAIRY_AVAILABLE_KEYS[symbol] ^
+                                ZOBRIST_PIECE_KEYS[symbol][new_square_object.get_index()] ^ ZOBRIST_BLACK_TO_MOVE)
+
         # Toggle white_turn attribute
         if self._white_turn is True:
             self._white_turn = False
         else:
             self._white_turn = True
 
+        # Count the new position toward the optional draw rules.  An entry is not a capture
+        if self._position_counts is not None:
+            self._record_position(False)
+
+    def _record_position(self, is_capture):
+        """
+        Adds the position just reached to the draw rules' history, after a turn that was a capture if is_capture is
+        True, and declares a draw if the position has now occurred REPETITION_LIMIT times or the turns without a
+        capture have reached the limit.  A King capture stands even if the turn also meets a draw rule
+        """
+
+        if is_capture is True:
+            self._plies_since_capture = 0
+        else:
+            self._plies_since_capture += 1
+
+        count = self._position_counts.get(self._position_hash, 0) + 1
+        self._position_counts[self._position_hash] = count
+
+        if self._game_state == 'UNFINISHED' and (
+                count >= REPETITION_LIMIT or
+                (self._no_capture_limit is not None and self._plies_since_capture >= self._no_capture_limit)):
+            self._game_state = 'DRAW'
+
+    def replay(self, moves, trusted=False):
+        """
+        Takes in a list of turns, each a tuple in the format of generate_legal_moves, and plays them in order from the
+        current position.  Returns the index of the first turn that was not legal (play stops there), or None if every
+        turn was played.  If trusted is True the turns are known to be legal, so they are applied without any checks;
+        an illegal turn would then leave the game in an invalid position
+        """
+
+        if trusted is True:
+            board = self._board
+            fairy_pieces = self._fairy_pieces
+            for first, second in moves:
+                if len(first) == 1:
+                    self._place_fairy_piece(fairy_pieces[first], board[second])
+                else:
+                    self._move_piece(board[first], board[second])
+            return None
+
+        for move_number, (first, second) in enumerate(moves):
+            if len(first) == 1:
+                move_result = self.enter_fairy_piece(first, second)
+            else:
+                move_result = self.make_move(first, second)
+            if move_result is False:
+                return move_number
+        return None
+
+    def push_move(self, start_location, end_location):
+        """
+        Makes a move exactly like make_move and returns the same result.  If the move is made, the information needed to
+        take it back is saved so that pop_move can restore the previous position without copying the game.
+        """
+
+        if start_location not in self._board or end_location not in self._board:
+            return False
+
+        start_square_object = self._board[start_location]
+        end_square_object = self._board[end_location]
+        undo_record = (start_square_object, end_square_object, start_square_object.get_piece(),
+                       end_square_object.get_piece(), self._power_pieces_taken_white, self._power_pieces_taken_black,
+                       self._game_state, self._position_hash, self._piece_square_score, self._plies_since_capture)
+
+        if self.make_move(start_location, end_location) is False:
+            return False
+
+        self._undo_stack.append(undo_record)
+        return True
+
+    def push_fairy_piece(self, identity_of_piece, location):
+        """
+        Enters a fairy piece exactly like enter_fairy_piece and returns the same result.  If the piece enters, the
+        information needed to take it back is saved so that pop_move can return the piece to the player's reserve.
+        """
+
+        if location not in self._board:
+            return False
+
+        # A start square of None marks the record as a fairy piece entry
+        square_object = self._board[location]
+        undo_record = (None, square_object, None, square_object.get_piece(), self._power_pieces_taken_white,
+                       self._power_pieces_taken_black, self._game_state, self._position_hash, self._piece_square_score,
+                       self._plies_since_capture)
+
+        if self.enter_fairy_piece(identity_of_piece, location) is False:
+            return False
+
+        self._undo_stack.append(undo_record)
+        return True
+
+    def push_turn(self, turn):
+        """
+        Takes in a turn as a tuple in the format returned by generate_legal_moves and plays it with push_move or
+        push_fairy_piece, as appropriate.  Returns the result of that call
+        """
+
+        if len(turn[0]) == 1:
+            return self.push_fairy_piece(turn[0], turn[1])
+        return self.push_move(turn[0], turn[1])
+
+    def pop_move(self):
+        """
+        Takes back the most recent turn made with push_move or push_fairy_piece, restoring the board, the power pieces
+        taken counts, fairy piece availability, game state and turn.  Returns False if there is no turn to take back.
+        """
+
+        if not self._undo_stack:
+            return False
+
+        (start_square_object, end_square_object, piece_object, replaced_piece_object, power_pieces_taken_white,
+         power_pieces_taken_black, game_state, position_hash, piece_square_score,
+         plies_since_capture) = self._undo_stack.pop()
+
+        # Take the position being left out of the draw rules' history.  Positions from before the rules were turned on
+        # were never counted, so there is nothing to take out for them
+        position_counts = self._position_counts
+        if position_counts is not None:
+            count = position_counts.get(self._position_hash, 0)
+            if count == 1:
+                del position_counts[self._position_hash]
+            elif count > 1:
+                position_counts[self._position_hash] = count - 1
+
+        # Put the pieces back on the bitboard backend's copy of the board, while the end square still holds its code
+        if self._bitboards is not None:
+            if start_square_object is not None:
+                self._bitboards.set_square(start_square_object.get_index(), EMPTY_CODE, piece_object.get_code())
+            self._bitboards.set_square(end_square_object.get_index(), self._piece_codes[end_square_object.get_index()],
+                                       replaced_piece_object.get_code())
+
+        # A fairy piece entry is taken back by returning the piece to the reserve
+        if start_square_object is None:
+            end_square_object.get_piece().set_available()
+        else:
+            start_square_object.set_piece(piece_object)
+            self._square_colors[start_square_object.get_index()] = piece_object.get_color_code()
+            self._piece_codes[start_square_object.get_index()] = piece_object.get_code()
+
+        # Put back whatever was on the end square before the turn (a captured piece or the empty object)
+        end_square_object.set_piece(replaced_piece_object)
+        self._square_colors[end_square_object.get_index()] = replaced_piece_object.get_color_code()
+        self._piece_codes[end_square_object.get_index()] = replaced_piece_object.get_code()
+
+        self._power_pieces_taken_white = power_pieces_taken_white
+        self._power_pieces_taken_black = power_pieces_taken_black
+        self._game_state = game_state
+        self._position_hash = position_hash
+        self._piece_square_score = piece_square_score
+        self._plies_since_capture = plies_since_capture
+        self._white_turn = not self._white_turn
+
         return True
 
+    def position_hash(self):
+        """
+        Returns a 64-bit Zobrist hash of the current position.  The hash covers the piece on every square, whose turn
+        it is, each player's power pieces taken count and which fairy pieces are still in reserve, so two positions with
+        the same hash have the same legal moves (barring an unlikely collision)
+        """
+
+        return self._position_hash
+
+    def _compute_position_hash(self):
+        """Computes the Zobrist hash of the current position from scratch, without using the incrementally kept value"""
+
+        position_hash = 0
+        for square in self._squares:
+            piece_object = square.get_piece()
+            if piece_object.is_empty() is False:
+                position_hash ^= ZOBRIST_PIECE_KEYS[piece_object.get_symbol()][square.get_index()]
+
+        if self._white_turn is False:
+            position_hash ^= ZOBRIST_BLACK_TO_MOVE
+
+        position_hash ^= ZOBRIST_POWER_PIECES_TAKEN_KEYS[WHITE][self._power_pieces_taken_white]
+        position_hash ^= ZOBRIST_POWER_PIECES_TAKEN_KEYS[BLACK][self._power_pieces_taken_black]
+
+        for fairy_piece in (self._falcon_w, self._hunter_w, self._falcon_b, self._hunter_b):
+            if fairy_piece.is_available() is True:
+                position_hash ^= ZOBRIST_FAIRY_AVAILABLE_KEYS[fairy_piece.get_symbol()]
+
+        return position_hash
+
+    def evaluate(self):
+        """
+        Returns a static score for the current position, in hundredths of a pawn, from the point of view of the player
+        whose turn it is: positive if they are ahead.  The score is the material and piece-square score of the pieces
+        on the board, which is kept up to date as the position changes, plus the value of each player's fairy pieces
+        still in reserve, so it takes the same time however many pieces are on the board
+        """
+
+        score = self._piece_square_score + self._reserve_score(
+            self._falcon_w, self._hunter_w, self._power_pieces_taken_white) - self._reserve_score(
+            self._falcon_b, self._hunter_b, self._power_pieces_taken_black)
+
+        if self._white_turn is True:
+            return score
+        return -score
+
+    @staticmethod
+    def _reserve_score(falcon, hunter, power_pieces_taken):
+        """
+        Returns the value of one player's fairy pieces still in reserve.  Each lost power piece that has not been
+        replaced lets one fairy piece enter, so that many reserve pieces count as ready and the rest as waiting
+        """
+
+        in_reserve = (falcon.is_available() is True) + (hunter.is_available() is True)
+        ready = min(in_reserve, power_pieces_taken)
+        return ready * RESERVE_READY_VALUE + (in_reserve - ready) * RESERVE_WAITING_VALUE
+
+    def _compute_piece_square_score(self):
+        """Computes the material and piece-square score of the board from scratch, from White's point of view"""
+
+        return sum(PIECE_SQUARE_SCORES[code][index] for index, code in enumerate(self._piece_codes))
+
+    def generate_legal_moves(self):
+        """
+        Returns a list of every legal turn for the player whose turn it is.  Each turn is a tuple holding the two
+        arguments that would be passed to make it: (start_location, end_location) for make_move, or
+        (identity_of_piece, location) for enter_fairy_piece.  A fairy piece entry can be recognized because its first
+        item is a single letter.  Returns an empty list if the game is over.
+        """
+
+        legal_moves = []
+
+        # No moves can be made once the game is over
+        if self._game_state != 'UNFINISHED':
+            return legal_moves
+
+        if self._white_turn is True:
+            color, opponent = WHITE, BLACK
+        else:
+            color, opponent = BLACK, WHITE
+
+        # With the bitboard backend the bitboards list the piece moves
+        if self._bitboards is not None:
+            legal_moves = self._bitboards.generate_moves(color)
+            self._add_fairy_entries(legal_moves)
+            return legal_moves
+
+        # The tables are looked up many times per call, so they are bound to local names
+        append = legal_moves.append
+        extend = legal_moves.extend
+        codes = self._piece_codes
+        colors = self._square_colors
+        move_pairs = MOVE_PAIRS
+        step_targets = STEP_TARGETS
+        sliding_rays = SLIDING_RAYS
+        pawn_moves = PAWN_MOVES[color]
+
+        # The player's pieces are found by searching a byte string that marks them, rather than by checking all 64
+        # squares in turn
+        own_pieces = codes.translate(OWN_PIECE_TABLES[color])
+        index = own_pieces.find(1)
+        while index >= 0:
+            moves_from = move_pairs[index]
+            piece_code = codes[index]
+
+            # A Pawn moves forward onto empty squares (two squares from its starting row) and captures diagonally
+            if piece_code & 7 == PAWN:
+                forward_target, double_target, capture_targets = pawn_moves[index]
+                if forward_target is not None and colors[forward_target] is None:
+                    append(moves_from[forward_target])
+                    if double_target is not None and colors[double_target] is None:
+                        append(moves_from[double_target])
+                for target in capture_targets:
+                    if colors[target] == opponent:
+                        append(moves_from[target])
+
+            # A Knight or King may move to any square in its table that does not hold one of the player's pieces
+            elif step_targets[piece_code] is not None:
+                extend([moves_from[target] for target in step_targets[piece_code][index] if colors[target] != color])
+
+            # Sliding pieces travel along each of their rays until they reach a piece, capturing it if it is the
+            # opponent's
+            else:
+                for ray in sliding_rays[piece_code][index]:
+                    for target in ray:
+                        target_color = colors[target]
+                        if target_color is None:
+                            append(moves_from[target])
+                            continue
+                        if target_color != color:
+                            append(moves_from[target])
+                        break
+
+            index = own_pieces.find(1, index + 1)
+
+        self._add_fairy_entries(legal_moves)
+        return legal_moves
+
+    def _add_fairy_entries(self, legal_moves):
+        """
+        Adds to the given list every fairy piece entry the player whose turn it is may make: on any empty square of
+        the player's two home ranks, once a power piece has been lost
+        """
+
+        colors = self._square_colors
+        if self._white_turn is True:
+            power_pieces_taken = self._power_pieces_taken_white
+            fairy_pieces = (self._falcon_w, self._hunter_w)
+            home_squares = range(0, 16)
+        else:
+            power_pieces_taken = self._power_pieces_taken_black
+            fairy_pieces = (self._falcon_b, self._hunter_b)
+            home_squares = range(48, 64)
+
+        if power_pieces_taken > 0:
+            for fairy_piece in fairy_pieces:
+                if fairy_piece.is_available() is False:
+                    continue
+                entry_pairs = FAIRY_ENTRY_PAIRS[fairy_piece.get_symbol()]
+                legal_moves.extend([entry_pairs[index] for index in home_squares if colors[index] is None])
+
+    def generate_captures(self):
+        """
+        Returns a list of every legal move for the player whose turn it is that captures one of the opponent's pieces,
+        as (start_location, end_location) tuples in the same order generate_legal_moves would list them.  Fairy piece
+        entries never capture, so none are included.  Returns an empty list if the game is over
+        """
+
+        captures = []
+
+        # No moves can be made once the game is over
+        if self._game_state != 'UNFINISHED':
+            return captures
+
+        if self._white_turn is True:
+            color, opponent = WHITE, BLACK
+        else:
+            color, opponent = BLACK, WHITE
+
+        # With the bitboard backend the bitboards list the captures
+        if self._bitboards is not None:
+            return self._bitboards.generate_captures(color)
+
+        # The tables are looked up many times per call, so they are bound to local names
+        append = captures.append
+        extend = captures.extend
+        codes = self._piece_codes
+        colors = self._square_colors
+        move_pairs = MOVE_PAIRS
+        step_targets = STEP_TARGETS
+        sliding_rays = SLIDING_RAYS
+        pawn_moves = PAWN_MOVES[color]
+
+        # The player's pieces are found by searching a byte string that marks them, rather than by checking all 64
+        # squares in turn
+        own_pieces = codes.translate(OWN_PIECE_TABLES[color])
+        index = own_pieces.find(1)
+        while index >= 0:
+            moves_from = move_pairs[index]
+            piece_code = codes[index]
+
+            # A Pawn captures only diagonally, on the forward squares one column to either side
+            if piece_code & 7 == PAWN:
+                for target in pawn_moves[index][2]:
+                    if colors[target] == opponent:
+                        append(moves_from[target])
+
+            # A Knight or King captures on any square in its table holding one of the opponent's pieces
+            elif step_targets[piece_code] is not None:
+                extend([moves_from[target] for target in step_targets[piece_code][index] if colors[target] == opponent])
+
+            # Sliding pieces capture the first piece along each of their rays if it is the opponent's
+            else:
+                for ray in sliding_rays[piece_code][index]:
+                    for target in ray:
+                        target_color = colors[target]
+                        if target_color is None:
+                            continue
+                        if target_color != color:
+                            append(moves_from[target])
+                        break
+
+            index = own_pieces.find(1, index + 1)
+
+        return captures
+
+    def perft(self, depth):
+        """
+        Counts the positions reached by playing every sequence of legal turns (moves and fairy piece entries) of the
+        given length from the current position.  A sequence that ends the game early by capturing a King is not
+        extended, so it does not reach the full depth and is not counted.  The position is unchanged afterwards.
+        """
+
+        if depth == 0:
+            return 1
+
+        legal_moves = self.generate_legal_moves()
+        if depth == 1:
+            return len(legal_moves)
+
+        nodes = 0
+        for turn in legal_moves:
+            self.push_turn(turn)
+            nodes += self.perft(depth - 1)
+            self.pop_move()
+        return nodes
+
+    def perft_divide(self, depth):
+        """
+        Returns a dictionary mapping each legal turn in the current position to the perft count of the position it
+        leads to, searched to one less than the given depth.  The values add up to perft(depth)
+        """
+
+        counts = {}
+        for turn in self.generate_legal_moves():
+            self.push_turn(turn)
+            counts[turn] = self.perft(depth - 1)
+            self.pop_move()
+        return counts
+
+    def to_codes(self):
+        """
+        Returns the position as 69 bytes: the piece code on each square in index order (EMPTY_CODE for an empty
+        square), then 1 if White is to move or 0 if not, then 1 or 0 for whether each of the F, H, f and h fairy
+        pieces is in reserve.  This is the input BoardTensor uses to build planes for many positions at once
+        """
+
+        return bytes(self._piece_codes) + bytes((
+            self._white_turn is True, self._falcon_w.is_available() is True, self._hunter_w.is_available() is True,
+            self._falcon_b.is_available() is True, self._hunter_b.is_available() is True))
+
+    def to_planes(self):
+        """
+        Returns the position as PLANE_COUNT feature planes of 64 bytes each, one after another, with every byte 0 or
+        1 (see PLANE_COUNT for the meaning of each plane).  The result can be read as a (21, 8, 8) array of rows and
+        columns, for example with numpy.frombuffer(game.to_planes(), numpy.uint8).reshape(21, 8, 8)
+        """
+
+        codes = bytes(self._piece_codes)
+        planes = [codes.translate(table) for table in PIECE_PLANE_TABLES]
+        for flag in self.to_codes()[64:]:
+            planes.append(bytes((flag,)) * 64)
+        return b''.join(planes)
+
+    def to_fen(self):
+        """Returns a FEN-style string describing the current position, including the fairy piece reserves"""
+
+        # Write every square as its symbol, or '1' if it is empty, then join runs of empty squares into one count
+        board = bytes(self._piece_codes).translate(FEN_SYMBOL_TABLE).decode()
+        rows = '/'.join([board[row * 8:row * 8 + 8] for row in range(7, -1, -1)])
+        for empty_run in FEN_EMPTY_RUNS:
+            rows = rows.replace(empty_run, str(len(empty_run)))
+
+        reserve = ''.join(fairy_piece.get_symbol() for fairy_piece in
+                          (self._falcon_w, self._hunter_w, self._falcon_b, self._hunter_b)
+                          if fairy_piece.is_available() is True)
+
+        return '%s %s %s %d %d' % (rows, 'w' if self._white_turn is True else 'b', reserve or '-',
+                                   self._power_pieces_taken_white, self._power_pieces_taken_black)
+
+    @classmethod
+    def from_fen(cls, fen, backend='objects'):
+        """
+        Takes in a FEN-style string (see STARTING_FEN) and returns a new game on the given backend set up in that
+        position.  The game is over if either King is missing from the board.  Raises ValueError if the string does not
+        describe a valid position, including a power pieces taken count above MAX_POWER_PIECES_TAKEN
+        """
+
+        fields = fen.split()
+        if len(fields) != 5:
+            raise ValueError('FEN must have 5 fields: %r' % fen)
+        board_field, turn_field, reserve_field, taken_white_field, taken_black_field = fields
+
+        rows = board_field.split('/')
+        if len(rows) != 8:
+            raise ValueError('FEN board must have 8 rows: %r' % fen)
+
+        symbols = []
+        for row_text in reversed(rows):
+            row_symbols = []
+            for character in row_text:
+                if character.isdigit():
+                    row_symbols.extend(' ' * int(character))
+                elif character in PIECE_SYMBOLS:
+                    row_symbols.append(character)
+                else:
+                    raise ValueError('unknown piece %r in FEN: %r' % (character, fen))
+            if len(row_symbols) != 8:
+                raise ValueError('FEN row %r does not have 8 squares' % row_text)
+            symbols.extend(row_symbols)
+
+        if turn_field not in ('w', 'b'):
+            raise ValueError('FEN turn must be w or b: %r' % fen)
+        if reserve_field != '-' and (not set(reserve_field) <= set('FHfh') or
+                                     len(set(reserve_field)) != len(reserve_field)):
+            raise ValueError('FEN reserve must list fairy pieces F, H, f, h or be -: %r' % fen)
+        if not taken_white_field.isdigit() or not taken_black_field.isdigit():
+            raise ValueError('FEN power pieces taken counts must be numbers: %r' % fen)
+
+        game = cls(backend=backend)
+        game._load_position(symbols, turn_field == 'w', reserve_field.replace('-', ''), int(taken_white_field),
+                            int(taken_black_field))
+        return game
+
+    def to_packed(self):
+        """
+        Returns the current position packed into at most 28 bytes: two bytes for the turn, fairy reserves and power
+        pieces taken counts, an 8-byte occupancy bitboard, and a 4-bit code for each occupied square in index order
+        """
+
+        state = 0 if self._white_turn is True else 1
+        for bit, fairy_piece in enumerate((self._falcon_w, self._hunter_w, self._falcon_b, self._hunter_b)):
+            if fairy_piece.is_available() is True:
+                state |= 2 << bit
+
+        # Each power pieces taken count is at most MAX_POWER_PIECES_TAKEN, so it fits in three bits
+        state |= self._power_pieces_taken_white << 5
+        state |= self._power_pieces_taken_black << 8
+
+        occupancy = 0
+        codes = []
+        for square in self._squares:
+            symbol = square.get_piece().get_symbol()
+            if symbol != ' ':
+                occupancy |= 1 << square.get_index()
+                codes.append(PIECE_SYMBOLS.index(symbol))
+        if len(codes) % 2 == 1:
+            codes.append(0)
+
+        packed_codes = bytes(codes[position] << 4 | codes[position + 1] for position in range(0, len(codes), 2))
+        return state.to_bytes(2, 'little') + occupancy.to_bytes(8, 'little') + packed_codes
+
+    @classmethod
+    def from_packed(cls, data, backend='objects'):
+        """
+        Takes in bytes produced by to_packed and returns a new game on the given backend set up in that position.
+        Raises ValueError if the bytes are not a packed position: unused state bits set, a length that does not match
+        the number of occupied squares, a nonzero padding code, or a fairy piece both on the board and in reserve
+        """
+
+        if not isinstance(data, (bytes, bytearray)) or len(data) < 10:
+            raise ValueError('packed position must be at least 10 bytes')
+        state = int.from_bytes(data[0:2], 'little')
+        occupancy = int.from_bytes(data[2:10], 'little')
+
+        # The state uses eleven bits (turn, four reserve flags and two three-bit counts), and each occupied square has
+        # one four-bit code, two to a byte
+        if state >> 11:
+            raise ValueError('packed position has unused state bits set')
+        occupied_count = bin(occupancy).count('1')
+        if len(data) != 10 + (occupied_count + 1) // 2:
+            raise ValueError('packed position has %d bytes for %d occupied squares' % (len(data), occupied_count))
+        if occupied_count % 2 == 1 and data[-1] & 15:
+            raise ValueError('packed position has a nonzero padding code')
+
+        codes = []
+        for byte in data[10:]:
+            codes.append(byte >> 4)
+            codes.append(byte & 15)
+
+        symbols = []
+        code_position = 0
+        for index in range(64):
+            if occupancy >> index & 1:
+                symbols.append(PIECE_SYMBOLS[codes[code_position]])
+                code_position += 1
+            else:
+                symbols.append(' ')
+
+        reserve = ''.join(symbol for bit, symbol in enumerate('FHfh') if state & (2 << bit))
+        game = cls(backend=backend)
+        game._load_position(symbols, state & 1 == 0, reserve, state >> 5 & 7, state >> 8 & 7)
+        return game
+
+    def snapshot(self):
+        """
+        Returns the current position as an immutable bytes object of SNAPSHOT.size bytes, for restore or from_snapshot
+        to return to later.  Taking one copies only the piece codes and a few counts, so it takes about a microsecond,
+        and being immutable, one snapshot can be shared by any number of variations that branch from it.  The turns
+        that led to the position (for pop_move) are not included
+        """
+
+        return SNAPSHOT.pack(self._piece_codes, self._white_turn is True, self._falcon_w.is_available() is True,
+                             self._hunter_w.is_available() is True, self._falcon_b.is_available() is True,
+                             self._hunter_b.is_available() is True, self._power_pieces_taken_white,
+                             self._power_pieces_taken_black, GAME_STATES.index(self._game_state), self._position_hash,
+                             self._piece_square_score)
+
+    def restore(self, snapshot):
+        """
+        Takes in bytes returned by snapshot (from this game or any other) and returns the game to that position.  Only
+        the squares that differ from the current position are changed, and the position hash and score are copied
+        rather than recomputed.  Clears the undo stack.  Raises ValueError if the bytes are not a snapshot
+        """
+
+        if not isinstance(snapshot, bytes) or len(snapshot) != SNAPSHOT.size:
+            raise ValueError('not a position snapshot')
+        (codes, white_turn, falcon_w, hunter_w, falcon_b, hunter_b, power_pieces_taken_white, power_pieces_taken_black,
+         game_state, position_hash, piece_square_score) = SNAPSHOT.unpack(snapshot)
+
+        # Only the squares whose codes change are visited
+        piece_codes = self._piece_codes
+        if piece_codes != codes:
+            # The piece object for each code.  Fairy pieces belong to the game, every other piece is shared
+            fairy_pieces = self._fairy_pieces
+            code_pieces = [fairy_pieces[symbol] if symbol in fairy_pieces else SHARED_PIECES[symbol]
+                           for symbol in PIECE_SYMBOLS]
+            code_pieces.append(self._empty)
+
+            squares = self._squares
+            square_colors = self._square_colors
+            for index in [index for index, old_code, code in zip(range(64), piece_codes, codes) if old_code != code]:
+                piece_object = code_pieces[codes[index]]
+                squares[index].set_piece(piece_object)
+                square_colors[index] = piece_object.get_color_code()
+            piece_codes[:] = codes
+            if self._bitboards is not None:
+                self._bitboards.load(piece_codes)
+
+        for fairy_piece, available in ((self._falcon_w, falcon_w), (self._hunter_w, hunter_w),
+                                       (self._falcon_b, falcon_b), (self._hunter_b, hunter_b)):
+            if available:
+                fairy_piece.set_available()
+            else:
+                fairy_piece.set_unavailable()
+
+        self._white_turn = white_turn == 1
+        self._power_pieces_taken_white = power_pieces_taken_white
+        self._power_pieces_taken_black = power_pieces_taken_black
+        self._game_state = GAME_STATES[game_state]
+        self._position_hash = position_hash
+        self._piece_square_score = piece_square_score
+        self._undo_stack = []
+
+        # The draw rules' history starts again from the restored position
+        if self._position_counts is not None:
+            self.set_draw_rules(True, self._no_capture_limit)
+
+    @classmethod
+    def from_snapshot(cls, snapshot, backend='objects'):
+        """Takes in bytes returned by snapshot and returns a new game on the given backend set up in that position"""
+
+        game = cls(backend=backend)
+        game.restore(snapshot)
+        return game
+
+    def _load_position(self, symbols, white_turn, reserve, power_pieces_taken_white, power_pieces_taken_black):
+        """
+        Replaces the current position with the given one.  symbols holds the piece symbol (or ' ') for each square in
+        index order, and reserve holds the symbols of the fairy pieces still off the board.  Clears the undo stack.
+        Raises ValueError if a fairy piece appears more than once or is both on the board and in reserve, or if a power
+        pieces taken count is outside 0 to MAX_POWER_PIECES_TAKEN
+        """
+
+        if not (0 <= power_pieces_taken_white <= MAX_POWER_PIECES_TAKEN and
+                0 <= power_pieces_taken_black <= MAX_POWER_PIECES_TAKEN):
+            raise ValueError('power pieces taken counts must be from 0 to %d' % MAX_POWER_PIECES_TAKEN)
+
+        fairy_pieces = self._fairy_pieces
+
+        # Every fairy piece starts out of play; those listed in the reserve are made available again below
+        for fairy_piece in fairy_pieces.values():
+            fairy_piece.set_unavailable()
+
+        fairy_pieces_placed = set()
+        for square, symbol in zip(self._squares, symbols):
+            if symbol == ' ':
+                piece_object = self._empty
+            elif symbol in fairy_pieces:
+                if symbol in fairy_pieces_placed or symbol in reserve:
+                    raise ValueError('fairy piece %r appears more than once' % symbol)
+                fairy_pieces_placed.add(symbol)
+                piece_object = fairy_pieces[symbol]
+            else:
+                piece_object = SHARED_PIECES[symbol]
+            square.set_piece(piece_object)
+            self._square_colors[square.get_index()] = piece_object.get_color_code()
+            self._piece_codes[square.get_index()] = piece_object.get_code()
+
+        for symbol in reserve:
+            fairy_pieces[symbol].set_available()
+        if self._bitboards is not None:
+            self._bitboards.load(self._piece_codes)
+
+        self._white_turn = white_turn
+        self._power_pieces_taken_white = power_pieces_taken_white
+        self._power_pieces_taken_black = power_pieces_taken_black
+
+        # A captured King means the game has already been won
+        if 'K' not in symbols:
+            self._game_state = 'BLACK_WON'
+        elif 'k' not in symbols:
+            self._game_state = 'WHITE_WON'
+        else:
+            self._game_state = 'UNFINISHED'
+
+        self._undo_stack = []
+        self._position_hash = self._compute_position_hash()
+        self._piece_square_score = self._compute_piece_square_score()
+
+        # The draw rules' history starts again from the loaded position
+        if self._position_counts is not None:
+            self.set_draw_rules(True, self._no_capture_limit)
+
+    def board_text(self):
+        """Returns the text display_board shows for the current position, as one string"""
+
+        board = bytes(self._piece_codes).translate(DISPLAY_SYMBOL_TABLE).decode()
+        return DISPLAY_TEMPLATE % tuple(''.join([board[row * 8:row * 8 + 8] for row in range(7, -1, -1)]))
+
     def display_board(self):
-        """Displays the chess board"""
-
-        print('\n     Falcon-Hunter Variant of Chess\n')
-        print('     a   b   c   d   e   f   g   h')
-        print('   ---------------------------------')
-        print('8  |', self._board['a8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g8'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h8'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('7  |', self._board['a7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g7'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h7'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('6  |', self._board['a6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g6'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h6'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('5  |', self._board['a5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g5'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h5'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('4  |', self._board['a4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g4'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h4'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('3  |', self._board['a3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g3'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h3'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('2  |', self._board['a2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g2'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h2'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
-        print('1  |', self._board['a1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['b1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['c1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['d1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['e1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['f1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['g1'].get_piece().get_symbol(), end=" ")
-        print('|', self._board['h1'].get_piece().get_symbol(), '|')
-        print('   ---------------------------------')
+        """Displays the chess board.  The whole board is built as one string and written with a single call"""
+
+        print(self.board_text(), end='')
+
+    def get_square_symbol(self, location):
+        """Takes in a location on the board and returns the symbol of the piece on it, or ' ' if the square is empty"""
+
+        return self._board[location].get_piece().get_symbol()
 
     def is_square_empty(self, given_row, given_column):
         """
@@ -895,17 +2012,131 @@ class ChessVar:
         is empty.  Returns True if the square is empty and False if a piece occupies the square
         """
 
-        game_board = self._board
-        for square in game_board.values():
-            if square.get_row() == given_row and square.get_column() == given_column:
-                return square.get_piece().is_empty()
+        # Coordinates that are off the board do not identify a square
+        if not (1 <= given_row <= 8 and 1 <= given_column <= 8):
+            return None
+
+        return self._squares[(given_row - 1) * 8 + given_column - 1].get_piece().is_empty()
+
+
+def replay_game(moves, trusted=False, draw_rules=False):
+    """
+    Plays the given list of turns on a new game with ChessVar.replay and returns a tuple (game state, index of the first
+    illegal turn or None, FEN of the final position).  If draw_rules is True the game is played with the optional draw
+    rules on, as games recorded with them must be
+    """
+
+    game = ChessVar(draw_rules)
+    illegal_move_index = game.replay(moves, trusted)
+    return game.get_game_state(), illegal_move_index, game.to_fen()
+
+
+def replay_many(games, workers=None, trusted=False, chunk_size=64, draw_rules=False):
+    """
+    Takes in an iterable of games, each a list of turns, and replays them across a pool of worker processes (one per
+    core unless workers is given).  Yields the replay_game result for each game, in the same order as the games, as
+    soon as it is ready, so large archives can be streamed without holding every result in memory.  draw_rules is
+    passed on to replay_game
+    """
+
+    if workers == 1:
+        for moves in games:
+            yield replay_game(moves, trusted, draw_rules)
+        return
+
+    replay = functools.partial(replay_game, trusted=trusted, draw_rules=draw_rules)
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap(replay, games, chunk_size):
+            yield result
+
+
+# Positions used to check move generation with perft.  Each is reached by playing the listed turns from the starting
+# position and stores the expected perft count for each depth.  These counts are the regression baseline for any change
+# to the move rules
+PERFT_POSITIONS = {
+    'start': ([], {1: 20, 2: 400, 3: 8902, 4: 197750}),
+    'open-centre': ([('e2', 'e4'), ('e7', 'e5'), ('g1', 'f3'), ('b8', 'c6'), ('f1', 'c4'), ('g8', 'f6')],
+                    {1: 32, 2: 929, 3: 30070, 4: 921999}),
+    'black-reserve': ([('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5'), ('b1', 'c3'), ('d5', 'a2'),
+                       ('a1', 'a2')],
+                      {1: 30, 2: 1042, 3: 32513, 4: 1172790}),
+    'both-reserves': ([('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5'), ('b1', 'c3'), ('d5', 'a2'),
+                       ('a1', 'a2'), ('h', 'd8'), ('g2', 'g3'), ('c8', 'g4'), ('h2', 'h3'), ('g4', 'd1'),
+                       ('e1', 'd1')],
+                      {1: 28, 2: 1194, 3: 34464, 4: 1382669}),
+    'king-exposed': ([('e2', 'e4'), ('f7', 'f6'), ('d1', 'h5'), ('e8', 'f7')],
+                     {1: 44, 2: 909, 3: 37190, 4: 841291}),
+}
+
+
+def perft_position(name, backend='objects'):
+    """Returns a new game on the given backend set up in the stored perft position with the given name"""
+
+    game = ChessVar(backend=backend)
+    for turn in PERFT_POSITIONS[name][0]:
+        if len(turn[0]) == 1:
+            game.enter_fairy_piece(turn[0], turn[1])
+        else:
+            game.make_move(turn[0], turn[1])
+    return game
+
+
+def run_perft(arguments):
+    """
+    Runs perft on the stored positions selected on the command line, printing the node count, time and nodes per
+    second for each.  Returns False if --verify was given and any count differs from the stored baseline
+    """
+
+    names = [arguments.position] if arguments.position else list(PERFT_POSITIONS)
+    all_counts_match = True
+    for name in names:
+        game = perft_position(name, arguments.backend)
+        start_time = time.perf_counter()
+        if arguments.divide:
+            counts = game.perft_divide(arguments.depth)
+            for turn in sorted(counts):
+                print('  %s %s: %d' % (turn[0], turn[1], counts[turn]))
+            nodes = sum(counts.values())
+        else:
+            nodes = game.perft(arguments.depth)
+        elapsed = time.perf_counter() - start_time
+
+        result = ''
+        expected = PERFT_POSITIONS[name][1].get(arguments.depth)
+        if arguments.verify and expected is not None:
+            if nodes == expected:
+                result = '  ok'
+            else:
+                result = '  MISMATCH (expected %d)' % expected
+                all_counts_match = False
+
+        print('%-14s depth %d: %10d nodes  %7.2f s  %9.0f nodes/sec%s' %
+              (name, arguments.depth, nodes, elapsed, nodes / elapsed if elapsed else 0, result))
+    return all_counts_match
 
 
 def main():
     """
-    Main portion of the program that will set up the board when a ChessVar() is assigned to a variable, and will
-    accept commands to make moves, add fairy pieces, return game status, and display the board
+    Main portion of the program.  Provides command line tools for working with the game:
+
+        python ChessVar.py perft --depth 4 [--position NAME] [--divide] [--verify] [--backend bitboard]
     """
 
+    parser = argparse.ArgumentParser(description='Falcon-Hunter Variant of Chess')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    perft_parser = subparsers.add_parser('perft', help='count move generation leaf nodes from stored positions')
+    perft_parser.add_argument('--depth', type=int, default=3, help='number of turns to search')
+    perft_parser.add_argument('--position', choices=sorted(PERFT_POSITIONS), help='only search this position')
+    perft_parser.add_argument('--divide', action='store_true', help='show the count below each root turn')
+    perft_parser.add_argument('--verify', action='store_true', help='compare counts against the stored baseline')
+    perft_parser.add_argument('--backend', choices=BACKENDS, default='objects', help='board backend to run on')
+
+    arguments = parser.parse_args()
+    if arguments.command == 'perft':
+        if run_perft(arguments) is False:
+            raise SystemExit(1)
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,276 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A PGN-style text format for recording games of the Falcon-Hunter variant of chess.  Each game is a set
+#               of tag pairs followed by its turns and a result, for example:
+#
+#                   [Event "Club match"]
+#                   [White "Alice"]
+#                   [Black "Bob"]
+#                   [Result "1-0"]
+#
+#                   1. e2e4 d7d5 2. e4d5 d8d5 3. b1c3 d5a2 4. a1a2 h@d8 1-0
+#
+#               A move is written as its start and end squares, and a fairy piece entry as the piece, '@' and the
+#               square, matching the arguments of make_move and enter_fairy_piece.  The result is '1-0' (WHITE_WON),
+#               '0-1' (BLACK_WON), '1/2-1/2' or '*' (UNFINISHED).  read_games streams games from a file one at a time,
+#               so archives of any size are read in constant memory, and GameWriter writes games turn by turn.
+#
+#               A game played with ChessVar's optional draw rules (see ChessVar.set_draw_rules) carries the tag pair
+#               [DrawRules "1"], so that it is replayed with the rules on and a recorded draw can be reached again.
+
+import sys
+
+from ChessVar import ChessVar, replay_game
+
+# Result tokens and the get_game_state value each one records
+RESULT_STATES = {'1-0': 'WHITE_WON', '0-1': 'BLACK_WON', '1/2-1/2': 'DRAW', '*': 'UNFINISHED'}
+STATE_RESULTS = {state: result for result, state in RESULT_STATES.items()}
+
+# Tag pair marking a game played with the optional draw rules, and the value it has when they were used
+DRAW_RULES_TAG = 'DrawRules'
+DRAW_RULES_ON = '1'
+
+# Movetext lines are wrapped at this width
+LINE_WIDTH = 79
+
+
+def turn_to_token(turn):
+    """Takes in a turn tuple in the format of ChessVar.generate_legal_moves and returns its movetext token"""
+
+    if len(turn[0]) == 1:
+        return turn[0] + '@' + turn[1]
+    return turn[0] + turn[1]
+
+
+def token_to_turn(token):
+    """Takes in a movetext token and returns its turn tuple.  Raises ValueError if the token is not a turn"""
+
+    if len(token) == 4 and token[1] == '@' and token[0] in 'FHfh':
+        return token[0], token[2:]
+    if len(token) == 4 and token[0] in 'abcdefgh' and token[2] in 'abcdefgh' and token[1] in '12345678' and \
+            token[3] in '12345678':
+        return token[0:2], token[2:4]
+    raise ValueError('not a turn: %r' % token)
+
+
+class GameRecord:
+    """Represents one recorded game: its tag pairs, its turns, and the result written at the end of its movetext"""
+
+    def __init__(self, tags=None, moves=None, result='*'):
+        """Sets the tags (a dictionary), the list of turn tuples, and the result token"""
+
+        self._tags = dict(tags) if tags is not None else {}
+        self._moves = list(moves) if moves is not None else []
+        self._result = result
+        self._validation = None
+
+    def get_tags(self):
+        """Returns the dictionary of tag names and values"""
+
+        return self._tags
+
+    def get_moves(self):
+        """Returns the list of turns, each a tuple in the format of ChessVar.generate_legal_moves"""
+
+        return self._moves
+
+    def get_result(self):
+        """Returns the result token, such as '1-0'"""
+
+        return self._result
+
+    def get_result_state(self):
+        """Returns the game state recorded by the result token, such as 'WHITE_WON'"""
+
+        return RESULT_STATES[self._result]
+
+    def uses_draw_rules(self):
+        """Returns True if the game's tags say it was played with the optional draw rules"""
+
+        return self._tags.get(DRAW_RULES_TAG) == DRAW_RULES_ON
+
+    def new_game(self):
+        """Returns a new ChessVar to replay the game on, with the optional draw rules on if the game used them"""
+
+        return ChessVar(self.uses_draw_rules())
+
+    def validate(self):
+        """
+        Replays the game's turns on a new ChessVar (with the draw rules on if the game was played with them) and saves
+        the outcome, which get_validation returns.  Returns True if every turn was legal and the final game state
+        matches the recorded result
+        """
+
+        self._validation = replay_game(self._moves, draw_rules=self.uses_draw_rules())
+        return self.is_valid()
+
+    def get_validation(self):
+        """
+        Returns the outcome of the last call to validate as a tuple (game state, index of the first illegal turn or
+        None, FEN of the final position), or None if the game has not been validated
+        """
+
+        return self._validation
+
+    def is_valid(self):
+        """Returns True if the game has been validated, every turn was legal, and the result matches the final state"""
+
+        if self._validation is None:
+            return False
+        game_state, illegal_move_index, _ = self._validation
+        return illegal_move_index is None and game_state == self.get_result_state()
+
+
+def read_games(file_object, validate=False):
+    """
+    Takes in a text file object and yields a GameRecord for each game in it, reading one line at a time so that only
+    the current game is held in memory.  If validate is True each game is replayed on a ChessVar before it is yielded
+    (see GameRecord.validate).  Raises ValueError, with the line number, for text that cannot be read as a game
+    """
+
+    tags = {}
+    moves = []
+    in_game = False
+    in_comment = False
+
+    for line_number, line in enumerate(file_object, 1):
+        line = line.strip()
+        if not line or line.startswith('%'):
+            continue
+
+        # Tag pairs come before the movetext: [Name "Value"]
+        if line.startswith('[') and not in_comment:
+            if moves:
+                raise ValueError('line %d: tag pair inside movetext' % line_number)
+            name, _, value = line[1:-1].partition(' ')
+            if not line.endswith(']') or not value.startswith('"') or not value.endswith('"'):
+                raise ValueError('line %d: malformed tag pair %r' % (line_number, line))
+            tags[name] = value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+            in_game = True
+            continue
+
+        for token in line.split():
+            # Comments in braces may span several tokens and lines
+            if in_comment:
+                if token.endswith('}'):
+                    in_comment = False
+                continue
+            if token.startswith('{'):
+                in_comment = not token.endswith('}')
+                continue
+
+            if token in RESULT_STATES:
+                record = GameRecord(tags, moves, token)
+                if validate:
+                    record.validate()
+                yield record
+                tags = {}
+                moves = []
+                in_game = False
+                continue
+
+            # Move numbers such as '12.' and '12...' are only for readers
+            if token.rstrip('.').isdigit():
+                continue
+
+            try:
+                moves.append(token_to_turn(token))
+            except ValueError:
+                raise ValueError('line %d: %r is not a turn' % (line_number, token)) from None
+            in_game = True
+
+    if in_game:
+        raise ValueError('game at end of file has no result')
+
+
+class GameWriter:
+    """
+    Represents an output file of games.  A game can be written all at once with write_game, or one turn at a time with
+    begin_game, add_move and end_game, which writes each line as soon as it is full
+    """
+
+    def __init__(self, file_object):
+        """Sets the file object to write to"""
+
+        self._file = file_object
+        self._line = ''
+        self._ply = 0
+        self._in_game = False
+
+    def begin_game(self, tags=None):
+        """Writes the tag pairs that start a game.  Raises ValueError if the previous game has not been ended"""
+
+        if self._in_game:
+            raise ValueError('begin_game called before end_game')
+
+        for name, value in (tags or {}).items():
+            self._file.write('[%s "%s"]\n' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"')))
+        self._file.write('\n')
+        self._line = ''
+        self._ply = 0
+        self._in_game = True
+
+    def add_move(self, turn):
+        """Writes the next turn of the current game, with a move number before each of White's turns"""
+
+        if self._ply % 2 == 0:
+            self._add_token('%d.' % (self._ply // 2 + 1))
+        self._add_token(turn_to_token(turn))
+        self._ply += 1
+
+    def end_game(self, result):
+        """
+        Writes the result and finishes the current game.  result may be a result token ('1-0') or a game state
+        ('WHITE_WON')
+        """
+
+        self._add_token(STATE_RESULTS.get(result, result))
+        self._file.write(self._line + '\n\n')
+        self._line = ''
+        self._in_game = False
+
+    def write_game(self, record):
+        """Writes a complete GameRecord"""
+
+        self.begin_game(record.get_tags())
+        for turn in record.get_moves():
+            self.add_move(turn)
+        self.end_game(record.get_result())
+
+    def flush(self):
+        """Flushes the underlying file"""
+
+        self._file.flush()
+
+    def _add_token(self, token):
+        """Adds a token to the current movetext line, writing the line out first if the token would not fit"""
+
+        if self._line and len(self._line) + 1 + len(token) > LINE_WIDTH:
+            self._file.write(self._line + '\n')
+            self._line = token
+        elif self._line:
+            self._line += ' ' + token
+        else:
+            self._line = token
+
+
+def main():
+    """Streams the game files named on the command line, validating each game and printing a summary"""
+
+    games = 0
+    invalid = 0
+    for path in sys.argv[1:]:
+        with open(path) as file_object:
+            for record in read_games(file_object, validate=True):
+                games += 1
+                if record.is_valid() is False:
+                    invalid += 1
+                    game_state, illegal_move_index, _ = record.get_validation()
+                    print('%s game %d: result %s, replayed state %s, first illegal turn %s' %
+                          (path, games, record.get_result(), game_state, illegal_move_index))
+    print('%d games, %d invalid' % (games, invalid))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,485 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  An asyncio server that hosts many games of the Falcon-Hunter variant of chess at once.  Clients connect
+#               over TCP (or drive a single session through standard input and output) and send one JSON object per
+#               line.  Each request names an operation and usually a game:
+#
+#                   {"id": 1, "op": "new"}
+#                   {"id": 2, "op": "move", "game": "1", "from": "e2", "to": "e4"}
+#                   {"id": 3, "op": "enter", "game": "1", "piece": "H", "square": "c1"}
+#                   {"id": 4, "op": "state", "game": "1"}
+#                   {"id": 5, "op": "subscribe", "game": "1"}
+#                   {"id": 6, "op": "unsubscribe", "game": "1"}
+#                   {"id": 7, "op": "close", "game": "1"}
+#                   {"id": 8, "op": "book", "game": "1"}
+#                   {"id": 9, "op": "stats"}
+#
+#               The server answers each request with one line holding the same id, "ok" (true or false), and either the
+#               game's state or an "error" message.  A rejected turn's error also gives the game's reason for rejecting
+#               it.  A "book" reply also lists the opening book's turns for the game's position, if the server was
+#               given a book.  A "stats" reply gives the numbers of games and connections and, if the server was started
+#               with --instrument, the counts kept by Instrumentation.  Every change to a game is also pushed to the
+#               game's subscribers as an "update" event, and a game left idle too long is removed with an "evicted"
+#               event.  Each connection's outgoing lines wait in a bounded queue: a client that stops reading its
+#               answers stops being read from, and a subscriber that falls too far behind on pushed events is
+#               disconnected.
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import Instrumentation
+from ChessVar import ChessVar
+from GameRecord import turn_to_token
+from OpeningBook import OpeningBook
+
+# Seconds without a request before a game is evicted, and how often the games are checked
+DEFAULT_IDLE_TIMEOUT = 600.0
+EVICTION_INTERVAL = 5.0
+
+# Outgoing lines held for a connection before it is made to wait (answers) or dropped (pushed events)
+DEFAULT_OUTBOX_SIZE = 1024
+
+
+class HostedGame:
+    """Represents a game held by the server: the ChessVar, its subscribed connections, and when it was last used"""
+
+    __slots__ = ('_game_id', '_game', '_subscribers', '_last_active', '_ply')
+
+    def __init__(self, game_id):
+        """Creates a new game with the given ID"""
+
+        self._game_id = game_id
+        self._game = ChessVar()
+        self._subscribers = set()
+        self._last_active = time.monotonic()
+        self._ply = 0
+
+    def get_game_id(self):
+        """Returns the game's ID"""
+
+        return self._game_id
+
+    def get_game(self):
+        """Returns the game's ChessVar"""
+
+        return self._game
+
+    def get_subscribers(self):
+        """Returns the set of connections subscribed to the game"""
+
+        return self._subscribers
+
+    def get_last_active(self):
+        """Returns the time.monotonic value of the game's last request"""
+
+        return self._last_active
+
+    def touch(self):
+        """Records that the game has just been used"""
+
+        self._last_active = time.monotonic()
+
+    def play(self, turn):
+        """
+        Takes in a turn in the format of ChessVar.generate_legal_moves and makes it with make_move or
+        enter_fairy_piece.  Returns the result of that method
+        """
+
+        if len(turn[0]) == 1:
+            made = self._game.enter_fairy_piece(turn[0], turn[1])
+        else:
+            made = self._game.make_move(turn[0], turn[1])
+        if made is True:
+            self._ply += 1
+        return made
+
+    def describe(self):
+        """Returns a dictionary describing the game for a reply or an update event"""
+
+        return {'game': self._game_id, 'fen': self._game.to_fen(), 'turn': self._game.get_turn(),
+                'state': self._game.get_game_state(), 'ply': self._ply}
+
+
+class Connection:
+    """
+    Represents one client.  Outgoing lines are put in a bounded queue and written by a separate task, so a slow client
+    holds up only its own requests
+    """
+
+    def __init__(self, writer, outbox_size=DEFAULT_OUTBOX_SIZE):
+        """Sets the stream writer and creates the outgoing queue"""
+
+        self._writer = writer
+        self._outbox = asyncio.Queue(outbox_size)
+        self._subscriptions = set()
+        self._closed = False
+        self._waiting_send = None
+
+    def get_subscriptions(self):
+        """Returns the set of HostedGame objects the connection is subscribed to"""
+
+        return self._subscriptions
+
+    def is_closed(self):
+        """Returns True once the connection has been closed"""
+
+        return self._closed
+
+    async def send(self, message):
+        """
+        Queues a reply, waiting for room if the client is behind on reading its replies.  The reply is dropped if the
+        connection is closed, including while it waits
+        """
+
+        if self._closed is True:
+            return
+        try:
+            self._outbox.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        # Wait for room in a separate task that close can cancel, so a reply waiting when the connection closes (for
+        # example because writing to the client failed) does not leave the request loop waiting forever
+        self._waiting_send = asyncio.ensure_future(self._outbox.put(message))
+        await asyncio.wait({self._waiting_send})
+        self._waiting_send = None
+
+    def push(self, message):
+        """Queues a pushed event without waiting.  A subscriber too far behind to take it is disconnected"""
+
+        if self._closed is True:
+            return
+        try:
+            self._outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.close()
+
+    def end_output(self):
+        """
+        Queues the marker that stops the writing task once the messages ahead of it are written, without waiting.
+        Returns False if the queue is full, so the marker could not be queued
+        """
+
+        try:
+            self._outbox.put_nowait(None)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self):
+        """Closes the connection and stops writing to it"""
+
+        if self._closed is False:
+            self._closed = True
+            self._writer.close()
+            if self._waiting_send is not None:
+                self._waiting_send.cancel()
+
+            # Wake the writing task so that it can finish.  If the queue is full the task is already awake
+            try:
+                self._outbox.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    async def write_lines(self):
+        """Writes queued messages to the client, one JSON object per line, until the connection is closed"""
+
+        try:
+            while True:
+                message = await self._outbox.get()
+                if message is None or self._closed is True:
+                    return
+                self._writer.write(json.dumps(message, separators=(',', ':')).encode() + b'\n')
+                await self._writer.drain()
+        except (ConnectionError, OSError):
+            self.close()
+
+
+class GameServer:
+    """Represents the server: every hosted game by ID, and the handlers that serve client requests"""
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, outbox_size=DEFAULT_OUTBOX_SIZE, book=None):
+        """
+        Sets the idle timeout in seconds, the size of each connection's outgoing queue, and the OpeningBook used to
+        answer "book" requests (None if there is no book)
+        """
+
+        self._games = {}
+        self._book = book
+        self._connection_count = 0
+        self._next_game_number = 1
+        self._idle_timeout = idle_timeout
+        self._outbox_size = outbox_size
+
+    def get_game_count(self):
+        """Returns the number of games being hosted"""
+
+        return len(self._games)
+
+    def get_connection_count(self):
+        """Returns the number of clients connected"""
+
+        return self._connection_count
+
+    def get_game(self, game_id):
+        """Returns the HostedGame with the given ID, or None if there is none"""
+
+        return self._games.get(game_id)
+
+    async def handle_connection(self, reader, writer):
+        """Serves one client until it disconnects: reads request lines and queues a reply for each"""
+
+        connection = Connection(writer, self._outbox_size)
+        writer_task = asyncio.ensure_future(connection.write_lines())
+        self._connection_count += 1
+        try:
+            while connection.is_closed() is False:
+                # A line longer than the reader's limit raises ValueError.  What is left of it cannot be told apart
+                # from a new request, so the client is told why and the connection is ended
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await connection.send({'id': None, 'ok': False, 'error': 'request line is too long'})
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    await connection.send(self.handle_request(connection, line))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            for hosted_game in connection.get_subscriptions():
+                hosted_game.get_subscribers().discard(connection)
+            connection.get_subscriptions().clear()
+
+            # Let the writing task finish the replies already queued.  If there is no room for the end marker the
+            # client has stopped reading (or the task has stopped), so the task is cancelled rather than waited on
+            try:
+                if connection.end_output() is False:
+                    writer_task.cancel()
+                await asyncio.wait({writer_task})
+            finally:
+                connection.close()
+                self._connection_count -= 1
+
+    def handle_request(self, connection, line):
+        """
+        Takes in the connection and one request line and carries out the request.  Returns the reply dictionary, which
+        holds an error message instead if the line is not a JSON object or a field has the wrong type
+        """
+
+        # Nesting too deep for the parser raises RecursionError rather than ValueError
+        try:
+            request = json.loads(line)
+        except (ValueError, RecursionError):
+            return {'ok': False, 'error': 'request is not JSON'}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'request is not an object'}
+
+        reply = {'id': request.get('id')}
+        operation = request.get('op')
+        if not isinstance(operation, str):
+            reply['ok'] = False
+            reply['error'] = 'op must be a string'
+            return reply
+
+        if operation == 'new':
+            game_id = str(self._next_game_number)
+            self._next_game_number += 1
+            hosted_game = HostedGame(game_id)
+            self._games[game_id] = hosted_game
+            reply['ok'] = True
+            reply.update(hosted_game.describe())
+            return reply
+
+        if operation == 'stats':
+            reply['ok'] = True
+            reply['games'] = len(self._games)
+            reply['connections'] = self._connection_count
+            if Instrumentation.is_enabled():
+                reply['methods'] = Instrumentation.get_stats()
+            return reply
+
+        game_id = request.get('game')
+        if game_id is not None and not isinstance(game_id, str):
+            reply['ok'] = False
+            reply['error'] = 'game must be a string'
+            return reply
+        hosted_game = self._games.get(game_id)
+        if hosted_game is None:
+            reply['ok'] = False
+            reply['error'] = 'no such game'
+            return reply
+        hosted_game.touch()
+
+        if operation == 'move' or operation == 'enter':
+            if operation == 'move':
+                turn = (request.get('from'), request.get('to'))
+            else:
+                turn = (request.get('piece'), request.get('square'))
+            if not all(isinstance(item, str) and item for item in turn):
+                reply['ok'] = False
+                reply['error'] = 'illegal turn'
+                return reply
+            if hosted_game.play(turn) is False:
+                reply['ok'] = False
+                reply['error'] = 'illegal turn'
+                reply['reason'] = hosted_game.get_game().get_last_rejection()
+                return reply
+            description = hosted_game.describe()
+            self._publish(hosted_game, dict(description, event='update'))
+        elif operation == 'state':
+            description = hosted_game.describe()
+        elif operation == 'subscribe':
+            hosted_game.get_subscribers().add(connection)
+            connection.get_subscriptions().add(hosted_game)
+            description = hosted_game.describe()
+        elif operation == 'unsubscribe':
+            hosted_game.get_subscribers().discard(connection)
+            connection.get_subscriptions().discard(hosted_game)
+            description = hosted_game.describe()
+        elif operation == 'book':
+            description = hosted_game.describe()
+            entries = self._book.probe_game(hosted_game.get_game()) if self._book is not None else []
+            description['moves'] = [{'turn': turn_to_token(turn), 'games': games, 'white_wins': white_wins,
+                                     'black_wins': black_wins, 'draws': draws}
+                                    for turn, games, white_wins, black_wins, draws in entries]
+        elif operation == 'close':
+            description = hosted_game.describe()
+            self._remove_game(hosted_game, 'closed')
+        else:
+            reply['ok'] = False
+            reply['error'] = 'unknown operation'
+            return reply
+
+        reply['ok'] = True
+        reply.update(description)
+        return reply
+
+    @staticmethod
+    def _publish(hosted_game, message):
+        """Pushes a message to every subscriber of the game, dropping subscribers that have been disconnected"""
+
+        for connection in list(hosted_game.get_subscribers()):
+            connection.push(message)
+            if connection.is_closed() is True:
+                hosted_game.get_subscribers().discard(connection)
+
+    def _remove_game(self, hosted_game, event):
+        """Removes a game from the server and tells its subscribers with the given event ('closed' or 'evicted')"""
+
+        del self._games[hosted_game.get_game_id()]
+        self._publish(hosted_game, {'event': event, 'game': hosted_game.get_game_id()})
+        for connection in hosted_game.get_subscribers():
+            connection.get_subscriptions().discard(hosted_game)
+        hosted_game.get_subscribers().clear()
+
+    def evict_idle_games(self):
+        """
+        Removes every game that has had no request for longer than the idle timeout.  Returns how many were removed
+        """
+
+        cutoff = time.monotonic() - self._idle_timeout
+        idle_games = [hosted_game for hosted_game in self._games.values() if hosted_game.get_last_active() < cutoff]
+        for hosted_game in idle_games:
+            self._remove_game(hosted_game, 'evicted')
+        return len(idle_games)
+
+    async def run_eviction(self, interval=EVICTION_INTERVAL):
+        """Checks for idle games every interval seconds until cancelled"""
+
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle_games()
+
+    async def serve_tcp(self, host, port):
+        """Serves clients connecting over TCP until cancelled"""
+
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        eviction_task = asyncio.ensure_future(self.run_eviction())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            eviction_task.cancel()
+
+    async def serve_stdio(self):
+        """Serves a single session reading requests from standard input and writing replies to standard output"""
+
+        stream = StandardStream()
+        eviction_task = asyncio.ensure_future(self.run_eviction())
+        try:
+            await self.handle_connection(stream, stream)
+        finally:
+            eviction_task.cancel()
+
+
+class StandardStream:
+    """
+    Represents standard input and output as a stream for GameServer.handle_connection.  Lines are read in a worker
+    thread, so this works whether standard input is a terminal, a pipe or a file
+    """
+
+    def __init__(self):
+        """Sets the binary standard input and output files"""
+
+        self._input = sys.stdin.buffer
+        self._output = sys.stdout.buffer
+
+    async def readline(self):
+        """Returns the next line of standard input, or an empty bytes object at the end"""
+
+        return await asyncio.get_running_loop().run_in_executor(None, self._input.readline)
+
+    def write(self, data):
+        """Writes bytes to standard output"""
+
+        self._output.write(data)
+
+    async def drain(self):
+        """Flushes standard output"""
+
+        self._output.flush()
+
+    def close(self):
+        """Flushes standard output.  The standard files themselves are left open"""
+
+        self._output.flush()
+
+
+def main():
+    """Starts the server from the command line, on TCP or on standard input and output"""
+
+    parser = argparse.ArgumentParser(description='Host Falcon-Hunter games over a JSON-lines protocol')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on')
+    parser.add_argument('--stdio', action='store_true', help='serve one session on standard input and output')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help='seconds before an unused game is evicted')
+    parser.add_argument('--outbox', type=int, default=DEFAULT_OUTBOX_SIZE,
+                        help='outgoing lines queued per connection')
+    parser.add_argument('--book', help='opening book file for "book" requests')
+    parser.add_argument('--instrument', action='store_true', help='count and time turns for "stats" requests')
+    arguments = parser.parse_args()
+
+    if arguments.instrument:
+        Instrumentation.enable()
+
+    book = OpeningBook(arguments.book) if arguments.book else None
+    server = GameServer(arguments.idle_timeout, arguments.outbox, book)
+    try:
+        if arguments.stdio:
+            asyncio.run(server.serve_stdio())
+        else:
+            asyncio.run(server.serve_tcp(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
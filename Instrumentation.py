@@ -0,0 +1,184 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Opt-in instrumentation of the Falcon-Hunter rules engine.  enable() replaces ChessVar.make_move and
+#               ChessVar.enter_fairy_piece with wrappers that count each call, time it, and count each rejected turn
+#               by the reason the game gives for it (ChessVar.get_last_rejection).  disable() puts the original methods
+#               back, so while instrumentation is off the game runs its own methods with no added cost.  get_stats
+#               returns a snapshot of the counts as a dictionary, ready to log or send as JSON.
+#
+#               From the command line, replays recorded games (see GameRecord) with instrumentation on and prints the
+#               counts, or with --profile runs the replay under cProfile and prints a pstats report:
+#
+#                   python Instrumentation.py games.pgn [more.pgn ...] [--profile] [--sort tottime] [--limit 25]
+#                                             [--output replay.prof]
+
+import argparse
+import cProfile
+import functools
+import pstats
+import time
+
+from ChessVar import ChessVar
+from GameRecord import read_games
+
+# Methods that enable() wraps
+INSTRUMENTED_METHODS = ('make_move', 'enter_fairy_piece')
+
+
+class MethodStats:
+    """Represents the counts kept for one instrumented method: calls, accepted turns, rejections by reason and time"""
+
+    __slots__ = ('_calls', '_accepted', '_rejections', '_seconds')
+
+    def __init__(self):
+        """Sets every count to zero"""
+
+        self._calls = 0
+        self._accepted = 0
+        self._rejections = {}
+        self._seconds = 0.0
+
+    def record(self, seconds, rejection):
+        """Takes in the time a call took and the reason it was rejected (None if the turn was made) and counts it"""
+
+        self._calls += 1
+        self._seconds += seconds
+        if rejection is None:
+            self._accepted += 1
+        else:
+            self._rejections[rejection] = self._rejections.get(rejection, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns a dictionary of the counts: calls, accepted, rejected (the total), rejections (a dictionary of counts by
+        reason), seconds (the time spent in the method) and mean_us (the average call in microseconds)
+        """
+
+        return {
+            'calls': self._calls,
+            'accepted': self._accepted,
+            'rejected': self._calls - self._accepted,
+            'rejections': dict(self._rejections),
+            'seconds': self._seconds,
+            'mean_us': 1e6 * self._seconds / self._calls if self._calls else 0.0,
+        }
+
+
+# Counts for each instrumented method, and the original methods while instrumentation is on
+_stats = {name: MethodStats() for name in INSTRUMENTED_METHODS}
+_original_methods = {}
+
+
+def _make_wrapper(method, method_stats):
+    """Returns a wrapper around a ChessVar method that times each call and records it in method_stats"""
+
+    perf_counter = time.perf_counter
+
+    @functools.wraps(method)
+    def wrapper(self, *arguments):
+        start_time = perf_counter()
+        result = method(self, *arguments)
+        method_stats.record(perf_counter() - start_time, self.get_last_rejection() if result is False else None)
+        return result
+
+    return wrapper
+
+
+def enable():
+    """Turns instrumentation on for every ChessVar, including games that already exist.  Does nothing if it is on"""
+
+    if _original_methods:
+        return
+    for name in INSTRUMENTED_METHODS:
+        _original_methods[name] = getattr(ChessVar, name)
+        setattr(ChessVar, name, _make_wrapper(_original_methods[name], _stats[name]))
+
+
+def disable():
+    """Turns instrumentation off, restoring the original methods.  The counts are kept until reset_stats is called"""
+
+    for name, method in _original_methods.items():
+        setattr(ChessVar, name, method)
+    _original_methods.clear()
+
+
+def is_enabled():
+    """Returns True if instrumentation is on"""
+
+    return bool(_original_methods)
+
+
+def reset_stats():
+    """Sets every count back to zero"""
+
+    for name in INSTRUMENTED_METHODS:
+        _stats[name] = MethodStats()
+
+    # Wrappers already installed hold the old counts, so they are installed again with the new ones
+    if _original_methods:
+        for name in INSTRUMENTED_METHODS:
+            setattr(ChessVar, name, _make_wrapper(_original_methods[name], _stats[name]))
+
+
+def get_stats():
+    """Returns a dictionary of each instrumented method's counts (see MethodStats.snapshot), keyed by method name"""
+
+    return {name: _stats[name].snapshot() for name in INSTRUMENTED_METHODS}
+
+
+def replay_files(paths):
+    """Replays every game in the named game files, checking each turn, and returns the number of games replayed"""
+
+    games = 0
+    for path in paths:
+        with open(path) as file_object:
+            for record in read_games(file_object):
+                record.new_game().replay(record.get_moves())
+                games += 1
+    return games
+
+
+def print_stats(stats):
+    """Prints the counts returned by get_stats, one method to a line, followed by the rejections by reason"""
+
+    for name, method_stats in stats.items():
+        print('%-18s %9d calls  %9d accepted  %9d rejected  %8.3f s  %7.2f us/call' %
+              (name, method_stats['calls'], method_stats['accepted'], method_stats['rejected'],
+               method_stats['seconds'], method_stats['mean_us']))
+        for reason, count in sorted(method_stats['rejections'].items(), key=lambda item: -item[1]):
+            print('    %-22s %9d' % (reason, count))
+
+
+def main():
+    """Replays game files with instrumentation on and prints the counts, or a profile of the replay"""
+
+    parser = argparse.ArgumentParser(description='Instrument or profile the replay of recorded games')
+    parser.add_argument('games', nargs='+', help='game files to replay')
+    parser.add_argument('--profile', action='store_true', help='run the replay under cProfile and print a report')
+    parser.add_argument('--sort', default='cumulative', help='pstats sort key for the profile report')
+    parser.add_argument('--limit', type=int, default=25, help='number of functions in the profile report')
+    parser.add_argument('--output', help='file to save the raw profile to, for pstats or a profile viewer')
+    arguments = parser.parse_args()
+
+    if arguments.profile:
+        # Timing every call would only add noise to the profile, so instrumentation stays off
+        profiler = cProfile.Profile()
+        games = profiler.runcall(replay_files, arguments.games)
+        print('%d games replayed' % games)
+        if arguments.output:
+            profiler.dump_stats(arguments.output)
+        pstats.Stats(profiler).strip_dirs().sort_stats(arguments.sort).print_stats(arguments.limit)
+        return
+
+    enable()
+    start_time = time.perf_counter()
+    games = replay_files(arguments.games)
+    elapsed = time.perf_counter() - start_time
+    disable()
+    print('%d games replayed in %.2f s' % (games, elapsed))
+    print_stats(get_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  An opening book for the Falcon-Hunter variant of chess, built from recorded games.  For every position
+#               reached in the first plies of the games, the book stores each turn played from it with how many games
+#               played it and how those games ended.  The book file is a short header followed by fixed-size records
+#               sorted by position hash (ChessVar.position_hash) and then move code, so OpeningBook can memory-map the
+#               file and find a position's records by binary search, reading only the records it needs.
+#
+#                   python OpeningBook.py build games.pgn [more.pgn ...] --output book.bin [--plies 24]
+#                   python OpeningBook.py probe book.bin [--fen FEN]
+
+import argparse
+import mmap
+import struct
+import sys
+
+from ChessVar import STARTING_FEN, ChessVar
+from GameRecord import read_games, turn_to_token
+from TranspositionTable import decode_move, encode_move
+
+# The header is a magic string and the number of records.  Each record is the position hash, the move code (see
+# TranspositionTable.encode_move), and the number of games that played the move and then were won by White, won by Black
+# or drawn
+BOOK_MAGIC = b'FHBOOK1\0'
+HEADER = struct.Struct('<8sQ')
+RECORD = struct.Struct('<QH2xIIII')
+KEY = struct.Struct('<Q')
+
+# Plies of each game added to the book by default
+DEFAULT_BOOK_PLIES = 24
+
+
+def build_book(game_files, output_path, plies=DEFAULT_BOOK_PLIES, min_games=1):
+    """
+    Takes in a list of text file objects of recorded games (see GameRecord) and writes a book file of the turns played
+    in the first plies of each game.  Turns played in fewer than min_games games are left out.  A game stops adding
+    turns at its first illegal turn, and is replayed with the draw rules on if it was played with them, so a game that
+    was drawn adds no turns after the draw.  Returns the number of records written
+    """
+
+    # Counts for each (position hash, move code): games, White wins, Black wins, draws
+    counts = {}
+    for file_object in game_files:
+        for record in read_games(file_object):
+            game_state = record.get_result_state()
+            game = record.new_game()
+            for turn in record.get_moves()[:plies]:
+                key = (game.position_hash(), encode_move(turn))
+                if game.push_turn(turn) is False:
+                    break
+                entry = counts.get(key)
+                if entry is None:
+                    entry = counts[key] = [0, 0, 0, 0]
+                entry[0] += 1
+                if game_state == 'WHITE_WON':
+                    entry[1] += 1
+                elif game_state == 'BLACK_WON':
+                    entry[2] += 1
+                elif game_state == 'DRAW':
+                    entry[3] += 1
+
+    keys = sorted(key for key, entry in counts.items() if entry[0] >= min_games)
+    with open(output_path, 'wb') as book_file:
+        book_file.write(HEADER.pack(BOOK_MAGIC, len(keys)))
+        for key in keys:
+            book_file.write(RECORD.pack(key[0], key[1], *counts[key]))
+    return len(keys)
+
+
+class OpeningBook:
+    """
+    Represents an open book file.  The file is memory-mapped rather than read, so opening a book is quick however large
+    it is, and each probe touches only the few pages its binary search visits
+    """
+
+    def __init__(self, path):
+        """Opens and memory-maps the book file at the given path.  Raises ValueError if it is not a book file"""
+
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('%s is not a book file' % path) from None
+
+        magic, self._record_count = HEADER.unpack_from(self._map.read(HEADER.size).ljust(HEADER.size, b'\0'))
+        if magic != BOOK_MAGIC or len(self._map) != HEADER.size + self._record_count * RECORD.size:
+            self.close()
+            raise ValueError('%s is not a book file' % path)
+
+    def get_record_count(self):
+        """Returns the number of records in the book"""
+
+        return self._record_count
+
+    def probe(self, position_hash):
+        """
+        Takes in a position hash and returns a list of the book's turns from that position, most played first.  Each
+        item is a tuple (turn, games, white wins, black wins, draws), where turn is in the format of
+        ChessVar.generate_legal_moves.  Returns an empty list if the position is not in the book
+        """
+
+        book_map = self._map
+        low = 0
+        high = self._record_count
+
+        # Find the first record whose hash is not less than the one wanted
+        while low < high:
+            middle = (low + high) // 2
+            if KEY.unpack_from(book_map, HEADER.size + middle * RECORD.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        offset = HEADER.size + low * RECORD.size
+        while low < self._record_count:
+            key, move_code, games, white_wins, black_wins, draws = RECORD.unpack_from(book_map, offset)
+            if key != position_hash:
+                break
+            entries.append((decode_move(move_code), games, white_wins, black_wins, draws))
+            low += 1
+            offset += RECORD.size
+
+        entries.sort(key=lambda entry: -entry[1])
+        return entries
+
+    def probe_game(self, game):
+        """Returns the book's turns from the game's current position, as for probe"""
+
+        return self.probe(game.position_hash())
+
+    def choose_move(self, game, rng=None):
+        """
+        Returns a book turn for the game's current position, or None if the position is not in the book.  With a
+        random.Random the turn is picked in proportion to how often it was played; otherwise the most played turn is
+        returned
+        """
+
+        entries = self.probe(game.position_hash())
+        if not entries:
+            return None
+        if rng is None:
+            return entries[0][0]
+        return rng.choices([entry[0] for entry in entries], [entry[1] for entry in entries])[0]
+
+    def close(self):
+        """Unmaps and closes the book file"""
+
+        self._map.close()
+        self._file.close()
+
+
+def main():
+    """Builds a book from game files, or prints the book's turns for a position"""
+
+    parser = argparse.ArgumentParser(description='Build or probe a Falcon-Hunter opening book')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='build a book from recorded games')
+    build_parser.add_argument('games', nargs='+', help='game files to read')
+    build_parser.add_argument('--output', required=True, help='book file to write')
+    build_parser.add_argument('--plies', type=int, default=DEFAULT_BOOK_PLIES, help='plies of each game to add')
+    build_parser.add_argument('--min-games', type=int, default=1, help='leave out turns played in fewer games')
+
+    probe_parser = subparsers.add_parser('probe', help="print the book's turns for a position")
+    probe_parser.add_argument('book', help='book file to read')
+    probe_parser.add_argument('--fen', default=STARTING_FEN, help='position to look up')
+
+    arguments = parser.parse_args()
+    if arguments.command == 'build':
+        game_files = [open(path) for path in arguments.games]
+        try:
+            record_count = build_book(game_files, arguments.output, arguments.plies, arguments.min_games)
+        finally:
+            for file_object in game_files:
+                file_object.close()
+        print('%d records written to %s' % (record_count, arguments.output))
+    else:
+        book = OpeningBook(arguments.book)
+        entries = book.probe_game(ChessVar.from_fen(arguments.fen))
+        book.close()
+        if not entries:
+            print('position not in book')
+            sys.exit(1)
+        for turn, games, white_wins, black_wins, draws in entries:
+            print('%-6s %8d games  %5.1f%% white  %5.1f%% black  %5.1f%% drawn' %
+                  (turn_to_token(turn), games, 100 * white_wins / games,
+                   100 * black_wins / games, 100 * draws / games))
+
+
+if __name__ == '__main__':
+    main()
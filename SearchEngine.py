@@ -0,0 +1,464 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A computer opponent for the Falcon-Hunter variant of chess.  SearchEngine looks ahead from a ChessVar
+#               position using iterative-deepening negamax search with alpha-beta pruning, and picks the turn (a move
+#               or a fairy piece entry) with the best score.  Because the game ends as soon as a King is captured, a
+#               King capture is treated as a final result rather than searched further.  The search can be limited by
+#               depth, time and number of positions searched, and reports its progress after each completed depth.
+#               At the end of each line the search goes on through captures only (quiescence search), so a position is
+#               not scored in the middle of an exchange.  A player whose King is attacked there must answer the threat,
+#               so every turn is searched instead, and a position is not scored one turn before its King is taken.
+
+import argparse
+import time
+
+from ChessVar import COLOR_CODES, KIND_VALUES, KING, PERFT_POSITIONS, PIECE_SYMBOLS, SQUARE_NAMES, perft_position
+from OpeningBook import OpeningBook
+from Tablebase import Tablebase
+from TranspositionTable import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+# Material value of each kind of piece by symbol, used to order captures
+PIECE_VALUES = {PIECE_SYMBOLS[kind]: value for kind, value in enumerate(KIND_VALUES)}
+
+# Score for capturing the King.  Captures found sooner score higher, so the engine takes the quickest win
+KING_CAPTURE_SCORE = 100000
+
+# Scores within this many plies of KING_CAPTURE_SCORE mean a King capture has been found
+MAX_PLY = 256
+
+# Margin, in hundredths of a pawn, added to the value of a captured piece before a capture is skipped in quiescence
+# search as unable to raise the score to alpha.  It covers the piece-square bonuses the capture may also gain
+DELTA_MARGIN = 200
+
+# How many times along one line quiescence search answers an attack on the King by searching every turn.  Turns that
+# each attack the other King could otherwise go on forever.  Past the limit the static score is used, as at any depth
+QUIESCENCE_EVASIONS = 4
+
+# How often, in positions searched, the time limit is checked
+TIME_CHECK_INTERVAL = 1024
+
+
+def score_to_table(score, ply):
+    """
+    Converts a score found ply turns below the root into the form stored in the transposition table.  King capture
+    scores are stored as distance from the stored position rather than from the root, so they stay correct when the
+    same position is reached at a different ply
+    """
+
+    if score > KING_CAPTURE_SCORE - MAX_PLY:
+        return score + ply
+    if score < -(KING_CAPTURE_SCORE - MAX_PLY):
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """Converts a score read from the transposition table back into a score relative to the root"""
+
+    if score > KING_CAPTURE_SCORE - MAX_PLY:
+        return score - ply
+    if score < -(KING_CAPTURE_SCORE - MAX_PLY):
+        return score + ply
+    return score
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time or node budget runs out, to abandon the current iteration"""
+
+
+class SearchEngine:
+    """
+    Represents a computer player that searches ChessVar positions.  Each call to search starts a new iterative
+    deepening search: depth 1, then 2, and so on, until the maximum depth is reached or the time or node budget runs
+    out.  The best turn from the deepest completed depth is returned
+    """
+
+    def __init__(self, max_depth=64, time_limit=None, node_limit=None, report=None, table_size_mb=16, book=None,
+                 tablebase=None, quiescence=True):
+        """
+        Sets the search limits.  max_depth is the deepest search to attempt, time_limit is in seconds, and node_limit
+        is the number of positions to search; None means no limit.  report, if given, is called with a dictionary
+        describing each completed depth (depth, score, best_move, nodes, qnodes, seconds, nps and tt_hit_rate).  A
+        transposition table of table_size_mb megabytes is kept across searches; 0 turns it off.  If an OpeningBook is
+        given, positions in the book are answered with the book's most played turn without searching.  If a Tablebase
+        is given, positions it has a table for are scored from the table instead of being searched further.  With
+        quiescence on, positions at the end of the search depth are searched further through captures before being
+        scored; with it off they are scored by ChessVar.evaluate as they stand
+        """
+
+        self._table = TranspositionTable(table_size_mb) if table_size_mb > 0 else None
+        self._book = book
+        self._tablebase = tablebase
+        self._quiescence = quiescence
+        self._max_depth = max_depth
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+        self._report = report
+        self._nodes = 0
+        self._quiescence_nodes = 0
+        self._deadline = None
+        self._next_time_check = 0
+        self._root_best_move = None
+        self._iterations = []
+
+    def get_iterations(self):
+        """Returns the list of reports for each depth completed by the most recent search"""
+
+        return self._iterations
+
+    def get_transposition_table(self):
+        """Returns the engine's transposition table, or None if it does not use one"""
+
+        return self._table
+
+    def get_nodes(self):
+        """Returns the number of positions visited by the most recent search"""
+
+        return self._nodes
+
+    def get_quiescence_nodes(self):
+        """
+        Returns the number of positions visited by the most recent search's quiescence search.  They are included in
+        the count returned by get_nodes
+        """
+
+        return self._quiescence_nodes
+
+    def has_quiescence(self):
+        """Returns True if the engine searches captures at the end of the search depth"""
+
+        return self._quiescence
+
+    def set_quiescence(self, quiescence):
+        """Takes in True or False and turns the quiescence search on or off for later searches"""
+
+        self._quiescence = quiescence
+
+    def search(self, game):
+        """
+        Searches the given game and returns the best turn for the player whose turn it is, as a tuple in the format of
+        ChessVar.generate_legal_moves.  Returns None if there is no legal turn.  The game is left in the position it
+        was given in
+        """
+
+        root_moves = game.generate_legal_moves()
+        if not root_moves:
+            return None
+
+        self._nodes = 0
+        self._quiescence_nodes = 0
+        self._iterations = []
+
+        # A book turn is trusted only if it is legal here, in case of a hash collision
+        if self._book is not None:
+            book_move = self._book.choose_move(game)
+            if book_move is not None and book_move in root_moves:
+                return book_move
+
+        self._next_time_check = TIME_CHECK_INTERVAL
+        start_time = time.perf_counter()
+        self._deadline = start_time + self._time_limit if self._time_limit is not None else None
+
+        # Fall back to the first turn if not even depth 1 completes
+        best_move = root_moves[0]
+        for depth in range(1, self._max_depth + 1):
+            self._root_best_move = best_move
+            try:
+                score, move = self._search_root(game, depth)
+            except SearchTimeout:
+                # Every turn played by the abandoned iteration has already been taken back on the way out
+                break
+
+            best_move = move
+            elapsed = time.perf_counter() - start_time
+            iteration = {'depth': depth, 'score': score, 'best_move': move, 'nodes': self._nodes,
+                         'qnodes': self._quiescence_nodes, 'seconds': elapsed,
+                         'nps': int(self._nodes / elapsed) if elapsed > 0 else 0,
+                         'tt_hit_rate': self._table.get_stats()['hit_rate'] if self._table is not None else 0.0}
+            self._iterations.append(iteration)
+            if self._report is not None:
+                self._report(iteration)
+
+            # A forced King capture has been found, so searching deeper cannot change the result
+            if abs(score) >= KING_CAPTURE_SCORE - MAX_PLY:
+                break
+
+        return best_move
+
+    def _search_root(self, game, depth):
+        """Searches every root turn to the given depth and returns the best score and the turn that achieves it"""
+
+        alpha = -KING_CAPTURE_SCORE - 1
+        beta = KING_CAPTURE_SCORE + 1
+        best_move = None
+        for turn in self._order_moves(game, game.generate_legal_moves(), self._root_best_move):
+            score = -self._negamax(game, turn, depth - 1, -beta, -alpha, 1)
+            if score > alpha:
+                alpha = score
+                best_move = turn
+        return alpha, best_move
+
+    def _negamax(self, game, turn, depth, alpha, beta, ply):
+        """
+        Plays the given turn, searches the resulting position to the given depth, and takes the turn back.  Returns the
+        score of the resulting position from the point of view of the player to move in it
+        """
+
+        self._count_node()
+        game.push_turn(turn)
+        try:
+            # The previous turn captured a King, so the player to move has lost, or it drew the game under the
+            # optional draw rules
+            game_state = game.get_game_state()
+            if game_state != 'UNFINISHED':
+                if game_state == 'DRAW':
+                    return 0
+                return -(KING_CAPTURE_SCORE - ply)
+
+            # A tablebase value is exact, so the position needs no search.  It counts the turns until a King capture
+            if self._tablebase is not None:
+                table_value = self._tablebase.probe(game)
+                if table_value is not None:
+                    if table_value == 0:
+                        return 0
+                    if table_value % 2 == 1:
+                        return KING_CAPTURE_SCORE - ply - table_value
+                    return -(KING_CAPTURE_SCORE - ply - table_value)
+
+            if depth <= 0:
+                if self._quiescence is True:
+                    return self._quiescence_search(game, alpha, beta, ply)
+                return game.evaluate()
+
+            # Use a stored result for this position if it was searched at least as deeply and its score settles this
+            # search.  Otherwise its best move is still the best guess at which turn to search first
+            key = game.position_hash()
+            table_move = None
+            if self._table is not None:
+                entry = self._table.probe(key)
+                if entry is not None:
+                    entry_depth, entry_score, bound, table_move = entry
+                    if entry_depth >= depth:
+                        entry_score = score_from_table(entry_score, ply)
+                        if (bound == EXACT or (bound == LOWER_BOUND and entry_score >= beta) or
+                                (bound == UPPER_BOUND and entry_score <= alpha)):
+                            return entry_score
+
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                return 0
+
+            # Capturing the King wins at once, so no other turn needs to be searched
+            king_capture = self._find_king_capture(game, legal_moves)
+            if king_capture is not None:
+                return KING_CAPTURE_SCORE - ply - 1
+
+            original_alpha = alpha
+            best_score = -KING_CAPTURE_SCORE - 1
+            best_turn = None
+            for next_turn in self._order_moves(game, legal_moves, table_move):
+                score = -self._negamax(game, next_turn, depth - 1, -beta, -alpha, ply + 1)
+                if score > best_score:
+                    best_score = score
+                    best_turn = next_turn
+                if score > alpha:
+                    alpha = score
+                if alpha >= beta:
+                    break
+
+            if self._table is not None:
+                if best_score <= original_alpha:
+                    bound = UPPER_BOUND
+                elif best_score >= beta:
+                    bound = LOWER_BOUND
+                else:
+                    bound = EXACT
+                self._table.store(key, depth, score_to_table(best_score, ply), bound, best_turn)
+            return best_score
+        finally:
+            game.pop_move()
+
+    def _quiescence_search(self, game, alpha, beta, ply, evasions_left=QUIESCENCE_EVASIONS):
+        """
+        Searches the current position through captures only and returns its score from the point of view of the player
+        to move.  The player may stand pat, keeping the static score, instead of capturing, so the score is never below
+        ChessVar.evaluate unless it is at least beta.  Captures end because each one takes a piece off the board.  A
+        player whose King is attacked may not stand pat, since the King would be taken next turn, so while evasions_left
+        is above zero every turn is searched instead (see _search_evasions)
+        """
+
+        # The previous turn drew the game under the optional draw rules, so there is nothing left to search
+        if game.get_game_state() == 'DRAW':
+            return 0
+
+        if evasions_left > 0 and self._king_is_attacked(game):
+            return self._search_evasions(game, alpha, beta, ply, evasions_left)
+
+        # The static score is already enough to refute the previous turn.  Any capture, even of the King, could only
+        # raise it, so none need be generated
+        stand_pat = game.evaluate()
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        # A capture that takes the King wins at once, whatever else the position holds
+        captures = game.generate_captures()
+        if self._find_king_capture(game, captures) is not None:
+            return KING_CAPTURE_SCORE - ply - 1
+
+        for turn in self._order_moves(game, captures, None):
+            # Skip a capture that could not raise the score to alpha even if the capturing piece were never taken back
+            if stand_pat + PIECE_VALUES[game.get_square_symbol(turn[1]).upper()] + DELTA_MARGIN <= alpha:
+                continue
+
+            self._count_node()
+            self._quiescence_nodes += 1
+            game.push_turn(turn)
+            try:
+                score = -self._quiescence_search(game, -beta, -alpha, ply + 1, evasions_left)
+            finally:
+                game.pop_move()
+
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def _search_evasions(self, game, alpha, beta, ply, evasions_left):
+        """
+        Searches every turn in a quiescence position where the player to move's King is attacked, and returns the
+        score from that player's point of view.  A turn that leaves the King attacked loses to its capture in the
+        quiescence search below it, so only turns that capture the attacker, block it or move the King away can score
+        better than a loss
+        """
+
+        # A drawn game scores 0, as in _negamax, even with the King attacked
+        if game.get_game_state() == 'DRAW':
+            return 0
+
+        legal_moves = game.generate_legal_moves()
+        if not legal_moves:
+            return 0
+
+        # A capture that takes the King wins at once, even with the player's own King attacked
+        if self._find_king_capture(game, legal_moves) is not None:
+            return KING_CAPTURE_SCORE - ply - 1
+
+        for turn in self._order_moves(game, legal_moves, None):
+            self._count_node()
+            self._quiescence_nodes += 1
+            game.push_turn(turn)
+            try:
+                score = -self._quiescence_search(game, -beta, -alpha, ply + 1, evasions_left - 1)
+            finally:
+                game.pop_move()
+
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def _count_node(self):
+        """Counts a visited position and raises SearchTimeout if the node or time budget has run out"""
+
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes > self._node_limit:
+            raise SearchTimeout()
+        if self._deadline is not None and self._nodes >= self._next_time_check:
+            self._next_time_check = self._nodes + TIME_CHECK_INTERVAL
+            if time.perf_counter() > self._deadline:
+                raise SearchTimeout()
+
+    @staticmethod
+    def _king_is_attacked(game):
+        """Returns True if the player to move's King is attacked, so the opponent could capture it next turn"""
+
+        color = game.get_turn()
+        king_index = game.to_codes().find(KING + 8 * COLOR_CODES[color])
+        opponent = 'BLACK' if color == 'WHITE' else 'WHITE'
+        return king_index >= 0 and game.is_attacked(SQUARE_NAMES[king_index], opponent) is True
+
+    @staticmethod
+    def _find_king_capture(game, legal_moves):
+        """Returns a turn from the list that captures the opponent's King, or None if there is none"""
+
+        king_symbol = 'k' if game.get_turn() == 'WHITE' else 'K'
+        for turn in legal_moves:
+            if len(turn[0]) == 2 and game.get_square_symbol(turn[1]) == king_symbol:
+                return turn
+        return None
+
+    @staticmethod
+    def _order_moves(game, legal_moves, first_move):
+        """
+        Returns the legal turns in the order they should be searched: the given first move (the best turn from the
+        previous iteration) if any, then captures of the most valuable pieces by the least valuable attackers, then
+        everything else in generation order
+        """
+
+        captures = []
+        quiet_moves = []
+        for turn in legal_moves:
+            if turn == first_move:
+                continue
+            if len(turn[0]) == 2:
+                captured_symbol = game.get_square_symbol(turn[1])
+                if captured_symbol != ' ':
+                    if captured_symbol.upper() == 'K':
+                        victim_value = KING_CAPTURE_SCORE
+                    else:
+                        victim_value = PIECE_VALUES[captured_symbol.upper()]
+                    attacker_value = PIECE_VALUES[game.get_square_symbol(turn[0]).upper()]
+                    captures.append((attacker_value - 16 * victim_value, turn))
+                    continue
+            quiet_moves.append(turn)
+
+        captures.sort(key=lambda capture: capture[0])
+        ordered_moves = [turn for _, turn in captures]
+        if first_move is not None and first_move in legal_moves:
+            ordered_moves.insert(0, first_move)
+        return ordered_moves + quiet_moves
+
+
+def print_iteration(iteration):
+    """Prints one completed search depth as a single line"""
+
+    best_move = iteration['best_move']
+    print('depth %2d  score %7d  move %s %s  nodes %9d  qnodes %9d  time %6.2f s  nps %7d  tt hits %5.1f%%' %
+          (iteration['depth'], iteration['score'], best_move[0], best_move[1], iteration['nodes'],
+           iteration['qnodes'], iteration['seconds'], iteration['nps'], 100 * iteration['tt_hit_rate']))
+
+
+def main():
+    """Searches a stored position from the command line and prints each completed depth"""
+
+    parser = argparse.ArgumentParser(description='Search a Falcon-Hunter position')
+    parser.add_argument('--position', choices=sorted(PERFT_POSITIONS), default='start', help='position to search')
+    parser.add_argument('--depth', type=int, default=64, help='deepest search to attempt')
+    parser.add_argument('--time', type=float, default=5.0, help='time limit in seconds')
+    parser.add_argument('--nodes', type=int, default=None, help='limit on positions searched')
+    parser.add_argument('--hash', type=int, default=16, help='transposition table size in MB (0 to disable)')
+    parser.add_argument('--book', help='opening book file to play from before searching')
+    parser.add_argument('--tablebase', help='directory of endgame tables to score small endgames from')
+    parser.add_argument('--no-quiescence', action='store_true',
+                        help='score positions at the end of the search depth without searching captures')
+    arguments = parser.parse_args()
+
+    book = OpeningBook(arguments.book) if arguments.book else None
+    tablebase = Tablebase(arguments.tablebase) if arguments.tablebase else None
+    engine = SearchEngine(arguments.depth, arguments.time, arguments.nodes, print_iteration, arguments.hash, book,
+                          tablebase, not arguments.no_quiescence)
+    best_move = engine.search(perft_position(arguments.position))
+    if book is not None:
+        book.close()
+    print('best move:', best_move)
+
+
+if __name__ == '__main__':
+    main()
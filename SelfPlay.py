@@ -0,0 +1,297 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A self-play runner for producing training and balance data for the Falcon-Hunter variant of chess.
+#               Worker processes each play their share of the games with a chosen move policy for each side (random,
+#               greedy-capture or search) and send every finished game back through a queue.  The main process is the
+#               only writer: it records each game with GameWriter as it arrives and reports games per second, average
+#               game length, and win rates split by whether fairy pieces were entered.  Each game has its own random
+#               seed, so the same games are played whatever the number of workers.  With --draw-rules, games can also
+#               end in a draw by repetition or for lack of captures (see ChessVar.set_draw_rules) rather than running
+#               until they are stopped.
+
+import argparse
+import multiprocessing
+import queue
+import random
+import time
+import traceback
+
+from ChessVar import ChessVar
+from GameRecord import DRAW_RULES_ON, DRAW_RULES_TAG, STATE_RESULTS, GameWriter
+from SearchEngine import PIECE_VALUES, SearchEngine
+
+# Longest game played before it is stopped and recorded as unfinished
+DEFAULT_MAX_PLIES = 300
+
+# Seconds the main process waits for a result before checking that the workers are still running
+WORKER_POLL_SECONDS = 1.0
+
+
+def random_policy(game, rng):
+    """Returns a legal turn chosen uniformly at random, or None if there is no legal turn"""
+
+    legal_moves = game.generate_legal_moves()
+    if not legal_moves:
+        return None
+    return rng.choice(legal_moves)
+
+
+def greedy_capture_policy(game, rng):
+    """
+    Returns the legal capture that takes the most valuable piece (a King above all), or a random legal turn if there is
+    no capture.  Returns None if there is no legal turn
+    """
+
+    legal_moves = game.generate_legal_moves()
+    if not legal_moves:
+        return None
+    best_value = 0
+    best_moves = []
+    for turn in legal_moves:
+        if len(turn[0]) == 1:
+            continue
+        captured_symbol = game.get_square_symbol(turn[1])
+        if captured_symbol == ' ':
+            continue
+        value = PIECE_VALUES[captured_symbol.upper()] if captured_symbol.upper() != 'K' else 1000000
+        if value > best_value:
+            best_value = value
+            best_moves = [turn]
+        elif value == best_value:
+            best_moves.append(turn)
+
+    if best_moves:
+        return rng.choice(best_moves)
+    return rng.choice(legal_moves)
+
+
+class SearchPolicy:
+    """
+    Represents a move policy that plays the turn chosen by a SearchEngine.  The engine and its transposition table are
+    kept for the whole run, so a worker builds one SearchPolicy and reuses it for each game
+    """
+
+    def __init__(self, depth=3, node_limit=None, table_size_mb=4):
+        """Creates the engine with the given depth, node limit and transposition table size"""
+
+        self._engine = SearchEngine(max_depth=depth, node_limit=node_limit, table_size_mb=table_size_mb)
+
+    def __call__(self, game, rng):
+        """
+        Returns the engine's best turn for the game, or None if there is no legal turn.  The random generator is not
+        used, since the search is exact
+        """
+
+        return self._engine.search(game)
+
+
+# Policy names accepted on the command line
+POLICY_NAMES = ('random', 'greedy', 'search')
+
+
+def make_policy(name, search_depth=3, search_nodes=None):
+    """
+    Takes in a policy name from POLICY_NAMES and returns the move policy: a callable taking a game and a random.Random
+    that returns a legal turn for the player whose turn it is, or None if there is none
+    """
+
+    if name == 'random':
+        return random_policy
+    if name == 'greedy':
+        return greedy_capture_policy
+    if name == 'search':
+        return SearchPolicy(search_depth, search_nodes)
+    raise ValueError('unknown policy: %r' % name)
+
+
+def play_game(white_policy, black_policy, rng, max_plies=DEFAULT_MAX_PLIES, random_plies=0, draw_rules=False):
+    """
+    Plays one game with the given policies and returns a tuple (turns, game state).  The first random_plies turns are
+    random, so that games between deterministic policies differ.  A game still going after max_plies turns, or in which
+    the player to move has no legal turn, is stopped and its state is 'UNFINISHED'.  If draw_rules is True the game is
+    played with ChessVar's optional draw rules
+    """
+
+    game = ChessVar(draw_rules)
+    turns = []
+    while game.get_game_state() == 'UNFINISHED' and len(turns) < max_plies:
+        if len(turns) < random_plies:
+            turn = random_policy(game, rng)
+        elif game.get_turn() == 'WHITE':
+            turn = white_policy(game, rng)
+        else:
+            turn = black_policy(game, rng)
+        if turn is None:
+            break
+
+        # Turns are never taken back, so they are made directly rather than pushed onto the undo stack
+        if len(turn[0]) == 1:
+            game.enter_fairy_piece(turn[0], turn[1])
+        else:
+            game.make_move(turn[0], turn[1])
+        turns.append(turn)
+    return turns, game.get_game_state()
+
+
+def _self_play_worker(worker_number, workers, games, settings, result_queue):
+    """
+    Plays every game whose number is worker_number modulo workers and puts (game number, turns, game state) on the
+    result queue for each, followed by None when the worker is done.  If anything raises, the worker instead puts a
+    string describing the error, with its traceback, and stops
+    """
+
+    try:
+        white_policy = make_policy(settings['white'], settings['search_depth'], settings['search_nodes'])
+        black_policy = make_policy(settings['black'], settings['search_depth'], settings['search_nodes'])
+        for game_number in range(worker_number, games, workers):
+            rng = random.Random(settings['seed'] * 1000003 + game_number)
+            turns, game_state = play_game(white_policy, black_policy, rng, settings['max_plies'],
+                                          settings['random_plies'], settings['draw_rules'])
+            result_queue.put((game_number, turns, game_state))
+    except Exception:
+        result_queue.put('self-play worker %d failed:\n%s' % (worker_number, traceback.format_exc()))
+        return
+    result_queue.put(None)
+
+
+def _next_result(result_queue, processes):
+    """
+    Returns the next item a worker put on the result queue.  While waiting, checks every WORKER_POLL_SECONDS that no
+    worker has died without reporting, as one killed from outside would, and raises RuntimeError if one has.  A worker
+    that reports an error is raised as a RuntimeError too
+    """
+
+    while True:
+        try:
+            result = result_queue.get(timeout=WORKER_POLL_SECONDS)
+        except queue.Empty:
+            for worker_number, process in enumerate(processes):
+                if not process.is_alive() and process.exitcode != 0:
+                    raise RuntimeError('self-play worker %d exited with code %s' % (worker_number, process.exitcode))
+            continue
+        if isinstance(result, str):
+            raise RuntimeError(result)
+        return result
+
+
+def run_self_play(games, workers=None, white='random', black='random', output=None, seed=0,
+                  max_plies=DEFAULT_MAX_PLIES, random_plies=0, search_depth=3, search_nodes=None, draw_rules=False):
+    """
+    Plays the given number of self-play games across worker processes (one per core unless workers is given) and
+    returns a dictionary of statistics.  Each finished game is written to the output file object, if one is given, as
+    soon as it arrives.  The statistics are games, seconds, games_per_second, average_length, and results: a dictionary
+    keyed by 'with_fairy' and 'without_fairy' (whether either side entered a fairy piece) holding the count of each
+    game state.  Raises RuntimeError if a worker fails, after stopping the others
+    """
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = max(1, min(workers, games))
+
+    settings = {'white': white, 'black': black, 'seed': seed, 'max_plies': max_plies, 'random_plies': random_plies,
+                'search_depth': search_depth, 'search_nodes': search_nodes, 'draw_rules': draw_rules}
+    writer = GameWriter(output) if output is not None else None
+    results = {group: {game_state: 0 for game_state in STATE_RESULTS} for group in ('with_fairy', 'without_fairy')}
+    finished_games = 0
+    total_plies = 0
+
+    start_time = time.perf_counter()
+    result_queue = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_self_play_worker,
+                                         args=(worker_number, workers, games, settings, result_queue))
+                 for worker_number in range(workers)]
+    for process in processes:
+        process.start()
+
+    # The main process is the single writer.  Each worker sends None after its last game
+    finished_workers = 0
+    try:
+        while finished_workers < workers:
+            result = _next_result(result_queue, processes)
+            if result is None:
+                finished_workers += 1
+                continue
+
+            game_number, turns, game_state = result
+            finished_games += 1
+            total_plies += len(turns)
+            group = 'with_fairy' if any(len(turn[0]) == 1 for turn in turns) else 'without_fairy'
+            results[group][game_state] += 1
+
+            if writer is not None:
+                tags = {'Event': 'Self-play', 'Round': game_number + 1, 'White': white, 'Black': black,
+                        'Result': STATE_RESULTS[game_state]}
+                if draw_rules is True:
+                    tags[DRAW_RULES_TAG] = DRAW_RULES_ON
+                writer.begin_game(tags)
+                for turn in turns:
+                    writer.add_move(turn)
+                writer.end_game(game_state)
+    finally:
+        # If the loop was left early, the workers still running are stopped rather than left playing
+        for process in processes:
+            if process.is_alive() and finished_workers < workers:
+                process.terminate()
+            process.join()
+    if writer is not None:
+        writer.flush()
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        'games': finished_games,
+        'seconds': elapsed,
+        'games_per_second': finished_games / elapsed if elapsed else 0.0,
+        'average_length': total_plies / finished_games if finished_games else 0.0,
+        'results': results,
+    }
+
+
+def print_stats(stats):
+    """Prints the statistics returned by run_self_play"""
+
+    print('games:             %d' % stats['games'])
+    print('elapsed (s):       %.2f' % stats['seconds'])
+    print('games/sec:         %.1f' % stats['games_per_second'])
+    print('average length:    %.1f plies' % stats['average_length'])
+    for group, label in (('with_fairy', 'fairy pieces entered'), ('without_fairy', 'no fairy pieces')):
+        counts = stats['results'][group]
+        total = sum(counts.values())
+        if total == 0:
+            print('%-21s %6d games' % (label + ':', 0))
+            continue
+        print('%-21s %6d games  white %5.1f%%  black %5.1f%%  drawn %5.1f%%  unfinished %5.1f%%' %
+              (label + ':', total, 100 * counts['WHITE_WON'] / total, 100 * counts['BLACK_WON'] / total,
+               100 * counts['DRAW'] / total, 100 * counts['UNFINISHED'] / total))
+
+
+def main():
+    """Runs self-play from the command line, optionally writing the games to a file, and prints the statistics"""
+
+    parser = argparse.ArgumentParser(description='Play Falcon-Hunter games between computer policies')
+    parser.add_argument('--games', type=int, default=100, help='number of games to play')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: one per core)')
+    parser.add_argument('--white', choices=POLICY_NAMES, default='random', help="White's move policy")
+    parser.add_argument('--black', choices=POLICY_NAMES, default='random', help="Black's move policy")
+    parser.add_argument('--output', help='file to write the games to')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--max-plies', type=int, default=DEFAULT_MAX_PLIES, help='turns before a game is stopped')
+    parser.add_argument('--random-plies', type=int, default=0, help='random turns played at the start of each game')
+    parser.add_argument('--search-depth', type=int, default=3, help='search depth for the search policy')
+    parser.add_argument('--search-nodes', type=int, default=None, help='node limit per turn for the search policy')
+    parser.add_argument('--draw-rules', action='store_true', help='draw games by repetition or lack of captures')
+    arguments = parser.parse_args()
+
+    output = open(arguments.output, 'w') if arguments.output else None
+    try:
+        stats = run_self_play(arguments.games, arguments.workers, arguments.white, arguments.black, output,
+                              arguments.seed, arguments.max_plies, arguments.random_plies, arguments.search_depth,
+                              arguments.search_nodes, arguments.draw_rules)
+    finally:
+        if output is not None:
+            output.close()
+    print_stats(stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,567 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Endgame tablebases for the Falcon-Hunter variant of chess.  A table covers every position with a given
+#               set of pieces, such as KRvK (White King and Rook against the Black King) or KFvKH, and stores for each
+#               one how many turns it takes to capture a King with best play, or that neither side can force a capture.
+#               Tables are generated by retrograde analysis: positions where a King can be captured at once are solved
+#               first, and each solved position solves the positions that lead to it, working backward.  A capture
+#               leaves the table for a table with one piece fewer, so smaller tables are generated first.
+#
+#               The tables assume that no fairy piece can enter the board, and positions with a King already captured
+#               are not stored.  A position's value is one byte, from the point of view of the player to move: 0 for a
+#               draw, an odd number n for a win capturing the King on the player's nth turn from now counting both
+#               sides' turns (so 1 means the King can be captured now), and an even number n for a loss with the
+#               player's King captured on the nth turn.  Tables are written as blocks of values compressed with zlib,
+#               so a probe decompresses only one small block.
+#
+#                   python Tablebase.py generate KRvK KFvK KFvKH [--directory tables]
+#                   python Tablebase.py probe --fen FEN [--directory tables]
+
+import argparse
+import itertools
+import os
+import struct
+import time
+import zlib
+from array import array
+
+from ChessVar import (BLACK, EMPTY_CODE, KING, KING_TARGETS, KNIGHT, KNIGHT_TARGETS, OPPOSITE_DIRECTIONS, PAWN,
+                      PAWN_ATTACKERS, PIECE_SYMBOLS, QUEEN, RAYS, SLIDING_DIRECTIONS, WHITE, ChessVar)
+
+# Value stored for index slots that are not positions, such as two pieces on one square.  Distances are capped below it
+INVALID = 255
+MAX_DISTANCE = 254
+
+# Order of the pieces other than the King within each side of a material name
+PIECE_ORDER = 'QRBNFHP'
+
+# Tables hold at most this many pieces, counting both Kings
+MAX_PIECES = 4
+
+# Files hold the magic string, the material name, the number of positions, the number of blocks, the block offsets and
+# then the compressed blocks
+TABLE_MAGIC = b'FHTB1\0\0\0'
+TABLE_HEADER = struct.Struct('<8s8sII')
+BLOCK_SIZE = 16384
+FILE_SUFFIX = '.fhtb'
+
+# Decompressed blocks kept per table between probes
+CACHED_BLOCKS = 8
+
+# Squares a Pawn moves forward from and to for each color, and the row index it may move two squares from
+_PAWN_STEPS = (8, -8)
+_PAWN_START_ROWS = (1, 6)
+
+# Material names are 'K', the other pieces of White, 'vK' and the other pieces of Black, with pieces in PIECE_ORDER
+
+
+def material_name(white_symbols, black_symbols):
+    """Takes in the symbols of each side's pieces other than the King and returns the material name"""
+
+    return ('K' + ''.join(sorted(white_symbols.upper(), key=PIECE_ORDER.index)) + 'vK' +
+            ''.join(sorted(black_symbols.upper(), key=PIECE_ORDER.index)))
+
+
+def flipped_material_name(material):
+    """Returns the material name with the colors swapped, so KRvK becomes KvKR"""
+
+    white, black = material.split('v')
+    return black + 'v' + white
+
+
+def material_codes(material):
+    """
+    Takes in a material name and returns the piece codes of its pieces in table order: the White King, White's other
+    pieces, the Black King and Black's other pieces.  Raises ValueError if the name is not a valid material name
+    """
+
+    sides = material.upper().split('V')
+    if len(sides) != 2 or not all(side.startswith('K') for side in sides) or material_name(
+            sides[0][1:], sides[1][1:]) != material.upper().replace('V', 'v'):
+        raise ValueError('not a material name: %r' % material)
+    if any(symbol not in PIECE_ORDER for side in sides for symbol in side[1:]):
+        raise ValueError('not a material name: %r' % material)
+    if len(sides[0]) + len(sides[1]) > MAX_PIECES:
+        raise ValueError('tables hold at most %d pieces: %r' % (MAX_PIECES, material))
+
+    codes = [KING]
+    codes.extend(PIECE_SYMBOLS.index(symbol) for symbol in sides[0][1:])
+    codes.append(KING + 8)
+    codes.extend(PIECE_SYMBOLS.index(symbol) + 8 for symbol in sides[1][1:])
+    return codes
+
+
+def _sort_key(code):
+    """Returns the key that sorts pieces into table order"""
+
+    return code >> 3, -1 if code & 7 == KING else PIECE_ORDER.index(PIECE_SYMBOLS[code & 7])
+
+
+def position_index(squares, white_to_move):
+    """
+    Takes in the squares of a table's pieces in table order and returns the position's index in the table.  Every
+    piece moves the same way mirrored left to right, so positions with the White King on the e to h files are stored
+    as their mirror image, and the index counts only 32 squares for the White King
+    """
+
+    if squares[0] & 7 >= 4:
+        squares = [square ^ 7 for square in squares]
+    index = (0 if white_to_move else 32) + (squares[0] >> 3) * 4 + (squares[0] & 7)
+    for square in squares[1:]:
+        index = index * 64 + square
+    return index
+
+
+class EndgameTable:
+    """
+    Represents the table for one material name.  The values are either held in a bytearray, after generating the table,
+    or read from a file as compressed blocks that are decompressed one at a time when probed
+    """
+
+    def __init__(self, material, values=None, blocks=None):
+        """Sets the material name and either the array of values or the list of compressed blocks"""
+
+        self._material = material
+        self._codes = material_codes(material)
+        self._size = 64 * 64 ** (len(self._codes) - 1)
+        self._values = values
+        self._blocks = blocks
+        self._cache = {}
+
+    def get_material(self):
+        """Returns the table's material name"""
+
+        return self._material
+
+    def get_codes(self):
+        """Returns the piece codes of the table's pieces in table order"""
+
+        return self._codes
+
+    def get_size(self):
+        """Returns the number of index slots in the table"""
+
+        return self._size
+
+    def get_value(self, index):
+        """Returns the value stored at the given index"""
+
+        if self._values is not None:
+            return self._values[index]
+
+        block_number = index // BLOCK_SIZE
+        block = self._cache.get(block_number)
+        if block is None:
+            if len(self._cache) >= CACHED_BLOCKS:
+                del self._cache[next(iter(self._cache))]
+            block = self._cache[block_number] = zlib.decompress(self._blocks[block_number])
+        return block[index % BLOCK_SIZE]
+
+    def get_stats(self):
+        """
+        Returns a dictionary describing the table: positions (valid index slots), wins, losses and draws for the
+        player to move, and longest (the longest distance to a King capture)
+        """
+
+        values = self._values if self._values is not None else b''.join(
+            zlib.decompress(block) for block in self._blocks)
+        histogram = [0] * 256
+        for value, count in enumerate(histogram):
+            histogram[value] = values.count(value)
+        return {
+            'positions': self._size - histogram[INVALID],
+            'wins': sum(histogram[1:INVALID:2]),
+            'losses': sum(histogram[2:INVALID:2]),
+            'draws': histogram[0],
+            'longest': max((value for value in range(1, INVALID) if histogram[value]), default=0),
+        }
+
+    def save(self, path):
+        """Writes the table to the given path as compressed blocks.  Returns the number of bytes written"""
+
+        values = self._values
+        blocks = [zlib.compress(bytes(values[start:start + BLOCK_SIZE]), 9)
+                  for start in range(0, self._size, BLOCK_SIZE)]
+        offsets = array('I', [0])
+        for block in blocks:
+            offsets.append(offsets[-1] + len(block))
+
+        with open(path, 'wb') as table_file:
+            table_file.write(TABLE_HEADER.pack(TABLE_MAGIC, self._material.encode(), self._size, len(blocks)))
+            table_file.write(offsets.tobytes())
+            for block in blocks:
+                table_file.write(block)
+            return table_file.tell()
+
+    @classmethod
+    def load(cls, path):
+        """Reads a table written by save and returns it.  Raises ValueError if the file is not a table file"""
+
+        with open(path, 'rb') as table_file:
+            data = table_file.read()
+        if len(data) < TABLE_HEADER.size:
+            raise ValueError('%s is not a table file' % path)
+
+        magic, material, size, block_count = TABLE_HEADER.unpack_from(data)
+        if magic != TABLE_MAGIC:
+            raise ValueError('%s is not a table file' % path)
+        offsets = array('I')
+        offsets.frombytes(data[TABLE_HEADER.size:TABLE_HEADER.size + 4 * (block_count + 1)])
+        start = TABLE_HEADER.size + 4 * (block_count + 1)
+        blocks = [data[start + offsets[number]:start + offsets[number + 1]] for number in range(block_count)]
+
+        table = cls(material.rstrip(b'\0').decode(), blocks=blocks)
+        if table.get_size() != size:
+            raise ValueError('%s is not a table file' % path)
+        return table
+
+
+class Tablebase:
+    """Represents a collection of endgame tables, which can be generated, saved, loaded and probed"""
+
+    def __init__(self, directory=None):
+        """Sets the directory tables are saved to and loaded from, and loads any tables already there"""
+
+        self._directory = directory
+        self._tables = {}
+        if directory is not None and os.path.isdir(directory):
+            for file_name in sorted(os.listdir(directory)):
+                if file_name.endswith(FILE_SUFFIX):
+                    self.add_table(EndgameTable.load(os.path.join(directory, file_name)))
+
+    def add_table(self, table):
+        """Adds a table to the collection"""
+
+        self._tables[table.get_material()] = table
+
+    def get_table(self, material):
+        """Returns the table with the given material name, or None if the collection does not have it"""
+
+        return self._tables.get(material)
+
+    def get_materials(self):
+        """Returns a sorted list of the material names of the tables in the collection"""
+
+        return sorted(self._tables)
+
+    def has_material(self, material):
+        """
+        Returns True if the collection can answer positions with the given material, directly or with colors swapped
+        """
+
+        return material in self._tables or flipped_material_name(material) in self._tables
+
+    def generate(self, material, report=None):
+        """
+        Generates the table for the given material name, first generating any smaller table a capture leads to that the
+        collection does not have, and saves each table to the directory if there is one.  report, if given, is called
+        with a dictionary for each generated table: material, seconds, positions, wins, losses, draws, longest and
+        file_bytes
+        """
+
+        codes = material_codes(material)
+        for captured in range(1, len(codes)):
+            if codes[captured] & 7 == KING:
+                continue
+            remaining = codes[:captured] + codes[captured + 1:]
+            smaller = material_name(''.join(PIECE_SYMBOLS[code] for code in remaining if code < 8 and code != KING),
+                                    ''.join(PIECE_SYMBOLS[code & 7] for code in remaining
+                                            if code >= 8 and code != KING + 8))
+            if not self.has_material(smaller):
+                self.generate(smaller, report)
+
+        start_time = time.perf_counter()
+        table = generate_table(material, self)
+        elapsed = time.perf_counter() - start_time
+        self.add_table(table)
+
+        file_bytes = None
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+            file_bytes = table.save(os.path.join(self._directory, material + FILE_SUFFIX))
+        if report is not None:
+            stats = table.get_stats()
+            stats.update(material=material, seconds=elapsed, file_bytes=file_bytes)
+            report(stats)
+        return table
+
+    def lookup(self, placement, white_to_move):
+        """
+        Takes in a list of (piece code, square index) pairs for every piece on the board and whose turn it is.  Returns
+        the stored value of the position (see the module description), or None if the collection has no table for it
+        """
+
+        white_symbols = ''.join(PIECE_SYMBOLS[code] for code, _ in placement if code < 8 and code != KING)
+        black_symbols = ''.join(PIECE_SYMBOLS[code & 7] for code, _ in placement if code >= 8 and code != KING + 8)
+        material = material_name(white_symbols, black_symbols)
+
+        # A table for the other colors answers the position flipped top to bottom with the colors swapped
+        table = self._tables.get(material)
+        if table is None:
+            table = self._tables.get(flipped_material_name(material))
+            if table is None:
+                return None
+            placement = [(code ^ 8, square ^ 56) for code, square in placement]
+            white_to_move = not white_to_move
+
+        squares = [square for code, square in sorted(placement, key=lambda piece: _sort_key(piece[0]))]
+        return table.get_value(position_index(squares, white_to_move))
+
+    def probe(self, game):
+        """
+        Takes in a ChessVar and returns the value of its position (see the module description), or None if there is
+        no table for it, the game is over, or a fairy piece could still enter the board
+        """
+
+        codes = game.to_codes()
+        if 64 - codes.count(EMPTY_CODE, 0, 64) > MAX_PIECES or game.get_game_state() != 'UNFINISHED':
+            return None
+
+        placement = [(code, square) for square, code in enumerate(codes[:64]) if code != EMPTY_CODE]
+
+        # A player may enter a reserve piece once they have lost a power piece, so a reserve only matters if the
+        # player has already lost one or still has one that could be captured
+        for color, reserve_flags in ((WHITE, codes[65:67]), (BLACK, codes[67:69])):
+            if any(reserve_flags) and (game.get_power_pieces_taken('WHITE' if color == WHITE else 'BLACK') > 0 or any(
+                    code >> 3 == color and KNIGHT <= code & 7 <= QUEEN for code, _ in placement)):
+                return None
+
+        return self.lookup(placement, codes[64] == 1)
+
+
+def _targets(code, square, occupied):
+    """
+    Takes in a piece code, its square and a dictionary of occupied squares to piece codes.  Returns a list of the
+    squares the piece may move to: empty squares and squares holding the opponent's pieces
+    """
+
+    color = code >> 3
+    kind = code & 7
+    targets = []
+    if kind == PAWN:
+        target = square + _PAWN_STEPS[color]
+        if 0 <= target < 64 and target not in occupied:
+            targets.append(target)
+            if square >> 3 == _PAWN_START_ROWS[color] and target + _PAWN_STEPS[color] not in occupied:
+                targets.append(target + _PAWN_STEPS[color])
+        for target in PAWN_ATTACKERS[1 - color][square]:
+            if target in occupied and occupied[target] >> 3 != color:
+                targets.append(target)
+    elif kind == KNIGHT or kind == KING:
+        for target in (KNIGHT_TARGETS if kind == KNIGHT else KING_TARGETS)[square]:
+            if target not in occupied or occupied[target] >> 3 != color:
+                targets.append(target)
+    else:
+        rays = RAYS[square]
+        for direction in SLIDING_DIRECTIONS[code]:
+            for target in rays[direction]:
+                if target in occupied:
+                    if occupied[target] >> 3 != color:
+                        targets.append(target)
+                    break
+                targets.append(target)
+    return targets
+
+
+def _sources(code, square, occupied):
+    """
+    Takes in a piece code, its square and a dictionary of occupied squares.  Returns a list of the empty squares the
+    piece could have moved from to reach its square without capturing
+    """
+
+    color = code >> 3
+    kind = code & 7
+    sources = []
+    if kind == PAWN:
+        step = _PAWN_STEPS[color]
+        source = square - step
+        if 0 <= source < 64 and source not in occupied and source >> 3 != (0 if color == WHITE else 7):
+            sources.append(source)
+            if source >> 3 == _PAWN_START_ROWS[color] + (1 if color == WHITE else -1) and \
+                    source - step not in occupied:
+                sources.append(source - step)
+    elif kind == KNIGHT or kind == KING:
+        for source in (KNIGHT_TARGETS if kind == KNIGHT else KING_TARGETS)[square]:
+            if source not in occupied:
+                sources.append(source)
+    else:
+        rays = RAYS[square]
+        for direction in SLIDING_DIRECTIONS[code]:
+            for source in rays[OPPOSITE_DIRECTIONS[direction]]:
+                if source in occupied:
+                    break
+                sources.append(source)
+    return sources
+
+
+def _placements(codes):
+    """
+    Yields (index, squares) for every index slot of a table with the given piece codes, in index order.  squares is
+    None for a slot that is not a position: two pieces on one square, or a Pawn on its own back row
+    """
+
+    index = 0
+    for white_to_move in (True, False):
+        for king_slot in range(32):
+            king_square = (king_slot >> 2) * 8 + (king_slot & 3)
+            for others in itertools.product(range(64), repeat=len(codes) - 1):
+                squares = (king_square,) + others
+                valid = len(set(squares)) == len(squares)
+                if valid:
+                    for code, square in zip(codes, squares):
+                        if code & 7 == PAWN and square >> 3 == (0 if code < 8 else 7):
+                            valid = False
+                yield index, (squares if valid else None)
+                index += 1
+
+
+def generate_table(material, tablebase):
+    """
+    Generates the table for the given material name by retrograde analysis and returns it.  The tablebase must already
+    hold the tables for every position a capture can lead to
+    """
+
+    codes = material_codes(material)
+    size = 64 * 64 ** (len(codes) - 1)
+    values = bytearray(size)
+
+    # For each position: the number of turns not yet known to lose (a turn leading to a draw adds DRAW_ESCAPE so that
+    # the count never reaches zero), and the longest loss among the turns known to lose
+    remaining = bytearray(size)
+    longest_loss = bytearray(size)
+    draw_escape = 128
+
+    # Positions waiting to be solved, by distance
+    pending = [array('I') for _ in range(MAX_DISTANCE + 2)]
+
+    # First pass: count each position's turns and solve what its captures decide
+    for index, squares in _placements(codes):
+        if squares is None:
+            values[index] = INVALID
+            continue
+
+        color = WHITE if index < size // 2 else BLACK
+        occupied = dict(zip(squares, codes))
+        turn_count = 0
+        best_win = INVALID
+        for slot, code in enumerate(codes):
+            if code >> 3 != color:
+                continue
+            for target in _targets(code, squares[slot], occupied):
+                turn_count += 1
+                captured = occupied.get(target)
+                if captured is None:
+                    continue
+                if captured & 7 == KING:
+                    best_win = 1
+                    continue
+
+                # A capture leaves the table, so the smaller table gives its value
+                placement = [(other_code, target if other_slot == slot else squares[other_slot])
+                             for other_slot, other_code in enumerate(codes) if squares[other_slot] != target]
+                value = tablebase.lookup(placement, color == BLACK)
+                if value == 0:
+                    remaining[index] = draw_escape
+                elif value % 2 == 0:
+                    best_win = min(best_win, value + 1)
+                else:
+                    longest_loss[index] = max(longest_loss[index], min(value + 1, MAX_DISTANCE))
+                    turn_count -= 1
+
+        if best_win != INVALID:
+            pending[min(best_win, MAX_DISTANCE)].append(index)
+        elif turn_count == 0 and remaining[index] == 0 and longest_loss[index] > 0:
+            # Every turn is a capture that loses
+            pending[longest_loss[index]].append(index)
+        remaining[index] += turn_count
+
+    # Solve positions in order of distance.  A solved loss makes every position leading to it a win one turn longer,
+    # and a solved win takes one turn off each position leading to it; a position with no turns left is lost
+    half = size // 2
+    for distance in range(1, MAX_DISTANCE + 1):
+        solved = pending[distance]
+        pending[distance] = None
+        for index in solved:
+            if values[index] != 0:
+                continue
+            values[index] = distance
+
+            # Recover the position from its index.  The previous turn was made by the other player
+            color = WHITE if index < half else BLACK
+            rest = index % half
+            squares = []
+            for _ in range(len(codes) - 1):
+                rest, square = divmod(rest, 64)
+                squares.append(square)
+            squares.append((rest >> 2) * 8 + (rest & 3))
+            squares.reverse()
+            occupied = dict(zip(squares, codes))
+            mover = 1 - color
+
+            for slot, code in enumerate(codes):
+                if code >> 3 != mover:
+                    continue
+                for source in _sources(code, squares[slot], occupied):
+                    previous_squares = list(squares)
+                    previous_squares[slot] = source
+                    previous = position_index(previous_squares, mover == WHITE)
+                    if values[previous] != 0:
+                        continue
+                    if distance % 2 == 0:
+                        if distance < MAX_DISTANCE:
+                            pending[distance + 1].append(previous)
+                    else:
+                        longest_loss[previous] = max(longest_loss[previous], min(distance + 1, MAX_DISTANCE))
+                        remaining[previous] -= 1
+                        if remaining[previous] == 0:
+                            pending[longest_loss[previous]].append(previous)
+
+    return EndgameTable(material, values=values)
+
+
+def print_report(stats):
+    """Prints one line describing a generated table"""
+
+    file_text = ' %9d bytes on disk' % stats['file_bytes'] if stats['file_bytes'] is not None else ''
+    print('%-8s %8.1f s  %10d positions  %5.1f%% wins  %5.1f%% losses  %5.1f%% draws  longest %3d%s' %
+          (stats['material'], stats['seconds'], stats['positions'], 100 * stats['wins'] / stats['positions'],
+           100 * stats['losses'] / stats['positions'], 100 * stats['draws'] / stats['positions'], stats['longest'],
+           file_text))
+
+
+def main():
+    """Generates tables, or probes a position, from the command line"""
+
+    parser = argparse.ArgumentParser(description='Generate and probe Falcon-Hunter endgame tablebases')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = subparsers.add_parser('generate', help='generate tables and the smaller tables they need')
+    generate_parser.add_argument('materials', nargs='+', help='material names such as KRvK or KFvKH')
+    generate_parser.add_argument('--directory', default='tables', help='directory to save tables in')
+
+    probe_parser = subparsers.add_parser('probe', help='look up a position')
+    probe_parser.add_argument('--fen', required=True, help='position to look up')
+    probe_parser.add_argument('--directory', default='tables', help='directory to load tables from')
+
+    arguments = parser.parse_args()
+    tablebase = Tablebase(arguments.directory)
+    if arguments.command == 'generate':
+        for material in arguments.materials:
+            if tablebase.get_table(material) is None:
+                tablebase.generate(material, print_report)
+        return
+
+    value = tablebase.probe(ChessVar.from_fen(arguments.fen))
+    if value is None:
+        print('position not in tablebase')
+    elif value == 0:
+        print('draw')
+    elif value % 2 == 1:
+        print('player to move captures the King in %d turns' % value)
+    else:
+        print('player to move loses the King in %d turns' % value)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  A fixed-size transposition table for searching Falcon-Hunter positions.  Results are stored by the
+#               position's Zobrist hash (ChessVar.position_hash) in two preallocated arrays, so the table never grows
+#               past the memory it was given.  Each bucket holds two entries: one kept for the deepest search of the
+#               positions that share the bucket, and one that is always replaced by the newest result.
+
+from array import array
+
+from ChessVar import FAIRY_ENTRY_PAIRS, MOVE_PAIRS, SQUARE_NAMES
+
+# Kinds of score stored with an entry: the exact score, a lower bound (the search failed high) or an upper bound (the
+# search failed low)
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Each entry is a 64-bit key plus one 64-bit word packing the best move, bound type, depth and score
+BYTES_PER_ENTRY = 16
+ENTRIES_PER_BUCKET = 2
+
+# Bit layout of the packed word.  The score is stored with an offset so that it is never negative, which also means an
+# occupied entry never has a packed word of zero
+MOVE_BITS = 13
+BOUND_SHIFT = MOVE_BITS
+DEPTH_SHIFT = BOUND_SHIFT + 2
+SCORE_SHIFT = DEPTH_SHIFT + 8
+SCORE_OFFSET = 1 << 24
+
+# Move codes: a move is start index * 64 + end index, a fairy piece entry is 4096 + piece number * 64 + square index,
+# and NO_MOVE is stored when there is no best move
+FAIRY_SYMBOLS = 'FHfh'
+NO_MOVE = (1 << MOVE_BITS) - 1
+SQUARE_INDEXES = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+
+def encode_move(turn):
+    """Takes in a turn in the format of ChessVar.generate_legal_moves and returns its move code"""
+
+    if turn is None:
+        return NO_MOVE
+    if len(turn[0]) == 1:
+        return 4096 + FAIRY_SYMBOLS.index(turn[0]) * 64 + SQUARE_INDEXES[turn[1]]
+    return SQUARE_INDEXES[turn[0]] * 64 + SQUARE_INDEXES[turn[1]]
+
+
+def decode_move(move_code):
+    """Takes in a move code and returns the turn it represents, or None for NO_MOVE"""
+
+    if move_code == NO_MOVE:
+        return None
+    if move_code >= 4096:
+        symbol_number, square_index = divmod(move_code - 4096, 64)
+        return FAIRY_ENTRY_PAIRS[FAIRY_SYMBOLS[symbol_number]][square_index]
+    return MOVE_PAIRS[move_code >> 6][move_code & 63]
+
+
+class TranspositionTable:
+    """
+    Represents a transposition table with a fixed memory budget.  The number of buckets is the largest power of two
+    that fits in the budget, so a position's bucket is found by masking its hash
+    """
+
+    def __init__(self, size_mb=16):
+        """
+        Allocates the key and data arrays to fit in the given number of megabytes and sets the statistics counters to
+        zero
+        """
+
+        bucket_count = 1
+        while bucket_count * 2 * ENTRIES_PER_BUCKET * BYTES_PER_ENTRY <= size_mb * 1024 * 1024:
+            bucket_count *= 2
+
+        self._bucket_mask = bucket_count - 1
+        self._keys = array('Q', bytes(8 * bucket_count * ENTRIES_PER_BUCKET))
+        self._data = array('Q', bytes(8 * bucket_count * ENTRIES_PER_BUCKET))
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+        self._overwrites = 0
+
+    def get_capacity(self):
+        """Returns the number of entries the table can hold"""
+
+        return len(self._keys)
+
+    def get_size_bytes(self):
+        """Returns the number of bytes used by the key and data arrays"""
+
+        return len(self._keys) * BYTES_PER_ENTRY
+
+    def probe(self, key):
+        """
+        Takes in a position hash and returns a tuple (depth, score, bound, best_move) for the stored entry with that
+        hash, or None if there is no entry for it.  best_move is a turn tuple, or None if no best move was stored
+        """
+
+        self._probes += 1
+        slot = (key & self._bucket_mask) * ENTRIES_PER_BUCKET
+        keys = self._keys
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                return None
+
+        data = self._data[slot]
+        if data == 0:
+            return None
+
+        self._hits += 1
+        return ((data >> DEPTH_SHIFT) & 0xFF, (data >> SCORE_SHIFT) - SCORE_OFFSET, (data >> BOUND_SHIFT) & 3,
+                decode_move(data & NO_MOVE))
+
+    def store(self, key, depth, score, bound, best_move):
+        """
+        Stores a search result for the position with the given hash.  The result goes in the bucket's depth-preferred
+        entry if that entry holds the same position or a search no deeper than this one; otherwise it goes in the
+        bucket's always-replace entry
+        """
+
+        self._stores += 1
+        slot = (key & self._bucket_mask) * ENTRIES_PER_BUCKET
+        keys = self._keys
+        data = self._data
+        if keys[slot] != key and data[slot] != 0 and (data[slot] >> DEPTH_SHIFT) & 0xFF > depth:
+            slot += 1
+
+        if data[slot] != 0 and keys[slot] != key:
+            self._overwrites += 1
+
+        keys[slot] = key
+        data[slot] = (((score + SCORE_OFFSET) << SCORE_SHIFT) | (min(depth, 0xFF) << DEPTH_SHIFT) |
+                      (bound << BOUND_SHIFT) | encode_move(best_move))
+
+    def clear(self):
+        """Removes every entry and resets the statistics"""
+
+        capacity = len(self._keys)
+        self._keys = array('Q', bytes(8 * capacity))
+        self._data = array('Q', bytes(8 * capacity))
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+        self._overwrites = 0
+
+    def get_stats(self):
+        """
+        Returns a dictionary of usage statistics: probes, hits, hit_rate (hits per probe), stores, overwrites (stores
+        that replaced a different position) and capacity
+        """
+
+        return {
+            'probes': self._probes,
+            'hits': self._hits,
+            'hit_rate': self._hits / self._probes if self._probes else 0.0,
+            'stores': self._stores,
+            'overwrites': self._overwrites,
+            'capacity': len(self._keys),
+        }
@@ -0,0 +1,164 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Load test for GameServer.  Starts a server on a local port in this process, opens a number of client
+#               connections, creates the requested number of games (10,000 by default) spread across them, and plays
+#               every game at once.  Each game waits for the reply to one turn, then pauses for a random thinking time
+#               (two seconds on average, like a fast human game) before sending the next; --think 0 sends turns as
+#               fast as the server answers them.  Reports the turns per second and the p50 and p99 latency of a move
+#               request, measured from sending the request to reading its reply.  Client and server share one
+#               process, so this measures the server on one core with the client's own work included.
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ChessVar import ChessVar
+from GameServer import GameServer
+
+
+def make_scripts(count, length, seed):
+    """Returns count lists of length legal turns each, taken from random games that last at least that long"""
+
+    rng = random.Random(seed)
+    scripts = []
+    while len(scripts) < count:
+        game = ChessVar()
+        turns = []
+        while len(turns) < length:
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            turn = rng.choice(legal_moves)
+            game.push_turn(turn)
+            turns.append(turn)
+        if len(turns) == length:
+            scripts.append(turns)
+    return scripts
+
+
+class Client:
+    """Represents one client connection.  Replies are matched to requests by id, so many games can share it"""
+
+    def __init__(self, reader, writer):
+        """Sets the streams and starts the task that reads replies"""
+
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._pending = {}
+        self._reader_task = asyncio.ensure_future(self._read_replies())
+
+    async def request(self, message):
+        """Sends a request and returns its reply"""
+
+        self._next_id += 1
+        message['id'] = self._next_id
+        reply = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = reply
+        self._writer.write(json.dumps(message).encode() + b'\n')
+        await self._writer.drain()
+        return await reply
+
+    async def _read_replies(self):
+        """Reads reply lines and completes the matching requests"""
+
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return
+            reply = json.loads(line)
+            request_id = reply.get('id')
+            if request_id in self._pending:
+                self._pending.pop(request_id).set_result(reply)
+
+    async def close(self):
+        """Closes the connection"""
+
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._reader_task.cancel()
+
+
+async def play_game(client, script, think_time, rng, latencies):
+    """
+    Creates a game on the server and plays the script's turns, pausing for a random time averaging think_time seconds
+    before each one, and adds each move request's latency to the list
+    """
+
+    reply = await client.request({'op': 'new'})
+    game_id = reply['game']
+    for turn in script:
+        if think_time > 0:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+        if len(turn[0]) == 1:
+            message = {'op': 'enter', 'game': game_id, 'piece': turn[0], 'square': turn[1]}
+        else:
+            message = {'op': 'move', 'game': game_id, 'from': turn[0], 'to': turn[1]}
+        start_time = time.perf_counter()
+        reply = await client.request(message)
+        latencies.append(time.perf_counter() - start_time)
+        if reply['ok'] is not True:
+            raise RuntimeError('server rejected %r: %r' % (message, reply))
+
+
+async def run(arguments):
+    """Runs the load test and prints the results"""
+
+    scripts = make_scripts(200, arguments.moves, 0)
+    game_server = GameServer()
+    server = await asyncio.start_server(game_server.handle_connection, '127.0.0.1', 0,
+                                        limit=1 << 20, backlog=arguments.connections)
+    port = server.sockets[0].getsockname()[1]
+
+    clients = []
+    for _ in range(arguments.connections):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=1 << 20)
+        clients.append(Client(reader, writer))
+
+    latencies = []
+    rng = random.Random(1)
+    start_time = time.perf_counter()
+    await asyncio.gather(*(play_game(clients[number % len(clients)], scripts[number % len(scripts)], arguments.think,
+                                     rng, latencies)
+                           for number in range(arguments.games)))
+    elapsed = time.perf_counter() - start_time
+    hosted_games = game_server.get_game_count()
+
+    for client in clients:
+        await client.close()
+    while game_server.get_connection_count() > 0:
+        await asyncio.sleep(0.01)
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    print('games:                %d' % arguments.games)
+    print('games hosted:         %d' % hosted_games)
+    print('connections:          %d' % arguments.connections)
+    print('turns:                %d' % len(latencies))
+    print('elapsed (s):          %.2f' % elapsed)
+    print('turns/sec:            %.0f' % (len(latencies) / elapsed))
+    print('p50 latency (ms):     %.2f' % (1000 * latencies[len(latencies) // 2]))
+    print('p99 latency (ms):     %.2f' % (1000 * latencies[len(latencies) * 99 // 100]))
+
+
+def main():
+    """Reads the command line and runs the load test"""
+
+    parser = argparse.ArgumentParser(description='Load test GameServer')
+    parser.add_argument('--games', type=int, default=10000, help='number of concurrent games')
+    parser.add_argument('--connections', type=int, default=100, help='number of client connections')
+    parser.add_argument('--moves', type=int, default=20, help='turns played in each game')
+    parser.add_argument('--think', type=float, default=2.0, help='average seconds between turns in a game')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
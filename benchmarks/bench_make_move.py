@@ -0,0 +1,80 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Micro-benchmark for ChessVar.make_move.  Plays long random games by proposing random start and end
+#               squares (the same way a naive bot would) and reports how many make_move calls per second the rules
+#               engine can process, counting both accepted and rejected moves.  The accepted moves are then replayed on
+#               fresh games so that the cost of legal moves (including slider path checks) is reported on its own.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ChessVar import ChessVar
+
+FILES = 'abcdefgh'
+SQUARES = [column + str(row) for row in range(1, 9) for column in FILES]
+
+
+def play_random_game(rng, max_attempts):
+    """
+    Plays a single game by repeatedly proposing random moves until the game ends or the attempt budget runs out.
+    Returns the number of make_move calls made and the list of accepted moves
+    """
+
+    game = ChessVar()
+    calls = 0
+    accepted = []
+    while calls < max_attempts and game.get_game_state() == 'UNFINISHED':
+        calls += 1
+        start_location = rng.choice(SQUARES)
+        end_location = rng.choice(SQUARES)
+        if game.make_move(start_location, end_location):
+            accepted.append((start_location, end_location))
+    return calls, accepted
+
+
+def replay_games(move_lists):
+    """Replays each list of accepted moves on a fresh game and returns the elapsed time spent in make_move"""
+
+    elapsed = 0.0
+    for moves in move_lists:
+        game = ChessVar()
+        start_time = time.perf_counter()
+        for start_location, end_location in moves:
+            game.make_move(start_location, end_location)
+        elapsed += time.perf_counter() - start_time
+    return elapsed
+
+
+def main():
+    """Runs the benchmark and prints the make_move throughput"""
+
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(2024)
+    total_calls = 0
+    move_lists = []
+    start_time = time.perf_counter()
+    for _ in range(games):
+        calls, accepted = play_random_game(rng, 20000)
+        total_calls += calls
+        move_lists.append(accepted)
+    elapsed = time.perf_counter() - start_time
+
+    total_accepted = sum(len(moves) for moves in move_lists)
+    replay_elapsed = min(replay_games(move_lists) for _ in range(5))
+
+    print('games:                ', games)
+    print('make_move calls:      ', total_calls)
+    print('accepted moves:       ', total_accepted)
+    print('random play (s):       %.3f' % elapsed)
+    print('calls/sec:             %.0f' % (total_calls / elapsed))
+    print('legal replay (s):      %.3f' % replay_elapsed)
+    print('legal moves/sec:       %.0f' % (total_accepted / replay_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Memory and throughput benchmark for holding many ChessVar games at once.  Creates the requested number
+#               of games (100,000 by default), plays the same short opening in each, and reports the memory used per
+#               game and the make_move throughput across all of them.  Memory is traced on a separate sample of games,
+#               since tracing slows object creation.
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ChessVar import ChessVar
+
+OPENING = [('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5'), ('b1', 'c3'), ('d5', 'a2'), ('a1', 'a2'),
+           ('g8', 'f6'), ('g1', 'f3'), ('b8', 'c6')]
+
+
+def main():
+    """Runs the benchmark and prints memory per game, game creation rate and make_move throughput"""
+
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    sample_count = min(game_count, 10000)
+    tracemalloc.start()
+    sample = [ChessVar() for _ in range(sample_count)]
+    for start_location, end_location in OPENING:
+        for game in sample:
+            game.make_move(start_location, end_location)
+    memory_per_game = tracemalloc.get_traced_memory()[0] / sample_count
+    tracemalloc.stop()
+    del sample
+
+    start_time = time.perf_counter()
+    games = [ChessVar() for _ in range(game_count)]
+    create_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for start_location, end_location in OPENING:
+        for game in games:
+            game.make_move(start_location, end_location)
+    move_elapsed = time.perf_counter() - start_time
+
+    print('games:                 ', game_count)
+    print('memory per game (KB):   %.1f' % (memory_per_game / 1024))
+    print('total memory (MB):      %.1f' % (memory_per_game * game_count / 1024 / 1024))
+    print('games created/sec:      %.0f' % (game_count / create_elapsed))
+    print('make_move calls/sec:    %.0f' % (game_count * len(OPENING) / move_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Benchmark for ChessVar.generate_legal_moves.  Plays seeded random games using the move generator and
+#               reports how many positions per second it can process, timing only the generate_legal_moves calls.
+#               Pass 'bitboard' as the second argument to run the games on the bitboard backend instead.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ChessVar import ChessVar
+
+
+def main():
+    """Runs the benchmark and prints the move generation throughput"""
+
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    backend = sys.argv[2] if len(sys.argv) > 2 else 'objects'
+    rng = random.Random(2024)
+    positions = 0
+    moves_generated = 0
+    elapsed = 0.0
+
+    for _ in range(game_count):
+        game = ChessVar(backend=backend)
+        while game.get_game_state() == 'UNFINISHED' and positions < game_count * 300:
+            start_time = time.perf_counter()
+            legal_moves = game.generate_legal_moves()
+            elapsed += time.perf_counter() - start_time
+            positions += 1
+            moves_generated += len(legal_moves)
+
+            move = rng.choice(legal_moves)
+            if len(move[0]) == 1:
+                game.enter_fairy_piece(*move)
+            else:
+                game.make_move(*move)
+
+    print('positions:            ', positions)
+    print('moves generated:      ', moves_generated)
+    print('elapsed (s):           %.3f' % elapsed)
+    print('positions/sec:         %.0f' % (positions / elapsed))
+    print('moves/sec:             %.0f' % (moves_generated / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Frames-per-second benchmark for drawing boards, as a terminal spectator would after every turn.  Plays
+#               random games to collect a sequence of positions (2,000 by default), then times drawing every one of
+#               them with ChessVar.display_board, with BoardRenderer drawing full frames, and with BoardRenderer in
+#               diff mode, which writes only the changes from the previous frame.  Frames are written to the null device
+#               so the time includes building the text and the write calls but not a terminal's own drawing.  Also
+#               reports the bytes written per frame, which is what a real terminal has to process.
+
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BoardRenderer import BoardRenderer
+from ChessVar import ChessVar
+
+
+class CountingStream:
+    """Represents a text stream that writes to another stream and counts the characters written"""
+
+    def __init__(self, stream):
+        """Sets the stream written to"""
+
+        self._stream = stream
+        self._characters = 0
+
+    def write(self, text):
+        """Writes the text and counts it"""
+
+        self._characters += len(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        """Flushes the stream written to"""
+
+        self._stream.flush()
+
+    def get_characters(self):
+        """Returns the number of characters written"""
+
+        return self._characters
+
+
+def collect_games(position_count, seed):
+    """Returns a list of (game, turns) pairs from random games holding position_count positions between them"""
+
+    rng = random.Random(seed)
+    games = []
+    positions = 0
+    while positions < position_count:
+        game = ChessVar()
+        turns = []
+        while positions + len(turns) < position_count and game.generate_legal_moves():
+            turn = rng.choice(game.generate_legal_moves())
+            game.push_turn(turn)
+            turns.append(turn)
+        games.append(turns)
+        positions += len(turns) + 1
+    return games
+
+
+def time_frames(games, draw):
+    """
+    Replays the games, calling draw(game, stream, first_frame) before the first turn of each game and after every turn.
+    Returns the number of frames, the seconds spent drawing them and the number of characters written
+    """
+
+    with open(os.devnull, 'w') as null_stream:
+        stream = CountingStream(null_stream)
+        frames = 0
+        elapsed = 0.0
+        for turns in games:
+            game = ChessVar()
+            start_time = time.perf_counter()
+            draw(game, stream, True)
+            elapsed += time.perf_counter() - start_time
+            frames += 1
+            for turn in turns:
+                game.push_turn(turn)
+                start_time = time.perf_counter()
+                draw(game, stream, False)
+                elapsed += time.perf_counter() - start_time
+                frames += 1
+    return frames, elapsed, stream.get_characters()
+
+
+def main():
+    """Runs the benchmark and prints frames per second and characters per frame for each way of drawing"""
+
+    position_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    games = collect_games(position_count, 0)
+
+    def display_board(game, stream, first_frame):
+        with contextlib.redirect_stdout(stream):
+            game.display_board()
+
+    full_renderer = BoardRenderer()
+    diff_renderer = BoardRenderer(diff=True)
+
+    def draw_diff(game, stream, first_frame):
+        if first_frame:
+            diff_renderer.reset()
+        diff_renderer.draw(game, stream)
+
+    print('%-26s %10s %12s' % ('', 'frames/sec', 'chars/frame'))
+    for name, draw in (('ChessVar.display_board', display_board),
+                       ('BoardRenderer full', lambda game, stream, first_frame: full_renderer.draw(game, stream)),
+                       ('BoardRenderer diff', draw_diff)):
+        frames, elapsed, characters = time_frames(games, draw)
+        print('%-26s %10.0f %12.0f' % (name, frames / elapsed, characters / frames))
+
+
+if __name__ == '__main__':
+    main()
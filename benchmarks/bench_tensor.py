@@ -0,0 +1,49 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Throughput benchmark for BoardTensor.positions_to_tensor.  Plays random games to collect positions
+#               (100,000 by default), then times converting all of them to one (N, 21, 8, 8) tensor.  Also checks that
+#               the batch result matches ChessVar.to_planes for every position.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BoardTensor import board_planes, positions_to_tensor
+from ChessVar import ChessVar
+
+
+def main():
+    """Runs the benchmark and prints the conversion rate in positions per second"""
+
+    position_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    rng = random.Random(0)
+    games = []
+    while len(games) < position_count:
+        game = ChessVar()
+        for _ in range(rng.randint(0, 60)):
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+        games.append(game)
+
+    start_time = time.perf_counter()
+    tensor = positions_to_tensor(games)
+    elapsed = time.perf_counter() - start_time
+
+    mismatches = sum(1 for index, game in enumerate(games) if (tensor[index] != board_planes(game)).any())
+
+    print('positions:         ', position_count)
+    print('tensor shape:      ', tensor.shape)
+    print('elapsed (s):        %.3f' % elapsed)
+    print('positions/sec:      %.0f' % (position_count / elapsed))
+    print('to_planes mismatches:', mismatches)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Shared setup for the test suite.  The modules live at the top of the repository rather than in a
+#               package, so the repository directory is put on the import path for every test module.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
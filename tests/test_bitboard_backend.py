@@ -0,0 +1,115 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Differential tests for ChessVar's bitboard backend.  The same games are played on a ChessVar with the
+#               default object backend and one with backend='bitboard', and the two must agree move for move: perft
+#               counts below every root turn, legal moves and captures, positions, accepted and rejected turns with
+#               their reasons, and attack queries.  BitboardBoard.py can run the random comparison at any scale.
+
+import pytest
+
+from BitboardBoard import BitboardBoard, compare_backends
+from ChessVar import BLACK, EMPTY_CODE, PAWN, PERFT_POSITIONS, SQUARE_NAMES, WHITE, ChessVar, perft_position
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_random_games_agree(seed):
+    """Random games with random proposals and take-backs give the same results on both backends"""
+
+    assert compare_backends(12, seed) > 0
+
+
+@pytest.mark.parametrize('name', sorted(PERFT_POSITIONS))
+def test_perft_divide_agrees(name):
+    """Both backends count the same positions below every root turn, matching the stored baseline"""
+
+    reference = perft_position(name).perft_divide(3)
+    bitboard = perft_position(name, 'bitboard').perft_divide(3)
+    assert bitboard == reference
+    assert sum(bitboard.values()) == PERFT_POSITIONS[name][1][3]
+
+
+@pytest.mark.parametrize('turn, reason', [
+    (('e2', 'e4'), 'BLOCKED_PATH'),
+    (('e2', 'e5'), 'ILLEGAL_SHAPE'),
+    (('d2', 'd3'), 'ILLEGAL_SHAPE'),
+    (('d2', 'e3'), None),
+    (('a1', 'a4'), 'BLOCKED_PATH'),
+    (('c1', 'g5'), 'BLOCKED_PATH'),
+    (('f1', 'f3'), 'ILLEGAL_SHAPE'),
+    (('g1', 'g3'), 'ILLEGAL_SHAPE'),
+])
+def test_rejection_reasons_agree(turn, reason):
+    """Shape and path rejections give the same reason on both backends"""
+
+    fen = 'rnbqkbnr/pppppppp/8/8/8/3pn3/PPPPPPPP/RNBQKBNR w FHfh 0 0'
+    for backend in ('objects', 'bitboard'):
+        game = ChessVar.from_fen(fen, backend)
+        assert game.make_move(*turn) is (reason is None)
+        if reason is not None:
+            assert game.get_last_rejection() == reason
+
+
+def test_fairy_piece_half_rays():
+    """The Falcon and Hunter slide only along their own forward and backward rays, which differ by color"""
+
+    game = ChessVar.from_fen('4k3/8/8/3f4/8/3F4/8/4K3 w Hh 1 1', 'bitboard')
+    reference = ChessVar.from_fen(game.to_fen())
+    falcon_moves = sorted(end for start, end in game.generate_legal_moves() if start == 'd3')
+    assert falcon_moves == sorted(['c4', 'b5', 'a6', 'e4', 'f5', 'g6', 'h7', 'd2', 'd1'])
+    assert sorted(game.generate_legal_moves()) == sorted(reference.generate_legal_moves())
+    assert game.make_move('d3', 'e4') is True
+    black_falcon_moves = sorted(end for start, end in game.generate_legal_moves() if start == 'd5')
+    assert black_falcon_moves == sorted(['c4', 'b3', 'a2', 'e4', 'd6', 'd7', 'd8'])
+
+
+def test_attack_queries_agree():
+    """attackers_of and is_attacked find the same pieces on both backends, including the fairy pieces"""
+
+    fen = 'r3k2r/1p3p2/2n1bq2/3F4/2B1h3/5N2/PP3PPP/R2QK2R w Hf 1 1'
+    reference = ChessVar.from_fen(fen)
+    bitboard = ChessVar.from_fen(fen, 'bitboard')
+    for location in SQUARE_NAMES:
+        for color in ('WHITE', 'BLACK'):
+            assert sorted(bitboard.attackers_of(location, color)) == sorted(reference.attackers_of(location, color))
+            assert bitboard.is_attacked(location, color) == reference.is_attacked(location, color)
+
+
+def test_loaded_positions_keep_the_bitboards_in_step():
+    """from_fen, from_packed, from_snapshot and restore all leave the bitboards matching the board"""
+
+    reference = perft_position('both-reserves')
+    fen = reference.to_fen()
+    expected = sorted(reference.generate_legal_moves())
+    games = [ChessVar.from_fen(fen, 'bitboard'), ChessVar.from_packed(reference.to_packed(), 'bitboard'),
+             ChessVar.from_snapshot(reference.snapshot(), 'bitboard')]
+    restored = ChessVar(backend='bitboard')
+    restored.restore(reference.snapshot())
+    games.append(restored)
+    for game in games:
+        assert game.get_backend() == 'bitboard'
+        assert sorted(game.generate_legal_moves()) == expected
+        assert game.to_fen() == fen
+
+
+def test_board_core_tracks_codes():
+    """BitboardBoard's bitboards follow set_square and move_piece, and load rebuilds them from codes"""
+
+    game = ChessVar()
+    board = BitboardBoard(game.to_codes()[:64])
+    assert board.get_occupied(WHITE) == 0xFFFF
+    assert board.get_occupied(BLACK) == 0xFFFF << 48
+    board.move_piece(SQUARE_NAMES.index('e2'), SQUARE_NAMES.index('e4'), PAWN, EMPTY_CODE)
+    assert board.get_pieces(PAWN) == (0xFF << 8) ^ (1 << 12) ^ (1 << 28)
+    board.set_square(SQUARE_NAMES.index('e4'), PAWN, EMPTY_CODE)
+    assert board.get_occupied(WHITE) == 0xFFFF ^ (1 << 12)
+    board.load(game.to_codes()[:64])
+    assert board.get_occupied(WHITE) == 0xFFFF
+
+
+def test_unknown_backend_is_rejected():
+    """Only the names in BACKENDS are accepted"""
+
+    assert ChessVar().get_backend() == 'objects'
+    with pytest.raises(ValueError):
+        ChessVar(backend='mailbox')
@@ -0,0 +1,149 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for board display: ChessVar.display_board, which must print the same board its square-by-square
+#               version did, and BoardRenderer's frames.  The changes BoardRenderer writes in diff mode are played on a
+#               small model of an ANSI terminal, which must then show exactly the full frame for each position.
+
+import io
+import random
+import re
+
+from BoardRenderer import BoardRenderer
+from ChessVar import ChessVar
+
+
+def square_by_square_board(game):
+    """Returns the board as the original display_board printed it, one print call per square"""
+
+    output = io.StringIO()
+    print('\n     Falcon-Hunter Variant of Chess\n', file=output)
+    print('     a   b   c   d   e   f   g   h', file=output)
+    print('   ---------------------------------', file=output)
+    for row in range(8, 0, -1):
+        print('%d  |' % row, game.get_square_symbol('a%d' % row), end=' ', file=output)
+        for column in 'bcdefg':
+            print('|', game.get_square_symbol('%s%d' % (column, row)), end=' ', file=output)
+        print('|', game.get_square_symbol('h%d' % row), '|', file=output)
+        print('   ---------------------------------', file=output)
+    return output.getvalue()
+
+
+class Terminal:
+    """Represents the screen of a terminal understanding the escape sequences BoardRenderer writes"""
+
+    def __init__(self):
+        """Starts with an empty screen and the cursor at the top left"""
+
+        self._lines = []
+        self._row = 0
+        self._column = 0
+
+    def write(self, text):
+        """Applies text to the screen: printable characters, newlines and the clear, cursor and erase sequences"""
+
+        for token in re.findall(r'\x1b\[H\x1b\[2J|\x1b\[(\d+);(\d+)H|(\x1b\[2K)|(.)', text, re.DOTALL):
+            row, column, erase, character = token
+            if row:
+                self._row, self._column = int(row) - 1, int(column) - 1
+            elif erase:
+                self._line()[:] = []
+            elif character == '\n':
+                self._row += 1
+                self._column = 0
+            elif character:
+                line = self._line()
+                line.extend(' ' * (self._column + 1 - len(line)))
+                line[self._column] = character
+                self._column += 1
+            else:
+                self._lines = []
+                self._row = self._column = 0
+
+    def get_text(self):
+        """Returns the screen as text, with a newline after each line"""
+
+        return ''.join(''.join(line) + '\n' for line in self._lines)
+
+    def _line(self):
+        """Returns the list of characters on the cursor's line, adding empty lines up to it"""
+
+        while len(self._lines) <= self._row:
+            self._lines.append([])
+        return self._lines[self._row]
+
+
+def test_display_board_prints_the_original_board(capsys):
+    """The board built as one string matches the board printed square by square, for positions of a random game"""
+
+    rng = random.Random(0)
+    game = ChessVar()
+    for _ in range(60):
+        game.display_board()
+        assert capsys.readouterr().out == square_by_square_board(game)
+        legal_moves = game.generate_legal_moves()
+        if not legal_moves:
+            break
+        game.push_turn(rng.choice(legal_moves))
+
+
+def test_starting_frame():
+    """The full frame labels the rows and columns, shows '.' for empty squares and ends with the panel"""
+
+    renderer = BoardRenderer()
+    frame = renderer.render(ChessVar())
+    lines = frame.split('\n')
+    assert lines[0] == lines[9] == '  a b c d e f g h'
+    assert lines[1] == '8 r n b q k b n r 8'
+    assert lines[4] == '5 . . . . . . . . 5'
+    assert lines[8] == '1 R N B Q K B N R 1'
+    assert lines[10:13] == ['White reserve F H  power pieces lost 0', 'Black reserve f h  power pieces lost 0',
+                            'White to move']
+    assert len(lines) == renderer.get_frame_height() + 1 and lines[-1] == ''
+
+    renderer = BoardRenderer(show_reserve=False)
+    assert renderer.render(ChessVar()) == frame[:frame.index('White reserve')]
+    assert renderer.get_frame_height() == 10
+
+
+def test_changes_redraw_the_full_frame():
+    """On a terminal, the first frame and the changes after each turn always show what a full frame would"""
+
+    for show_reserve in (True, False):
+        rng = random.Random(1)
+        game = ChessVar()
+        renderer = BoardRenderer(show_reserve, diff=True)
+        terminal = Terminal()
+        first = renderer.render_changes(game)
+        assert first.startswith('\x1b[H\x1b[2J')
+        terminal.write(first)
+        for _ in range(150):
+            assert terminal.get_text() == renderer.render(game)
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+            changes = renderer.render_changes(game)
+            assert len(changes) < len(renderer.render(game))
+            terminal.write(changes)
+        assert renderer.render_changes(game) == ''
+
+
+def test_reset_and_draw():
+    """draw writes the full frame, or in diff mode only the changes, and after reset the screen is cleared again"""
+
+    game = ChessVar()
+    stream = io.StringIO()
+    BoardRenderer().draw(game, stream)
+    assert stream.getvalue() == BoardRenderer().render(game)
+
+    renderer = BoardRenderer(diff=True)
+    stream = io.StringIO()
+    renderer.draw(game, stream)
+    renderer.draw(game, stream)
+    assert stream.getvalue() == '\x1b[H\x1b[2J' + renderer.render(game)
+    game.push_turn(('e2', 'e4'))
+    renderer.draw(game, stream)
+    assert not stream.getvalue().endswith(renderer.render(game))
+    renderer.reset()
+    assert renderer.render_changes(game) == '\x1b[H\x1b[2J' + renderer.render(game)
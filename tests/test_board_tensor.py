@@ -0,0 +1,73 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for the feature planes of ChessVar.to_planes and the NumPy tensors BoardTensor builds from them.
+#               The batch conversion must give the same planes as converting each game on its own, and the planes must
+#               mark exactly the squares, player to move and reserves of the position.  Skipped without NumPy.
+
+import random
+
+import pytest
+
+from ChessVar import PIECE_SYMBOLS, PLANE_COUNT, SIDE_TO_MOVE_PLANE, SQUARE_NAMES, ChessVar
+
+numpy = pytest.importorskip('numpy')
+BoardTensor = pytest.importorskip('BoardTensor')
+
+
+def random_games(seed, game_count, max_plies=120):
+    """Plays seeded random games of random lengths and returns them, each left at its last position"""
+
+    rng = random.Random(seed)
+    games = []
+    for _ in range(game_count):
+        game = ChessVar()
+        for _ in range(rng.randint(0, max_plies)):
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+        games.append(game)
+    return games
+
+
+def test_planes_mark_the_position():
+    """Each piece plane marks the squares holding its piece, and the flag planes are all ones or all zeros"""
+
+    for game in random_games(0, 20):
+        planes = BoardTensor.board_planes(game)
+        assert planes.shape == (PLANE_COUNT, 8, 8)
+        assert planes.dtype == numpy.uint8
+        for index, location in enumerate(SQUARE_NAMES):
+            symbol = game.get_square_symbol(location)
+            expected = [int(symbol != ' ' and code == PIECE_SYMBOLS.index(symbol))
+                        for code in range(SIDE_TO_MOVE_PLANE)]
+            assert list(planes[:SIDE_TO_MOVE_PLANE, index // 8, index % 8]) == expected
+
+        flags = [game.get_turn() == 'WHITE'] + [game.is_fairy_piece_available(symbol) is True for symbol in 'FHfh']
+        for plane, flag in zip(planes[SIDE_TO_MOVE_PLANE:], flags):
+            assert (plane == int(flag)).all()
+
+
+def test_starting_position_planes():
+    """White's Pawns fill row 2 and Black's row 7, White is to move, and every fairy piece is in reserve"""
+
+    planes = BoardTensor.board_planes(ChessVar())
+    assert (planes[PIECE_SYMBOLS.index('P'), 1] == 1).all()
+    assert (planes[PIECE_SYMBOLS.index('p'), 6] == 1).all()
+    assert planes[PIECE_SYMBOLS.index('K'), 0, 4] == 1
+    assert planes[PIECE_SYMBOLS.index('k'), 7, 4] == 1
+    assert planes[:SIDE_TO_MOVE_PLANE].sum() == 32
+    assert (planes[SIDE_TO_MOVE_PLANE:] == 1).all()
+
+
+def test_batch_matches_each_game_on_its_own():
+    """positions_to_tensor stacks the same planes board_planes gives for each game, in the order of the games"""
+
+    games = random_games(1, 40)
+    tensor = BoardTensor.positions_to_tensor(games)
+    assert tensor.shape == (len(games), PLANE_COUNT, 8, 8)
+    assert tensor.dtype == numpy.uint8
+    for game, planes in zip(games, tensor):
+        assert (planes == BoardTensor.board_planes(game)).all()
+    assert BoardTensor.positions_to_tensor([]).shape == (0, PLANE_COUNT, 8, 8)
@@ -0,0 +1,85 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for ChessVar's optional draw rules: a draw by the third occurrence of a position, a draw after
+#               the limit of turns without a capture, and the position history kept correct when turns are taken back,
+#               including turns made before the rules were turned on.
+
+from ChessVar import ChessVar
+
+# Knight moves out and back for both players, which repeats the starting position every four turns
+KNIGHT_SHUFFLE = [('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')]
+
+
+def test_third_repetition_is_a_draw():
+    """The starting position occurring for the third time draws the game, but not before"""
+
+    game = ChessVar(draw_rules=True)
+    for turn in KNIGHT_SHUFFLE * 2:
+        assert game.get_game_state() == 'UNFINISHED'
+        assert game.make_move(*turn) is True
+    assert game.get_repetition_count() == 3
+    assert game.get_game_state() == 'DRAW'
+    assert game.generate_legal_moves() == []
+
+
+def test_no_capture_limit_is_a_draw():
+    """Turns without a capture draw the game when they reach the limit"""
+
+    game = ChessVar(draw_rules=True, no_capture_limit=6)
+    for turn in [('b1', 'c3'), ('b8', 'c6'), ('c3', 'b5'), ('c6', 'b4'), ('a2', 'a3')]:
+        assert game.make_move(*turn) is True
+    assert game.get_game_state() == 'UNFINISHED'
+    assert game.make_move('h7', 'h6') is True
+    assert game.get_plies_since_capture() == 6
+    assert game.get_game_state() == 'DRAW'
+
+
+def test_rules_off_never_draw():
+    """Without the draw rules, repeating the position any number of times does not end the game"""
+
+    game = ChessVar()
+    for turn in KNIGHT_SHUFFLE * 3:
+        assert game.make_move(*turn) is True
+    assert game.get_game_state() == 'UNFINISHED'
+    assert game.get_repetition_count() is None
+
+
+def test_popping_a_draw_takes_back_the_repetition():
+    """Taking back the turn that drew the game makes it unfinished again, with the counts from before that turn"""
+
+    game = ChessVar(draw_rules=True)
+    for turn in KNIGHT_SHUFFLE * 2:
+        assert game.push_move(*turn) is True
+    assert game.get_game_state() == 'DRAW'
+    assert game.pop_move() is True
+    assert game.get_game_state() == 'UNFINISHED'
+
+    # The position before the drawing turn has occurred once in each cycle of the shuffle
+    assert game.get_repetition_count() == 2
+    assert game.push_move('f6', 'g8') is True
+    assert game.get_game_state() == 'DRAW'
+
+
+def test_popping_past_the_point_the_rules_were_turned_on():
+    """Turns pushed before set_draw_rules(True) can be taken back, and the history stays right afterwards"""
+
+    game = ChessVar()
+    assert game.push_move('g1', 'f3') is True
+    assert game.push_move('g8', 'f6') is True
+    game.set_draw_rules(True)
+    assert game.get_repetition_count() == 1
+
+    assert game.pop_move() is True
+    assert game.pop_move() is True
+    assert game.get_repetition_count() == 0
+    assert game.pop_move() is False
+
+    # Play the shuffle from the start: the starting position was not counted, so it takes one more cycle to draw
+    for turn in KNIGHT_SHUFFLE * 2:
+        assert game.push_move(*turn) is True
+    assert game.get_game_state() == 'UNFINISHED'
+    assert game.get_repetition_count() == 2
+    while game.pop_move() is True:
+        pass
+    assert game.get_repetition_count() == 0
@@ -0,0 +1,107 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for ChessVar.evaluate and the material and piece-square score ChessVar keeps up to date as the
+#               position changes.  The running score must equal a from-scratch count after every move, fairy piece
+#               entry, take-back and reload; the score must be the same for a position and its color-flipped mirror;
+#               and a few small positions are checked against values worked out by hand from the tables.
+
+import random
+
+import pytest
+
+from ChessVar import (FALCON, KIND_VALUES, KING_ROW_BONUS, PAWN_COLUMN_BONUS, PAWN_ROW_BONUS, PERFT_POSITIONS,
+                      PIECE_SQUARE_SCORES, RESERVE_READY_VALUE, RESERVE_WAITING_VALUE, ChessVar, perft_position)
+
+
+def mirror_fen(fen):
+    """Returns the FEN of the position with the board flipped top to bottom and every piece's color swapped"""
+
+    board, turn, reserve, taken_white, taken_black = fen.split()
+    board = '/'.join(reversed(board.split('/'))).swapcase()
+    reserve = reserve.swapcase() if reserve != '-' else reserve
+    return ' '.join((board, 'b' if turn == 'w' else 'w', reserve, taken_black, taken_white))
+
+
+def test_piece_square_tables_mirror_between_the_colors():
+    """A Black piece on the mirrored square scores the negative of the same White piece, fairy pieces included"""
+
+    for code in range(8):
+        for index in range(64):
+            assert PIECE_SQUARE_SCORES[code + 8][index ^ 56] == -PIECE_SQUARE_SCORES[code][index]
+    assert PIECE_SQUARE_SCORES[16] == (0,) * 64
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_running_score_matches_a_full_count(seed):
+    """After every pushed turn, take-back and reload, the running score equals the score counted from scratch"""
+
+    rng = random.Random(seed)
+    game = ChessVar()
+    for _ in range(250):
+        legal_moves = game.generate_legal_moves()
+        if not legal_moves:
+            break
+        game.push_turn(rng.choice(legal_moves))
+        assert game._piece_square_score == game._compute_piece_square_score()
+
+        # Now and then take back a few turns and play on from the earlier position
+        if rng.random() < 0.1:
+            for _ in range(rng.randint(1, 3)):
+                game.pop_move()
+                assert game._piece_square_score == game._compute_piece_square_score()
+        assert ChessVar.from_fen(game.to_fen()).evaluate() == game.evaluate()
+
+
+@pytest.mark.parametrize('name', sorted(PERFT_POSITIONS))
+def test_mirrored_positions_score_the_same(name):
+    """The player to move gets the same score in a position and in its mirror, where the other color is to move"""
+
+    game = perft_position(name)
+    mirrored = ChessVar.from_fen(mirror_fen(game.to_fen()))
+    assert mirrored.evaluate() == game.evaluate()
+    for turn in game.generate_legal_moves()[:10]:
+        game.push_turn(turn)
+        mirrored = ChessVar.from_fen(mirror_fen(game.to_fen()))
+        assert mirrored.evaluate() == game.evaluate()
+        game.pop_move()
+
+
+def test_starting_position_is_level():
+    """Neither player is ahead before the first turn, whoever is to move"""
+
+    assert ChessVar().evaluate() == 0
+    assert ChessVar.from_fen('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b FHfh 0 0').evaluate() == 0
+
+
+def test_known_material_and_piece_square_values():
+    """A lone Pawn is worth its material plus its row and column bonuses, positive for its owner, negative otherwise"""
+
+    pawn_on_e4 = KIND_VALUES[0] + PAWN_ROW_BONUS[3] + PAWN_COLUMN_BONUS[4]
+    assert pawn_on_e4 == 114
+    assert ChessVar.from_fen('4k3/8/8/8/4P3/8/8/4K3 w - 0 0').evaluate() == pawn_on_e4
+    assert ChessVar.from_fen('4k3/8/8/8/4P3/8/8/4K3 b - 0 0').evaluate() == -pawn_on_e4
+
+    # A King that leaves its home row loses its bonus
+    assert ChessVar.from_fen('4k3/8/8/8/8/8/4K3/8 w - 0 0').evaluate() == KING_ROW_BONUS[1] - KING_ROW_BONUS[0]
+
+
+def test_reserve_pieces_count_as_ready_or_waiting():
+    """A reserve piece that may enter now is worth RESERVE_READY_VALUE, and one still waiting RESERVE_WAITING_VALUE"""
+
+    kings = '4k3/8/8/8/8/8/8/4K3 w '
+    assert ChessVar.from_fen(kings + 'FH 0 0').evaluate() == 2 * RESERVE_WAITING_VALUE
+    assert ChessVar.from_fen(kings + 'FH 1 0').evaluate() == RESERVE_READY_VALUE + RESERVE_WAITING_VALUE
+    assert ChessVar.from_fen(kings + 'FH 2 0').evaluate() == 2 * RESERVE_READY_VALUE
+    assert ChessVar.from_fen(kings + 'F 2 0').evaluate() == RESERVE_READY_VALUE
+    assert ChessVar.from_fen(kings + 'fh 1 1').evaluate() == -(RESERVE_READY_VALUE + RESERVE_WAITING_VALUE)
+
+
+def test_entering_a_fairy_piece_moves_its_value_to_the_board():
+    """Entering a ready reserve piece swaps its reserve value for its value on the square it enters"""
+
+    game = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K3 w F 1 0')
+    assert game.evaluate() == RESERVE_READY_VALUE
+    assert game.enter_fairy_piece('F', 'd1') is True
+    assert game._piece_square_score == game._compute_piece_square_score()
+    assert game.evaluate() == -PIECE_SQUARE_SCORES[FALCON][3]
@@ -0,0 +1,74 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for writing, reading and validating recorded games, in particular games played with ChessVar's
+#               optional draw rules, which must carry the DrawRules tag to be replayed to the same result.
+
+import io
+
+from ChessVar import ChessVar
+from GameRecord import DRAW_RULES_ON, DRAW_RULES_TAG, GameRecord, GameWriter, read_games
+from SelfPlay import run_self_play
+
+# Knight moves out and back for both players, twice, which draws by repetition when the draw rules are on
+REPEATED_SHUFFLE = [('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')] * 2
+
+
+def write_and_read(tags, moves, game_state):
+    """Writes one game with GameWriter and returns the GameRecord read_games reads back from the text"""
+
+    output = io.StringIO()
+    writer = GameWriter(output)
+    writer.begin_game(tags)
+    for turn in moves:
+        writer.add_move(turn)
+    writer.end_game(game_state)
+    records = list(read_games(io.StringIO(output.getvalue())))
+    assert len(records) == 1
+    return records[0]
+
+
+def test_tagged_draw_by_repetition_validates():
+    """A game drawn by repetition under the draw rules reads back with its tag and replays to the recorded draw"""
+
+    record = write_and_read({DRAW_RULES_TAG: DRAW_RULES_ON}, REPEATED_SHUFFLE, 'DRAW')
+    assert record.uses_draw_rules() is True
+    assert record.new_game().get_repetition_count() == 1
+    assert record.validate() is True
+    assert record.get_validation()[0] == 'DRAW'
+
+
+def test_untagged_draw_by_repetition_does_not_validate():
+    """Without the tag the same turns are replayed without the draw rules, so the recorded draw is never reached"""
+
+    record = write_and_read({}, REPEATED_SHUFFLE, 'DRAW')
+    assert record.uses_draw_rules() is False
+    assert record.new_game().get_repetition_count() is None
+    assert record.validate() is False
+    assert record.get_validation()[0] == 'UNFINISHED'
+
+
+def test_tag_only_counts_when_on():
+    """A DrawRules tag with any value other than the one meaning on leaves the rules off"""
+
+    assert GameRecord({DRAW_RULES_TAG: '0'}).uses_draw_rules() is False
+    assert GameRecord({DRAW_RULES_TAG: DRAW_RULES_ON}).uses_draw_rules() is True
+
+
+def test_self_play_tags_draw_rule_games():
+    """Games run_self_play writes with the draw rules on carry the tag and all validate"""
+
+    output = io.StringIO()
+    run_self_play(4, workers=1, output=output, max_plies=120, draw_rules=True)
+    records = list(read_games(io.StringIO(output.getvalue()), validate=True))
+    assert len(records) == 4
+    for record in records:
+        assert record.uses_draw_rules() is True
+        assert record.is_valid() is True
+
+    # The same games without the draw rules are written without the tag
+    output = io.StringIO()
+    run_self_play(2, workers=1, output=output, max_plies=20)
+    for record in read_games(io.StringIO(output.getvalue())):
+        assert DRAW_RULES_TAG not in record.get_tags()
+        assert isinstance(record.new_game(), ChessVar)
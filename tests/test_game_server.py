@@ -0,0 +1,141 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for GameServer's request handling and connection lifetime.  Connections are driven through
+#               in-memory streams standing in for a socket: one that records every line written, one whose client
+#               never reads (so writes never drain), and one that fails every write.  A connection must always end,
+#               and be taken off the connection count, however its client behaves.
+
+import asyncio
+import json
+
+from GameServer import GameServer
+
+
+class MemoryStream:
+    """Represents a client connection in memory: a list of request lines to read, and the reply lines written"""
+
+    def __init__(self, requests, drain_mode='normal'):
+        """
+        Sets the request dictionaries to send and how drain behaves: 'normal' returns at once, 'stuck' never returns
+        (a client that stops reading), and 'broken' raises ConnectionError
+        """
+
+        self._lines = [json.dumps(request).encode() + b'\n' for request in requests]
+        self._drain_mode = drain_mode
+        self._written = []
+        self._closed = False
+
+    def get_replies(self):
+        """Returns the reply dictionaries written so far"""
+
+        return [json.loads(line) for line in self._written]
+
+    async def readline(self):
+        """Returns the next request line, or b'' once every request has been read"""
+
+        await asyncio.sleep(0)
+        return self._lines.pop(0) if self._lines else b''
+
+    def write(self, data):
+        """Records a written line"""
+
+        self._written.append(data)
+
+    async def drain(self):
+        """Waits for the client to read, as set by drain_mode"""
+
+        if self._drain_mode == 'stuck':
+            await asyncio.Future()
+        if self._drain_mode == 'broken':
+            raise ConnectionError('client went away')
+
+    def close(self):
+        """Marks the stream closed"""
+
+        self._closed = True
+
+
+def serve(requests, drain_mode='normal', outbox_size=4):
+    """Serves one in-memory connection to the end, failing if it takes more than two seconds.  Returns the stream"""
+
+    server = GameServer(outbox_size=outbox_size)
+    stream = MemoryStream(requests, drain_mode)
+
+    async def run():
+        await asyncio.wait_for(server.handle_connection(stream, stream), 2)
+
+    asyncio.run(run())
+    assert server.get_connection_count() == 0
+    return stream
+
+
+def test_requests_are_answered_in_order():
+    """Each request gets one reply with its id, and a move is played in the game it names"""
+
+    stream = serve([{'id': 1, 'op': 'new'}, {'id': 2, 'op': 'move', 'game': '1', 'from': 'e2', 'to': 'e4'},
+                    {'id': 3, 'op': 'move', 'game': '1', 'from': 'e2', 'to': 'e4'}])
+    replies = stream.get_replies()
+    assert [reply['id'] for reply in replies] == [1, 2, 3]
+    assert [reply['ok'] for reply in replies] == [True, True, False]
+
+
+def test_connection_ends_when_the_client_stops_reading():
+    """
+    A client that stops reading and then closes its side, leaving the outbox full behind a reply that cannot be
+    written, does not keep its handler waiting for room for the end marker
+    """
+
+    serve([{'id': number, 'op': 'stats'} for number in range(3)], 'stuck', outbox_size=2)
+
+
+def test_connection_ends_when_writing_fails():
+    """A write failure closes the connection, even with replies waiting for room in a full outbox"""
+
+    for outbox_size in (1, 2, 8):
+        serve([{'id': number, 'op': 'stats'} for number in range(20)], 'broken', outbox_size)
+
+
+def test_fields_of_the_wrong_type_get_an_error_reply():
+    """A game, op or turn field of the wrong type is answered with an error instead of ending the connection"""
+
+    stream = serve([{'id': 1, 'op': 'new'}, {'id': 2, 'op': 'state', 'game': ['1']},
+                    {'id': 3, 'op': 'move', 'game': {'id': '1'}, 'from': 'e2', 'to': 'e4'},
+                    {'id': 4, 'op': ['state'], 'game': '1'}, {'id': 5, 'op': 'move', 'game': '1', 'from': 5, 'to': []},
+                    {'id': 6, 'op': 'state', 'game': 1}, {'id': 7, 'op': 'state', 'game': '1'}])
+    replies = stream.get_replies()
+    assert [reply['id'] for reply in replies] == [1, 2, 3, 4, 5, 6, 7]
+    assert [reply['ok'] for reply in replies] == [True, False, False, False, False, False, True]
+    assert [reply['error'] for reply in replies[1:6]] == ['game must be a string', 'game must be a string',
+                                                         'op must be a string', 'illegal turn', 'game must be a string']
+
+
+def test_lines_that_are_not_objects_get_an_error_reply():
+    """Lines that are not JSON, are nested too deeply to parse, or hold something other than an object are answered"""
+
+    server = GameServer()
+    for line, error in ((b'{"op": "new"', 'request is not JSON'), (b'[' * 100000, 'request is not JSON'),
+                        (b'[1, 2]', 'request is not an object'), (b'"new"', 'request is not an object')):
+        assert server.handle_request(None, line) == {'ok': False, 'error': error}
+
+
+def test_over_long_line_is_answered_and_ends_the_connection():
+    """A line longer than the reader's limit gets an error reply, after the replies to the requests before it"""
+
+    server = GameServer()
+    stream = MemoryStream([])
+
+    async def run():
+        reader = asyncio.StreamReader(limit=64)
+        reader.feed_data(json.dumps({'id': 1, 'op': 'new'}).encode() + b'\n')
+        reader.feed_data(b'{"id": 2, "op": "new", "padding": "' + b'x' * 200 + b'"}\n')
+        reader.feed_data(json.dumps({'id': 3, 'op': 'new'}).encode() + b'\n')
+        reader.feed_eof()
+        await asyncio.wait_for(server.handle_connection(reader, stream), 2)
+
+    asyncio.run(run())
+    replies = stream.get_replies()
+    assert [reply['id'] for reply in replies] == [1, None]
+    assert replies[1] == {'id': None, 'ok': False, 'error': 'request line is too long'}
+    assert server.get_connection_count() == 0
+    assert server.get_game_count() == 1
@@ -0,0 +1,96 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for Instrumentation: enable and disable swap ChessVar's methods for counting wrappers and back,
+#               the wrappers count calls, accepted turns and rejections by reason without changing any result, and
+#               reset_stats starts the counts again even while the wrappers are installed.
+
+import pytest
+
+import Instrumentation
+from ChessVar import ChessVar
+
+
+@pytest.fixture(autouse=True)
+def instrumentation_off():
+    """Leaves instrumentation off, with empty counts, before and after each test"""
+
+    Instrumentation.disable()
+    Instrumentation.reset_stats()
+    yield
+    Instrumentation.disable()
+    Instrumentation.reset_stats()
+
+
+def test_enable_and_disable_swap_the_methods():
+    """enable installs the wrappers once, even if called twice, and disable puts the original methods back"""
+
+    originals = {name: getattr(ChessVar, name) for name in Instrumentation.INSTRUMENTED_METHODS}
+    assert Instrumentation.is_enabled() is False
+    Instrumentation.enable()
+    wrappers = {name: getattr(ChessVar, name) for name in Instrumentation.INSTRUMENTED_METHODS}
+    Instrumentation.enable()
+    assert Instrumentation.is_enabled() is True
+    for name in Instrumentation.INSTRUMENTED_METHODS:
+        assert wrappers[name] is not originals[name]
+        assert getattr(ChessVar, name) is wrappers[name]
+        assert wrappers[name].__name__ == name
+    Instrumentation.disable()
+    assert Instrumentation.is_enabled() is False
+    for name in Instrumentation.INSTRUMENTED_METHODS:
+        assert getattr(ChessVar, name) is originals[name]
+
+
+def test_calls_are_counted_by_outcome():
+    """Accepted turns and rejections by reason are counted for each method, and the results are unchanged"""
+
+    game = ChessVar()
+    Instrumentation.enable()
+    assert game.make_move('e2', 'e4') is True
+    assert game.make_move('e7', 'e4') is False
+    assert game.make_move('d8', 'd6') is False
+    assert game.make_move('e7', 'e5') is True
+    assert game.enter_fairy_piece('F', 'd1') is False
+    stats = Instrumentation.get_stats()
+
+    make_move = stats['make_move']
+    assert (make_move['calls'], make_move['accepted'], make_move['rejected']) == (4, 2, 2)
+    assert sum(make_move['rejections'].values()) == 2
+    assert len(make_move['rejections']) == 2
+    assert make_move['seconds'] > 0
+    assert make_move['mean_us'] == pytest.approx(1e6 * make_move['seconds'] / 4)
+
+    enter_fairy_piece = stats['enter_fairy_piece']
+    assert (enter_fairy_piece['calls'], enter_fairy_piece['accepted'], enter_fairy_piece['rejected']) == (1, 0, 1)
+
+
+def test_counts_stop_when_disabled_and_restart_when_reset():
+    """Calls while disabled are not counted, and reset_stats clears the counts of the wrappers already installed"""
+
+    game = ChessVar()
+    Instrumentation.enable()
+    game.make_move('e2', 'e4')
+    Instrumentation.disable()
+    game.make_move('e7', 'e5')
+    assert Instrumentation.get_stats()['make_move']['calls'] == 1
+
+    Instrumentation.enable()
+    Instrumentation.reset_stats()
+    game.make_move('d2', 'd4')
+    assert Instrumentation.get_stats()['make_move']['calls'] == 1
+    assert Instrumentation.get_stats()['make_move']['accepted'] == 1
+    Instrumentation.reset_stats()
+    assert Instrumentation.get_stats()['make_move'] == {'calls': 0, 'accepted': 0, 'rejected': 0, 'rejections': {},
+                                                         'seconds': 0.0, 'mean_us': 0.0}
+
+
+def test_replaying_recorded_games_is_counted(tmp_path):
+    """replay_files replays every game in its files, and with instrumentation on each checked turn is counted"""
+
+    path = tmp_path / 'games.pgn'
+    path.write_text('[Result "*"]\n\n1. e2e4 d7d5 2. e4d5 *\n\n[Result "*"]\n\n1. d2d4 *\n\n')
+    Instrumentation.enable()
+    assert Instrumentation.replay_files([str(path)]) == 2
+    stats = Instrumentation.get_stats()
+    assert (stats['make_move']['calls'], stats['make_move']['accepted']) == (4, 4)
+    assert stats['enter_fairy_piece']['calls'] == 0
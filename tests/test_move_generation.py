@@ -0,0 +1,88 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Differential tests for ChessVar.generate_legal_moves and ChessVar.generate_captures.  The move
+#               generator works from precomputed tables, while make_move and enter_fairy_piece apply each piece's own
+#               is_movement_acceptable rule and the path check, so the two are independent implementations of the
+#               rules.  Random games are played and, at every position, every (start, end) pair and every fairy piece
+#               entry is tried: exactly the turns the generator lists must be accepted.
+
+import random
+
+import pytest
+
+from ChessVar import SQUARE_NAMES, ChessVar
+
+# Every turn that could be proposed: all (start, end) pairs and all fairy piece entries
+ALL_TURNS = ([(start, end) for start in SQUARE_NAMES for end in SQUARE_NAMES] +
+             [(symbol, location) for symbol in 'FHfh' for location in SQUARE_NAMES])
+
+
+def accepted_turns(game):
+    """Returns the set of turns the game accepts in its current position, trying each one and taking it back"""
+
+    accepted = set()
+    for turn in ALL_TURNS:
+        if game.push_turn(turn) is True:
+            accepted.add(turn)
+            game.pop_move()
+    return accepted
+
+
+def random_positions(seed, game_count, max_plies):
+    """Plays seeded random games and yields the game at each position reached, before the next turn is played"""
+
+    rng = random.Random(seed)
+    for _ in range(game_count):
+        game = ChessVar()
+        for _ in range(max_plies):
+            yield game
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_generated_moves_match_accepted_turns(seed):
+    """The generator lists each legal turn once, and nothing make_move or enter_fairy_piece would reject"""
+
+    for game in random_positions(seed, 3, 120):
+        legal_moves = game.generate_legal_moves()
+        assert len(legal_moves) == len(set(legal_moves))
+        assert set(legal_moves) == accepted_turns(game), game.to_fen()
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_generated_captures_are_the_capturing_moves(seed):
+    """generate_captures lists the moves that capture, in the order generate_legal_moves lists them"""
+
+    for game in random_positions(seed, 10, 200):
+        captures = [turn for turn in game.generate_legal_moves()
+                    if len(turn[0]) == 2 and game.get_square_symbol(turn[1]) != ' ']
+        assert game.generate_captures() == captures, game.to_fen()
+
+
+def test_finished_game_has_no_moves():
+    """Once a King is captured, no turns are generated"""
+
+    game = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K2R w FHfh 0 0')
+    assert game.make_move('h1', 'h8') is True
+    assert game.make_move('e8', 'f8') is True
+    assert game.make_move('h8', 'f8') is True
+    assert game.get_game_state() == 'WHITE_WON'
+    assert game.generate_legal_moves() == []
+    assert game.generate_captures() == []
+
+
+def test_attack_queries_in_the_starting_position():
+    """attackers_of and is_attacked list the pieces covering a square, and return None for an unknown square or color"""
+
+    game = ChessVar()
+    assert sorted(game.attackers_of('f3', 'WHITE')) == ['e2', 'g1', 'g2']
+    assert game.attackers_of('e4', 'WHITE') == []
+    assert game.is_attacked('d6', 'BLACK') is True
+    assert game.is_attacked('d5', 'BLACK') is False
+    assert game.attackers_of('i9', 'WHITE') is None
+    assert game.attackers_of('e4', 'GREEN') is None
+    assert game.is_attacked('e4', 'white') is None
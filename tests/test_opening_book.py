@@ -0,0 +1,158 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for OpeningBook: building a book file from recorded games and reading it back through the
+#               memory-mapped binary search.  Small hand-made games check each turn's game and result counts, and a
+#               larger set of random games checks that every position's records are found, and nothing else.
+
+import io
+import random
+
+import pytest
+
+from ChessVar import ChessVar
+from GameRecord import DRAW_RULES_ON, DRAW_RULES_TAG, GameWriter
+from OpeningBook import HEADER, RECORD, OpeningBook, build_book
+
+
+def games_file(games):
+    """Takes in a list of (turns, game state, tags) and returns a text file object holding them as recorded games"""
+
+    output = io.StringIO()
+    writer = GameWriter(output)
+    for turns, game_state, tags in games:
+        writer.begin_game(tags)
+        for turn in turns:
+            writer.add_move(turn)
+        writer.end_game(game_state)
+    return io.StringIO(output.getvalue())
+
+
+def open_book(tmp_path, game_files, plies=24, min_games=1):
+    """Builds a book from the game files in tmp_path and returns it opened, with the number of records written"""
+
+    path = str(tmp_path / 'book.bin')
+    record_count = build_book(game_files, path, plies, min_games)
+    return OpeningBook(path), record_count
+
+
+SMALL_GAMES = [
+    ([('e2', 'e4'), ('e7', 'e5'), ('g1', 'f3')], 'WHITE_WON', {}),
+    ([('e2', 'e4'), ('e7', 'e5'), ('b1', 'c3')], 'BLACK_WON', {}),
+    ([('e2', 'e4'), ('d7', 'd5')], 'DRAW', {}),
+    ([('d2', 'd4'), ('d7', 'd5')], 'UNFINISHED', {}),
+]
+
+
+def test_probe_gives_each_turn_with_its_counts(tmp_path):
+    """Every turn from a position comes back with its games, White wins, Black wins and draws, most played first"""
+
+    book, record_count = open_book(tmp_path, [games_file(SMALL_GAMES[:2]), games_file(SMALL_GAMES[2:])])
+    assert record_count == book.get_record_count() == 7
+
+    game = ChessVar()
+    assert book.probe_game(game) == [(('e2', 'e4'), 3, 1, 1, 1), (('d2', 'd4'), 1, 0, 0, 0)]
+    game.push_turn(('e2', 'e4'))
+    assert book.probe_game(game) == [(('e7', 'e5'), 2, 1, 1, 0), (('d7', 'd5'), 1, 0, 0, 1)]
+    game.push_turn(('e7', 'e5'))
+    assert sorted(book.probe_game(game)) == [(('b1', 'c3'), 1, 0, 1, 0), (('g1', 'f3'), 1, 1, 0, 0)]
+    game.push_turn(('g1', 'f3'))
+    assert book.probe_game(game) == []
+    book.close()
+
+
+def test_choose_move_follows_the_weights(tmp_path):
+    """Without a random generator the most played turn is chosen, and with one each turn in proportion to its games"""
+
+    book, _ = open_book(tmp_path, [games_file(SMALL_GAMES)])
+    game = ChessVar()
+    assert book.choose_move(game) == ('e2', 'e4')
+    rng = random.Random(0)
+    choices = [book.choose_move(game, rng) for _ in range(4000)]
+    assert set(choices) == {('e2', 'e4'), ('d2', 'd4')}
+    assert 0.7 < choices.count(('e2', 'e4')) / len(choices) < 0.8
+    assert book.choose_move(ChessVar.from_fen('4k3/8/8/8/8/8/8/4K3 w - 0 0')) is None
+    book.close()
+
+
+def test_plies_min_games_and_illegal_turns_limit_the_book(tmp_path):
+    """Only the first plies of each game are added, rare turns are left out, and a game stops at an illegal turn"""
+
+    book, record_count = open_book(tmp_path, [games_file(SMALL_GAMES)], plies=1)
+    assert record_count == 2
+    book.close()
+
+    book, record_count = open_book(tmp_path, [games_file(SMALL_GAMES)], min_games=2)
+    assert record_count == 2
+    assert book.probe_game(ChessVar()) == [(('e2', 'e4'), 3, 1, 1, 1)]
+    book.close()
+
+    illegal = [([('e2', 'e4'), ('e2', 'e4'), ('e7', 'e5')], 'UNFINISHED', {})]
+    book, record_count = open_book(tmp_path, [games_file(illegal)])
+    assert record_count == 1
+    book.close()
+
+
+def test_games_with_the_draw_rules_are_replayed_with_them(tmp_path):
+    """A game played with the draw rules adds no turns after its draw; without the tag the same turns are all added"""
+
+    turns = [('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')] * 2 + [('e2', 'e4')]
+    book, record_count = open_book(tmp_path, [games_file([(turns, 'DRAW', {DRAW_RULES_TAG: DRAW_RULES_ON})])])
+    assert record_count == 4
+    # The shuffle passes through the starting position twice, so its first turn is counted once for each time.  The
+    # e2e4 played from the same position after the draw is not counted
+    assert book.probe_game(ChessVar()) == [(('g1', 'f3'), 2, 0, 0, 2)]
+    book.close()
+
+    book, record_count = open_book(tmp_path, [games_file([(turns, 'DRAW', {})])])
+    assert record_count == 5
+    book.close()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_binary_search_finds_every_position(tmp_path, seed):
+    """For every position the random games reached, probe returns exactly the turns played from it"""
+
+    rng = random.Random(seed)
+    games = []
+    expected = {}
+    for _ in range(40):
+        game = ChessVar()
+        turns = []
+        for _ in range(rng.randint(1, 12)):
+            legal_moves = game.generate_legal_moves()
+            turn = rng.choice(legal_moves[:3])
+            counts = expected.setdefault(game.position_hash(), {})
+            counts[turn] = counts.get(turn, 0) + 1
+            game.push_turn(turn)
+            turns.append(turn)
+        games.append((turns, 'UNFINISHED', {}))
+
+    book, record_count = open_book(tmp_path, [games_file(games)])
+    assert record_count == sum(len(counts) for counts in expected.values())
+    for position_hash, counts in expected.items():
+        entries = book.probe(position_hash)
+        assert {turn: games for turn, games, _, _, _ in entries} == counts
+        assert [entry[1] for entry in entries] == sorted(counts.values(), reverse=True)
+
+    # Hashes below, between and above the stored ones find nothing
+    stored = sorted(expected)
+    for position_hash in (0, stored[0] - 1, stored[len(stored) // 2] + 1, stored[-1] + 1, 2 ** 64 - 1):
+        if position_hash not in expected:
+            assert book.probe(position_hash) == []
+    book.close()
+
+
+def test_files_that_are_not_books_are_rejected(tmp_path):
+    """An empty file, a file with the wrong magic, or one whose length does not match its header raise ValueError"""
+
+    path = tmp_path / 'not_a_book.bin'
+    for contents in (b'', b'x' * (HEADER.size + RECORD.size), HEADER.pack(b'FHBOOK1\0', 2) + b'\0' * RECORD.size):
+        path.write_bytes(contents)
+        with pytest.raises(ValueError):
+            OpeningBook(str(path))
+
+    book, record_count = open_book(tmp_path, [])
+    assert record_count == book.get_record_count() == 0
+    assert book.probe(12345) == []
+    book.close()
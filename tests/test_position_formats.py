@@ -0,0 +1,85 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for the FEN-style and packed binary position formats: positions from random games survive a
+#               round trip through each format, and strings or bytes that do not describe a valid position are
+#               rejected with ValueError rather than another exception or a wrong position.
+
+import random
+
+import pytest
+
+from ChessVar import MAX_POWER_PIECES_TAKEN, STARTING_FEN, ChessVar
+
+
+def random_games(seed, game_count):
+    """Plays seeded random games and yields the game at each position reached"""
+
+    rng = random.Random(seed)
+    for _ in range(game_count):
+        game = ChessVar()
+        while True:
+            yield game
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+
+
+def test_round_trips_keep_the_position():
+    """A position written with to_fen or to_packed reads back as the same position, with the same hash"""
+
+    for game in random_games(0, 30):
+        fen = game.to_fen()
+        from_fen = ChessVar.from_fen(fen)
+        from_packed = ChessVar.from_packed(game.to_packed())
+        assert from_fen.to_fen() == fen
+        assert from_packed.to_fen() == fen
+        assert from_fen.position_hash() == game.position_hash()
+        assert from_packed.position_hash() == game.position_hash()
+        assert from_packed.get_game_state() == game.get_game_state()
+
+
+def test_highest_power_pieces_taken_counts_round_trip():
+    """Counts up to MAX_POWER_PIECES_TAKEN are accepted and survive the packed format's three-bit fields"""
+
+    fen = '4k3/8/8/8/8/8/8/4K3 w FHfh %d %d' % (MAX_POWER_PIECES_TAKEN, MAX_POWER_PIECES_TAKEN - 1)
+    assert ChessVar.from_packed(ChessVar.from_fen(fen).to_packed()).to_fen() == fen
+
+
+@pytest.mark.parametrize('fen', [
+    '',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FHfh 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w FHfh 0 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w FHfh 0 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBN w FHfh 0 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x FHfh 0 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FFh 0 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FHfh -1 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FHfh 0 20',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FHfh 8 0',
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKFNR w FHfh 0 0',
+])
+def test_invalid_fen_raises_value_error(fen):
+    """Malformed strings, unknown pieces, repeated fairy pieces and out-of-range counts raise ValueError"""
+
+    with pytest.raises(ValueError):
+        ChessVar.from_fen(fen)
+
+
+def test_invalid_packed_data_raises_value_error():
+    """Bytes that are too short or too long, or that set unused state bits or the padding code, raise ValueError"""
+
+    packed = ChessVar().to_packed()
+    odd_packed = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K2R w FHfh 0 0').to_packed()
+    for data in (b'', packed[:9], packed[:-1], packed + b'\x00', bytes((packed[0], packed[1] | 0x80)) + packed[2:],
+                 odd_packed[:-1] + bytes((odd_packed[-1] | 1,))):
+        with pytest.raises(ValueError):
+            ChessVar.from_packed(data)
+
+
+def test_starting_fen_is_the_starting_position():
+    """STARTING_FEN describes the position a new game starts in"""
+
+    assert ChessVar().to_fen() == STARTING_FEN
+    assert ChessVar.from_fen(STARTING_FEN).position_hash() == ChessVar().position_hash()
@@ -0,0 +1,110 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for the incrementally kept Zobrist hash of ChessVar positions.  After every turn made and every
+#               turn taken back in random games, the running hash must equal the hash computed from scratch.  The games
+#               favour fairy piece entries whenever one is allowed, so entries and the captures of power pieces that
+#               make them possible are covered along with ordinary moves and captures.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar
+
+
+def assert_hash_is_current(game):
+    """Checks that the game's running hash matches a from-scratch computation"""
+
+    assert game.position_hash() == game._compute_position_hash(), game.to_fen()
+
+
+def choose_turn(legal_moves, rng):
+    """Returns a random turn from the list, choosing a fairy piece entry half the time when there is one"""
+
+    entries = [turn for turn in legal_moves if len(turn[0]) == 1]
+    if entries and rng.random() < 0.5:
+        return rng.choice(entries)
+    return rng.choice(legal_moves)
+
+
+def play_checked_game(seed):
+    """
+    Plays a seeded random game, taking turns back now and then, and checks the hash after every push and pop.  Returns
+    the number of fairy piece entries and of power piece captures made along the way
+    """
+
+    rng = random.Random(seed)
+    game = ChessVar()
+    assert_hash_is_current(game)
+    entries = 0
+    power_piece_captures = 0
+    for _ in range(300):
+        # Now and then take back a few turns, checking the hash after each
+        if rng.random() < 0.15:
+            for _ in range(rng.randrange(1, 4)):
+                if game.pop_move() is False:
+                    break
+                assert_hash_is_current(game)
+            continue
+
+        legal_moves = game.generate_legal_moves()
+        if not legal_moves:
+            break
+        turn = choose_turn(legal_moves, rng)
+        power_pieces_taken = game.get_power_pieces_taken('WHITE') + game.get_power_pieces_taken('BLACK')
+        assert game.push_turn(turn) is True
+        assert_hash_is_current(game)
+        if len(turn[0]) == 1:
+            entries += 1
+        elif game.get_power_pieces_taken('WHITE') + game.get_power_pieces_taken('BLACK') > power_pieces_taken:
+            power_piece_captures += 1
+
+    # Unwind what is left of the game, checking the hash all the way back to the start
+    while game.pop_move() is True:
+        assert_hash_is_current(game)
+    assert game.position_hash() == ChessVar().position_hash()
+    return entries, power_piece_captures
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_running_hash_matches_recomputed_hash(seed):
+    """The running hash is correct after every push and every pop"""
+
+    play_checked_game(seed)
+
+
+def test_checked_games_include_entries_and_power_piece_captures():
+    """The random games above really do capture power pieces and enter fairy pieces, so both are covered"""
+
+    entries = 0
+    power_piece_captures = 0
+    for seed in range(30):
+        game_entries, game_captures = play_checked_game(seed)
+        entries += game_entries
+        power_piece_captures += game_captures
+    assert power_piece_captures > 0
+    assert entries > 0
+
+
+def test_transposed_move_orders_give_the_same_hash():
+    """The same position reached by two different move orders has the same hash"""
+
+    first = ChessVar()
+    for turn in (('g1', 'f3'), ('g8', 'f6'), ('b1', 'c3'), ('b8', 'c6')):
+        assert first.make_move(*turn) is True
+    second = ChessVar()
+    for turn in (('b1', 'c3'), ('b8', 'c6'), ('g1', 'f3'), ('g8', 'f6')):
+        assert second.make_move(*turn) is True
+    assert first.position_hash() == second.position_hash()
+    assert first.position_hash() == ChessVar.from_fen(first.to_fen()).position_hash()
+
+
+def test_hash_depends_on_side_to_move_and_reserves():
+    """Positions that differ only in the side to move or in a fairy piece's reserve have different hashes"""
+
+    white_to_move = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K3 w FHfh 0 0')
+    black_to_move = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K3 b FHfh 0 0')
+    no_white_falcon = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K3 w Hfh 0 0')
+    hashes = {white_to_move.position_hash(), black_to_move.position_hash(), no_white_falcon.position_hash()}
+    assert len(hashes) == 3
@@ -0,0 +1,106 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for batch game replay: ChessVar.replay with and without trusted turns, replay_game, and
+#               replay_many both in this process and across a pool of worker processes, which must yield every
+#               game's result in the order the games were given.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, replay_game, replay_many
+
+
+def random_game(seed, max_plies=150):
+    """Plays a seeded random game and returns its turns, its final game state and the FEN of its final position"""
+
+    rng = random.Random(seed)
+    game = ChessVar()
+    turns = []
+    for _ in range(max_plies):
+        legal_moves = game.generate_legal_moves()
+        if not legal_moves:
+            break
+        turn = rng.choice(legal_moves)
+        game.push_turn(turn)
+        turns.append(turn)
+    return turns, game.get_game_state(), game.to_fen()
+
+
+GAMES = [random_game(seed) for seed in range(12)]
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_replay_reaches_the_played_position(trusted):
+    """Replaying a game's turns, checked or trusted, ends in the position the game reached"""
+
+    for turns, game_state, fen in GAMES:
+        game = ChessVar()
+        assert game.replay(turns, trusted) is None
+        assert game.get_game_state() == game_state
+        assert game.to_fen() == fen
+
+
+def test_replay_stops_at_the_first_illegal_turn():
+    """The index of the first illegal turn is returned, and the turns before it are left played"""
+
+    turns = [('e2', 'e4'), ('e7', 'e5'), ('e4', 'e5'), ('g1', 'f3')]
+    game = ChessVar()
+    assert game.replay(turns) == 2
+    expected = ChessVar()
+    expected.replay(turns[:2])
+    assert game.to_fen() == expected.to_fen()
+    assert game.get_turn() == 'WHITE'
+
+
+def test_replay_handles_fairy_piece_entries_and_an_empty_list():
+    """Fairy piece entries are replayed like moves, and an empty list leaves the game unchanged"""
+
+    turns = [('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5'), ('b1', 'c3'), ('d5', 'a2'), ('a1', 'a2'),
+             ('h', 'd8')]
+    game = ChessVar()
+    assert game.replay(turns) is None
+    assert game.get_square_symbol('d8') == 'h'
+    assert game.is_fairy_piece_available('h') is False
+    assert game.replay([('f', 'c8')]) == 0
+
+    game = ChessVar()
+    assert game.replay([]) is None
+    assert game.to_fen() == ChessVar().to_fen()
+
+
+def test_replay_game_reports_state_illegal_index_and_position():
+    """replay_game returns the game state, the first illegal index (or None) and the final FEN"""
+
+    turns, game_state, fen = GAMES[0]
+    assert replay_game(turns) == (game_state, None, fen)
+    assert replay_game(turns, trusted=True) == (game_state, None, fen)
+    assert replay_game([('e2', 'e5')]) == ('UNFINISHED', 0, ChessVar().to_fen())
+
+
+def test_replay_game_with_the_draw_rules():
+    """With draw_rules the replay can end in a draw that the same turns do not reach without them"""
+
+    shuffle = [('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')] * 2
+    assert replay_game(shuffle, draw_rules=True)[0] == 'DRAW'
+    assert replay_game(shuffle)[0] == 'UNFINISHED'
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_replay_many_keeps_the_order_of_the_games(workers):
+    """Results come back in input order, one per game, in this process or from worker processes"""
+
+    games = [turns for turns, _, _ in GAMES]
+    games.insert(3, [('e2', 'e4'), ('e2', 'e4')])
+    expected = [replay_game(turns) for turns in games]
+    assert expected[3] == ('UNFINISHED', 1, replay_game([('e2', 'e4')])[2])
+    assert list(replay_many(iter(games), workers=workers, chunk_size=2)) == expected
+
+
+def test_replay_many_trusted_and_with_draw_rules():
+    """trusted and draw_rules are passed to every replay, including in worker processes"""
+
+    games = [turns for turns, _, _ in GAMES[:4]]
+    expected = [replay_game(turns, draw_rules=True) for turns in games]
+    assert list(replay_many(games, workers=2, trusted=True, draw_rules=True)) == expected
@@ -0,0 +1,65 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for SearchEngine's quiescence search when the player to move has its King attacked.  Standing pat
+#               there would score a position by its material one turn before the King is taken, so the search must
+#               instead find a turn that saves the King or score the position as lost.  A position drawn under the
+#               optional draw rules scores 0 there, as it does in the main search, whatever the material.
+
+from ChessVar import ChessVar
+from SearchEngine import KING_CAPTURE_SCORE, MAX_PLY, SearchEngine
+
+# White is a Rook and two pawns ahead, but the Knight on c2 attacks the King on a1, which has nowhere to go
+TRAPPED_KING = '6k1/8/8/8/8/8/PPn5/KR5R w - 0 0'
+
+# The same position without the pawn on b2, so the King can step out of the Knight's reach
+ESCAPABLE_KING = '6k1/8/8/8/8/8/P1n5/KR5R w - 0 0'
+
+
+def quiescence_score(fen):
+    """Returns the quiescence search score of the position with a full window, from the player to move's view"""
+
+    return SearchEngine()._quiescence_search(ChessVar.from_fen(fen), -KING_CAPTURE_SCORE - 1, KING_CAPTURE_SCORE + 1, 0)
+
+
+def test_attacked_king_without_escape_scores_as_lost():
+    """A player whose King cannot get away does not stand pat on its material"""
+
+    assert ChessVar.from_fen(TRAPPED_KING).evaluate() > 0
+    assert quiescence_score(TRAPPED_KING) <= -(KING_CAPTURE_SCORE - MAX_PLY)
+
+
+def test_attacked_king_with_escape_keeps_its_material():
+    """A player whose King can get away is scored after the escape, keeping its advantage"""
+
+    assert 0 < quiescence_score(ESCAPABLE_KING) < KING_CAPTURE_SCORE - MAX_PLY
+
+
+def test_search_moves_the_attacked_king():
+    """At depth one the search plays the only turn that saves the King"""
+
+    engine = SearchEngine(max_depth=1)
+    assert engine.search(ChessVar.from_fen(ESCAPABLE_KING)) == ('a1', 'b2')
+
+
+def test_drawn_positions_score_zero_in_quiescence():
+    """A game drawn by repetition or for lack of captures scores 0, not its material, even with the King attacked"""
+
+    game = ChessVar.from_fen('1n2k3/8/8/8/8/8/8/RN2K3 w - 0 0')
+    game.set_draw_rules(True)
+    game.replay([('b1', 'c3'), ('b8', 'c6'), ('c3', 'b1'), ('c6', 'b8')] * 2)
+    assert game.get_game_state() == 'DRAW'
+    assert game.evaluate() > 0
+    engine = SearchEngine()
+    for evasions_left in (0, 1):
+        assert engine._quiescence_search(game, -KING_CAPTURE_SCORE - 1, KING_CAPTURE_SCORE + 1, 0, evasions_left) == 0
+
+    # The Knight's quiet move to c2 attacks White's King and reaches the limit of turns without a capture
+    game = ChessVar.from_fen('6k1/8/8/8/3n4/8/PP6/KR5R w - 0 0')
+    game.set_draw_rules(True, 2)
+    game.replay([('h1', 'h2'), ('d4', 'c2')])
+    assert game.get_game_state() == 'DRAW'
+    assert game.evaluate() > 0
+    assert engine._search_evasions(game, -KING_CAPTURE_SCORE - 1, KING_CAPTURE_SCORE + 1, 0, 1) == 0
+    for evasions_left in (0, 1):
+        assert engine._quiescence_search(game, -KING_CAPTURE_SCORE - 1, KING_CAPTURE_SCORE + 1, 0, evasions_left) == 0
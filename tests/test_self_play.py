@@ -0,0 +1,67 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for the self-play move policies, play_game and run_self_play.  Games played in this process are
+#               checked by replaying their turns on a fresh game; run_self_play is checked to give the same games with
+#               any number of workers and to raise, rather than wait forever, when a worker fails.
+
+import io
+import random
+
+import pytest
+
+from ChessVar import ChessVar
+from GameRecord import read_games
+from SelfPlay import greedy_capture_policy, play_game, random_policy, run_self_play
+
+
+@pytest.mark.parametrize('policy', [random_policy, greedy_capture_policy])
+def test_policies_return_none_without_a_legal_turn(policy):
+    """A policy asked for a turn in a finished game returns None instead of raising"""
+
+    game = ChessVar.from_fen('4k3/8/8/8/8/8/8/7R w FHfh 0 0')
+    assert game.get_game_state() == 'BLACK_WON'
+    assert policy(game, random.Random(0)) is None
+
+
+def test_game_stops_when_a_policy_has_no_turn():
+    """play_game stops, leaving the game unfinished, when the player to move has no turn to play"""
+
+    turns, game_state = play_game(lambda game, rng: None, random_policy, random.Random(0))
+    assert turns == []
+    assert game_state == 'UNFINISHED'
+
+
+@pytest.mark.parametrize('draw_rules', [False, True])
+@pytest.mark.parametrize('seed', range(10))
+def test_played_games_replay_to_the_same_result(seed, draw_rules):
+    """The turns play_game returns are legal and lead to the game state it reports"""
+
+    turns, game_state = play_game(greedy_capture_policy, random_policy, random.Random(seed), max_plies=200,
+                                  draw_rules=draw_rules)
+    game = ChessVar(draw_rules)
+    assert game.replay(turns) is None
+    assert game.get_game_state() == game_state
+    assert len(turns) <= 200
+
+
+def test_run_self_play_gives_the_same_games_with_any_number_of_workers():
+    """Each game has its own seed, so one worker and three record the same games and statistics"""
+
+    outputs = []
+    for workers in (1, 3):
+        output = io.StringIO()
+        stats = run_self_play(6, workers, 'greedy', 'random', output, seed=5, max_plies=60)
+        assert stats['games'] == 6
+        assert sum(sum(counts.values()) for counts in stats['results'].values()) == 6
+        outputs.append(sorted((record.get_tags()['Round'], record.get_moves())
+                              for record in read_games(io.StringIO(output.getvalue()))))
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0]) == 6
+
+
+def test_failing_worker_is_raised_instead_of_waited_on():
+    """A worker that raises sends its error back, and run_self_play raises it instead of waiting for the worker"""
+
+    with pytest.raises(RuntimeError, match='unknown policy'):
+        run_self_play(4, 2, 'random', 'no-such-policy')
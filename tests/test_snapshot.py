@@ -0,0 +1,142 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for ChessVar.snapshot, restore and from_snapshot.  A restored position must match the game the
+#               snapshot was taken from in every way the rules can see, whichever game it is restored into, and play
+#               must go on from it exactly as it would have from the original.  Restoring clears the undo stack and
+#               starts the draw rules' history again, and bytes that are not a snapshot are rejected.
+
+import random
+
+import pytest
+
+from ChessVar import SNAPSHOT, ChessVar
+
+
+def random_positions(seed, game_count, max_plies=200):
+    """Plays seeded random games and yields the game at each position reached"""
+
+    rng = random.Random(seed)
+    for _ in range(game_count):
+        game = ChessVar()
+        for _ in range(max_plies):
+            yield game
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+        yield game
+
+
+def assert_same_position(game, expected):
+    """Checks that two games agree on everything the rules and the search can see"""
+
+    assert game.to_fen() == expected.to_fen()
+    assert game.get_game_state() == expected.get_game_state()
+    assert game.position_hash() == expected.position_hash() == game._compute_position_hash()
+    assert game.evaluate() == expected.evaluate()
+    assert game._piece_square_score == game._compute_piece_square_score()
+    assert game.generate_legal_moves() == expected.generate_legal_moves()
+
+
+def test_snapshots_round_trip():
+    """from_snapshot rebuilds every position of random games, finished ones included"""
+
+    for game in random_positions(0, 15):
+        snapshot = game.snapshot()
+        assert isinstance(snapshot, bytes) and len(snapshot) == SNAPSHOT.size
+        assert_same_position(ChessVar.from_snapshot(snapshot), game)
+
+
+def test_restore_into_another_game_in_progress():
+    """A snapshot restored over a different position, fairy pieces included, plays on exactly like the original"""
+
+    rng = random.Random(1)
+    positions = [(game.snapshot(), game.to_fen()) for game in random_positions(1, 6)]
+    target = ChessVar()
+    for _ in range(60):
+        snapshot, fen = rng.choice(positions)
+        target.restore(snapshot)
+        original = ChessVar.from_fen(fen)
+        assert_same_position(target, original)
+
+        # Both games must accept and reject the same turns from here on
+        for _ in range(8):
+            legal_moves = original.generate_legal_moves()
+            if not legal_moves:
+                break
+            turn = rng.choice(legal_moves)
+            assert target.push_turn(turn) is True
+            assert original.push_turn(turn) is True
+            assert_same_position(target, original)
+
+
+def test_one_snapshot_serves_many_variations():
+    """Returning to the same snapshot after each variation always gives back the branching position"""
+
+    game = ChessVar()
+    game.replay([('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5')])
+    snapshot = game.snapshot()
+    fen = game.to_fen()
+    rng = random.Random(2)
+    for _ in range(20):
+        for _ in range(rng.randint(1, 10)):
+            legal_moves = game.generate_legal_moves()
+            if not legal_moves:
+                break
+            game.push_turn(rng.choice(legal_moves))
+        game.restore(snapshot)
+        assert game.to_fen() == fen
+    assert game.snapshot() == snapshot
+
+
+def test_restore_clears_the_undo_stack():
+    """Turns made before a restore cannot be taken back after it, but turns made after it can"""
+
+    game = ChessVar()
+    start = game.snapshot()
+    game.push_turn(('e2', 'e4'))
+    game.restore(start)
+    assert game.pop_move() is False
+    game.push_turn(('d2', 'd4'))
+    assert game.pop_move() is True
+    assert game.to_fen() == ChessVar().to_fen()
+
+
+def test_restore_starts_the_draw_rules_history_again():
+    """With the draw rules on, earlier repetitions and turns without a capture no longer count after a restore"""
+
+    shuffle = [('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')]
+    game = ChessVar(draw_rules=True)
+    game.replay(shuffle)
+    assert game.get_repetition_count() == 2
+    assert game.get_plies_since_capture() == 4
+
+    game.restore(game.snapshot())
+    assert game.get_repetition_count() == 1
+    assert game.get_plies_since_capture() == 0
+
+    # Two more shuffles are now needed for a draw by repetition, where one would have done before
+    game.replay(shuffle)
+    assert game.get_game_state() == 'UNFINISHED'
+    game.replay(shuffle)
+    assert game.get_game_state() == 'DRAW'
+
+    # A game without the draw rules keeps them off
+    plain = ChessVar.from_snapshot(game.snapshot())
+    assert plain.get_repetition_count() is None
+    assert plain.get_game_state() == 'DRAW'
+
+
+@pytest.mark.parametrize('data', [b'', b'\0' * (SNAPSHOT.size - 1), b'\0' * (SNAPSHOT.size + 1),
+                                  bytearray(SNAPSHOT.size), 'x' * SNAPSHOT.size, None])
+def test_data_that_is_not_a_snapshot_is_rejected(data):
+    """Anything other than bytes of the snapshot's size raises ValueError and leaves the game as it was"""
+
+    game = ChessVar()
+    game.push_turn(('e2', 'e4'))
+    fen = game.to_fen()
+    with pytest.raises(ValueError):
+        game.restore(data)
+    assert game.to_fen() == fen
+    assert game.pop_move() is True
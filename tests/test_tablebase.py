@@ -0,0 +1,240 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for Tablebase: retrograde generation, the index with its left-right mirroring, tables answering
+#               positions with the colors swapped, the compressed block files, and probe.  The KRvK and KvKH tables
+#               (and the KvK table they lead to) are generated once into a temporary directory, and the values probed
+#               for sampled positions are checked against a brute-force search played out on ChessVar itself.
+
+import random
+
+import pytest
+
+from ChessVar import KING, PIECE_SYMBOLS, ChessVar
+from Tablebase import (FILE_SUFFIX, INVALID, EndgameTable, Tablebase, flipped_material_name, material_codes,
+                       material_name, position_index)
+
+# Brute-force searches go this many turns deep, counting both sides' turns
+SEARCH_DEPTH = 4
+
+# Positions sampled from each table for each kind of value
+SAMPLES = 6
+
+
+@pytest.fixture(scope='module')
+def generated(tmp_path_factory):
+    """
+    Generates the KRvK and KvKH tables, and the KvK table they lead to, saving them in a temporary directory.  Returns
+    the Tablebase holding the generated values and the directory
+    """
+
+    directory = str(tmp_path_factory.mktemp('tables'))
+    tablebase = Tablebase(directory)
+    reports = []
+    for material in ('KRvK', 'KvKH'):
+        tablebase.generate(material, reports.append)
+    assert [report['material'] for report in reports] == ['KvK', 'KRvK', 'KvKH']
+    assert all(report['file_bytes'] > 0 for report in reports)
+    return tablebase, directory
+
+
+@pytest.fixture(scope='module')
+def tablebase(generated):
+    """Returns the generated tables, loaded back from their files"""
+
+    return Tablebase(generated[1])
+
+
+def fen_of(placement, white_to_move):
+    """Returns the FEN of a position holding the given (piece code, square index) pairs, with no fairy piece reserves"""
+
+    board = [' '] * 64
+    for code, square in placement:
+        board[square] = PIECE_SYMBOLS[code]
+    rows = []
+    for row in range(7, -1, -1):
+        text = ''.join(board[row * 8:row * 8 + 8])
+        for length in range(8, 0, -1):
+            text = text.replace(' ' * length, str(length))
+        rows.append(text)
+    return '%s %s - 0 0' % ('/'.join(rows), 'w' if white_to_move else 'b')
+
+
+def mirrored_left_right(placement, white_to_move):
+    """Returns the position mirrored from the a file to the h file"""
+
+    return [(code, square ^ 7) for code, square in placement], white_to_move
+
+
+def mirrored_colors(placement, white_to_move):
+    """Returns the position flipped top to bottom with the colors of the pieces and the player to move swapped"""
+
+    return [(code ^ 8, square ^ 56) for code, square in placement], not white_to_move
+
+
+def search(game, depth):
+    """
+    Returns the value of the game's position in the tablebase's terms if it is decided within depth turns: an odd n if
+    the player to move captures the King on their nth turn counting both sides' turns, or an even n if their own King
+    is captured on the nth.  Returns None if neither is forced within depth turns, as in a draw
+    """
+
+    best_win = None
+    longest_loss = 0
+    for turn in game.generate_legal_moves():
+        game.push_turn(turn)
+        if game.get_game_state() != 'UNFINISHED':
+            game.pop_move()
+            return 1
+        value = search(game, depth - 1) if depth > 1 else None
+        game.pop_move()
+
+        if value is None:
+            longest_loss = None
+        elif value % 2 == 0:
+            best_win = value + 1 if best_win is None else min(best_win, value + 1)
+        elif longest_loss is not None:
+            longest_loss = max(longest_loss, value + 1)
+
+    if best_win is not None:
+        return best_win
+    return longest_loss or None
+
+
+def backed_up_value(tablebase, game):
+    """
+    Returns the value of the game's position worked out from the probed values of the positions its turns lead to: the
+    quickest win if any turn wins, the longest loss if every turn loses, and otherwise a draw
+    """
+
+    best_win = None
+    longest_loss = 0
+    for turn in game.generate_legal_moves():
+        game.push_turn(turn)
+        king_captured = game.get_game_state() != 'UNFINISHED'
+        value = None if king_captured else tablebase.probe(game)
+        game.pop_move()
+
+        if king_captured:
+            best_win = 1
+        elif value == 0:
+            longest_loss = None
+        elif value % 2 == 0:
+            best_win = value + 1 if best_win is None else min(best_win, value + 1)
+        elif longest_loss is not None:
+            longest_loss = max(longest_loss, value + 1)
+
+    if best_win is not None:
+        return best_win
+    return longest_loss or 0
+
+
+def test_material_names_and_codes():
+    """Material names put each side's pieces in order, flip between the colors, and give the pieces in table order"""
+
+    assert material_name('hr', '') == 'KRHvK'
+    assert flipped_material_name('KRvKF') == 'KFvKR'
+    assert material_codes('KRvKF') == [KING, 3, KING + 8, 6 + 8]
+    for bad_name in ('KRK', 'RvK', 'KRvKXZ', 'KQRvKB', 'KHRvK'):
+        with pytest.raises(ValueError):
+            material_codes(bad_name)
+
+
+def test_index_mirrors_the_white_king_to_the_left_half():
+    """A position and its left-right mirror share an index, and every index on the left half is distinct"""
+
+    seen = set()
+    for king in range(64):
+        for other in range(64):
+            index = position_index([king, other], True)
+            assert index == position_index([king ^ 7, other ^ 7], True)
+            assert index + 32 * 64 == position_index([king, other], False)
+            if king & 7 < 4:
+                assert index not in seen
+                seen.add(index)
+    assert len(seen) == 32 * 64
+
+
+def test_kings_alone_are_drawn_unless_one_can_be_captured():
+    """In KvK only the player to move with the Kings side by side wins, at once; everything else is drawn"""
+
+    tablebase = Tablebase()
+    table = tablebase.generate('KvK')
+    for white_king in range(64):
+        for black_king in range(64):
+            value = table.get_value(position_index([white_king, black_king], True))
+            if white_king == black_king:
+                assert value == INVALID
+            elif max(abs((white_king >> 3) - (black_king >> 3)), abs((white_king & 7) - (black_king & 7))) == 1:
+                assert value == 1
+            else:
+                assert value == 0
+
+
+def test_files_load_back_with_the_same_values(generated, tablebase):
+    """Tables read from their compressed blocks hold the same value at every index as the tables generated in memory"""
+
+    in_memory = generated[0]
+    assert tablebase.get_materials() == in_memory.get_materials() == ['KRvK', 'KvK', 'KvKH']
+    for material in tablebase.get_materials():
+        loaded_table = tablebase.get_table(material)
+        generated_table = in_memory.get_table(material)
+        assert loaded_table.get_stats() == generated_table.get_stats()
+        assert bytes(loaded_table.get_value(index) for index in range(loaded_table.get_size())) == \
+            bytes(generated_table.get_value(index) for index in range(generated_table.get_size()))
+
+
+def test_files_that_are_not_tables_are_rejected(tmp_path):
+    """A short file or one with the wrong magic raises ValueError"""
+
+    path = tmp_path / ('KvK' + FILE_SUFFIX)
+    for contents in (b'', b'FHTB1', b'x' * 64):
+        path.write_bytes(contents)
+        with pytest.raises(ValueError):
+            EndgameTable.load(str(path))
+
+
+@pytest.mark.parametrize('material, seed', [('KRvK', 0), ('KvKH', 1)])
+def test_probe_matches_a_brute_force_search(tablebase, material, seed):
+    """
+    Sampled positions of each kind (decided within the search depth, decided later, and drawn) get the value the search
+    finds, and so do their left-right mirrors and their color-swapped mirrors, which the table answers by flipping.
+    Every sampled value also agrees with the values of the positions one turn on, including those in the KvK table
+    """
+
+    rng = random.Random(seed)
+    codes = material_codes(material)
+    found = {'short': 0, 'long': 0, 'draw': 0}
+    while min(found.values()) < SAMPLES:
+        squares = rng.sample(range(64), len(codes))
+        placement = list(zip(codes, squares))
+        white_to_move = rng.random() < 0.5
+        value = tablebase.probe(ChessVar.from_fen(fen_of(placement, white_to_move)))
+        kind = 'draw' if value == 0 else 'short' if value <= SEARCH_DEPTH else 'long'
+        if found[kind] >= SAMPLES:
+            continue
+        found[kind] += 1
+
+        for mirror in (None, mirrored_left_right, mirrored_colors):
+            position = (placement, white_to_move) if mirror is None else mirror(placement, white_to_move)
+            game = ChessVar.from_fen(fen_of(*position))
+            assert tablebase.probe(game) == value, (material, fen_of(*position))
+            assert search(game, SEARCH_DEPTH) == (value if kind == 'short' else None), fen_of(*position)
+            assert backed_up_value(tablebase, game) == value, fen_of(*position)
+
+
+def test_probe_declines_positions_outside_the_tables(tablebase):
+    """Positions with too many pieces, no table, a finished game, or a reserve piece that could enter get None"""
+
+    assert tablebase.probe(ChessVar()) is None
+    assert tablebase.probe(ChessVar.from_fen('4k3/8/8/8/8/8/8/Q3K3 w - 0 0')) is None
+    assert tablebase.probe(ChessVar.from_fen('8/8/8/8/8/8/8/R3K3 w - 0 0')) is None
+    assert tablebase.probe(ChessVar.from_fen('R3k3/8/8/8/8/8/8/4K3 w - 0 0')) == 1
+
+    # A reserve piece can enter once its player has lost a power piece, so it matters if they have lost one or still
+    # have one to lose
+    assert tablebase.probe(ChessVar.from_fen('R3k3/8/8/8/8/8/8/4K3 w fh 0 1')) is None
+    assert tablebase.probe(ChessVar.from_fen('R3k3/8/8/8/8/8/8/4K3 w FH 0 0')) is None
+    assert tablebase.probe(ChessVar.from_fen('R3k3/8/8/8/8/8/8/4K3 w fh 0 0')) == 1
+    assert tablebase.probe(ChessVar.from_fen('4k3/7h/8/8/8/8/8/4K3 w F 0 0')) == \
+        tablebase.probe(ChessVar.from_fen('4k3/7h/8/8/8/8/8/4K3 w - 0 0'))
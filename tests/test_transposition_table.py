@@ -0,0 +1,152 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for TranspositionTable and its use by SearchEngine: move codes, the packing of each entry, the
+#               fixed memory budget, the depth-preferred and always-replace entries of a bucket, the statistics, the
+#               conversion of King capture scores, and searches that give the same scores with and without a table.
+
+import pytest
+
+from ChessVar import PERFT_POSITIONS, SQUARE_NAMES, perft_position
+from SearchEngine import KING_CAPTURE_SCORE, SearchEngine, score_from_table, score_to_table
+from TranspositionTable import (BYTES_PER_ENTRY, EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionTable,
+                                decode_move, encode_move)
+
+
+def test_every_turn_round_trips_through_its_move_code():
+    """Each move and fairy piece entry has its own code, which decodes to the same shared tuple"""
+
+    turns = ([(start, end) for start in SQUARE_NAMES for end in SQUARE_NAMES] +
+             [(symbol, location) for symbol in 'FHfh' for location in SQUARE_NAMES])
+    codes = [encode_move(turn) for turn in turns]
+    assert len(set(codes)) == len(turns)
+    assert max(codes) < NO_MOVE
+    for turn, code in zip(turns, codes):
+        assert decode_move(code) == turn
+    assert encode_move(None) == NO_MOVE
+    assert decode_move(NO_MOVE) is None
+
+
+@pytest.mark.parametrize('depth, score, bound, best_move', [
+    (1, 0, EXACT, ('e2', 'e4')),
+    (12, -KING_CAPTURE_SCORE, UPPER_BOUND, None),
+    (255, KING_CAPTURE_SCORE, LOWER_BOUND, ('h', 'a8')),
+    (3, -1, EXACT, ('h8', 'a1')),
+])
+def test_stored_entry_is_probed_back(depth, score, bound, best_move):
+    """An entry comes back with the depth, score, bound and best move it was stored with"""
+
+    table = TranspositionTable(1)
+    key = 0x123456789ABCDEF0
+    table.store(key, depth, score, bound, best_move)
+    assert table.probe(key) == (depth, score, bound, best_move)
+
+
+def test_depth_is_capped_at_255():
+    """A depth too large for its eight bits is stored as 255"""
+
+    table = TranspositionTable(1)
+    table.store(99, 300, 5, EXACT, None)
+    assert table.probe(99)[0] == 255
+
+
+def test_empty_table_has_no_entries():
+    """Probing an empty table finds nothing, even for a hash of zero, which matches the empty keys"""
+
+    table = TranspositionTable(1)
+    assert table.probe(0) is None
+    assert table.probe(12345) is None
+
+
+def test_capacity_fits_the_budget():
+    """The table holds a power of two buckets that fit in the memory it was given, and no more"""
+
+    for size_mb in (1, 2, 3, 16):
+        table = TranspositionTable(size_mb)
+        assert table.get_size_bytes() == table.get_capacity() * BYTES_PER_ENTRY
+        assert table.get_size_bytes() <= size_mb * 1024 * 1024
+        assert table.get_size_bytes() * 2 > size_mb * 1024 * 1024
+        buckets = table.get_capacity() // 2
+        assert buckets & (buckets - 1) == 0
+
+
+def test_bucket_keeps_the_deepest_search():
+    """A shallower result for another position in the same bucket goes in the always-replace entry"""
+
+    table = TranspositionTable(1)
+    buckets = table.get_capacity() // 2
+    deep, shallow, newer = 5, 5 + buckets, 5 + 2 * buckets
+    table.store(deep, 8, 10, EXACT, ('e2', 'e4'))
+    table.store(shallow, 2, 20, EXACT, ('d2', 'd4'))
+    assert table.probe(deep) == (8, 10, EXACT, ('e2', 'e4'))
+    assert table.probe(shallow) == (2, 20, EXACT, ('d2', 'd4'))
+
+    # The always-replace entry takes the newest shallow result, and the deep one stays
+    table.store(newer, 1, 30, LOWER_BOUND, None)
+    assert table.probe(shallow) is None
+    assert table.probe(newer) == (1, 30, LOWER_BOUND, None)
+    assert table.probe(deep) == (8, 10, EXACT, ('e2', 'e4'))
+
+    # A deeper result replaces the depth-preferred entry, and a position's own entry is updated in place
+    table.store(shallow, 9, 40, UPPER_BOUND, None)
+    assert table.probe(shallow) == (9, 40, UPPER_BOUND, None)
+    assert table.probe(deep) is None
+    table.store(shallow, 3, 50, EXACT, None)
+    assert table.probe(shallow) == (3, 50, EXACT, None)
+
+
+def test_statistics_and_clear():
+    """Probes, hits, stores and overwrites are counted, and clear empties the table and the counts"""
+
+    table = TranspositionTable(1)
+    buckets = table.get_capacity() // 2
+    table.store(7, 5, 0, EXACT, None)
+    table.store(7 + buckets, 4, 0, EXACT, None)
+    table.store(7 + 2 * buckets, 3, 0, EXACT, None)
+    table.probe(7)
+    table.probe(8)
+    stats = table.get_stats()
+    assert (stats['stores'], stats['overwrites'], stats['probes'], stats['hits']) == (3, 1, 2, 1)
+    assert stats['hit_rate'] == 0.5
+
+    table.clear()
+    assert table.probe(7) is None
+    assert table.get_stats()['stores'] == 0
+    assert table.get_stats()['probes'] == 1
+
+
+@pytest.mark.parametrize('score', [0, 250, -250, KING_CAPTURE_SCORE - 3, -(KING_CAPTURE_SCORE - 7)])
+def test_king_capture_scores_are_stored_relative_to_the_position(score):
+    """King capture scores are shifted by the ply on the way in and back on the way out; other scores are not"""
+
+    stored = score_to_table(score, 5)
+    assert score_from_table(stored, 5) == score
+    if abs(score) < 1000:
+        assert stored == score
+    else:
+        assert abs(stored) == abs(score) + 5
+        assert score_from_table(stored, 2) == score + (3 if score > 0 else -3)
+
+
+@pytest.mark.parametrize('name', sorted(PERFT_POSITIONS))
+def test_search_scores_are_the_same_with_a_table(name):
+    """The table saves work without changing the score found at any depth"""
+
+    scores = []
+    for table_size_mb in (0, 1):
+        engine = SearchEngine(max_depth=3, table_size_mb=table_size_mb, quiescence=False)
+        engine.search(perft_position(name))
+        scores.append([iteration['score'] for iteration in engine.get_iterations()])
+    assert scores[0] == scores[1]
+
+
+def test_table_is_used_and_kept_across_searches():
+    """A second search of the same position finds its results in the table"""
+
+    engine = SearchEngine(max_depth=3, table_size_mb=1, quiescence=False)
+    engine.search(perft_position('start'))
+    first_nodes = engine.get_nodes()
+    engine.search(perft_position('start'))
+    assert engine.get_transposition_table().get_stats()['hits'] > 0
+    assert engine.get_nodes() < first_nodes
+    assert SearchEngine(table_size_mb=0).get_transposition_table() is None
@@ -0,0 +1,106 @@
+# Author:  Arthur Snyder
+# GitHub username:  arthur-snyder-iv
+# Date:  October 17, 2026
+# Description:  Tests for the ChessVar undo stack.  Random sequences of turns are made with push_move and
+#               push_fairy_piece and then taken back with pop_move; after each pop the game must be in exactly the
+#               state it was in before the matching push: the board, the turn, the fairy piece reserves, the power
+#               pieces taken counts, the game state, the position hash, the incremental score and, with the optional
+#               draw rules on, the repetition count.
+
+import random
+
+import pytest
+
+from ChessVar import SQUARE_NAMES, ChessVar
+
+
+def game_state_record(game):
+    """Returns a tuple of everything about the game's position that a push followed by a pop must leave unchanged"""
+
+    return (tuple(game.get_square_symbol(location) for location in SQUARE_NAMES),
+            game.get_turn(),
+            tuple(game.is_fairy_piece_available(symbol) for symbol in 'FHfh'),
+            game.get_power_pieces_taken('WHITE'),
+            game.get_power_pieces_taken('BLACK'),
+            game.get_game_state(),
+            game.position_hash(),
+            game.evaluate(),
+            game.get_plies_since_capture(),
+            game.get_repetition_count(),
+            game.to_codes())
+
+
+def push_random_turn(game, rng):
+    """Pushes a random legal turn with push_move or push_fairy_piece and returns it, or returns None if there is none"""
+
+    legal_moves = game.generate_legal_moves()
+    if not legal_moves:
+        return None
+    turn = rng.choice(legal_moves)
+    if len(turn[0]) == 1:
+        assert game.push_fairy_piece(*turn) is True
+    else:
+        assert game.push_move(*turn) is True
+    return turn
+
+
+@pytest.mark.parametrize('draw_rules', [False, True])
+@pytest.mark.parametrize('seed', range(20))
+def test_pop_restores_every_earlier_state(seed, draw_rules):
+    """Each pop_move brings back the state from before the matching push, all the way to the starting position"""
+
+    rng = random.Random(seed)
+    game = ChessVar(draw_rules)
+    records = []
+    for _ in range(rng.randrange(20, 200)):
+        record = game_state_record(game)
+        if push_random_turn(game, rng) is None:
+            break
+        records.append(record)
+
+    while records:
+        assert game.pop_move() is True
+        assert game_state_record(game) == records.pop()
+    assert game.pop_move() is False
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_interleaved_pushes_and_pops(seed):
+    """Pops in the middle of a game, followed by more pushes, still restore the states they should"""
+
+    rng = random.Random(1000 + seed)
+    game = ChessVar()
+    records = []
+    for _ in range(400):
+        if records and rng.random() < 0.4:
+            assert game.pop_move() is True
+            assert game_state_record(game) == records.pop()
+            continue
+        record = game_state_record(game)
+        if push_random_turn(game, rng) is not None:
+            records.append(record)
+
+
+def test_pop_restores_a_finished_game():
+    """Taking back the capture of a King makes the game unfinished again, with the King back on its square"""
+
+    game = ChessVar.from_fen('4k3/8/8/8/8/8/8/4K2R w FHfh 0 0')
+    assert game.push_move('h1', 'h8') is True
+    assert game.push_move('e8', 'f8') is True
+    before = game_state_record(game)
+    assert game.push_move('h8', 'f8') is True
+    assert game.get_game_state() == 'WHITE_WON'
+    assert game.pop_move() is True
+    assert game_state_record(game) == before
+    assert game.get_game_state() == 'UNFINISHED'
+
+
+def test_rejected_push_leaves_nothing_to_pop():
+    """A turn push_move or push_fairy_piece rejects is not recorded, so there is nothing to take back"""
+
+    game = ChessVar()
+    before = game_state_record(game)
+    assert game.push_move('e2', 'e5') is False
+    assert game.push_fairy_piece('F', 'c3') is False
+    assert game.pop_move() is False
+    assert game_state_record(game) == before